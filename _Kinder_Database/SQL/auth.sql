@@ -56,3 +56,37 @@ CREATE TABLE auth.usr_group (
     created_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
     PRIMARY KEY (usr_id, group_id)
 );
+
+-- ------------------------------------------------------------
+-- auth.permission_version
+-- Single-row counter bumped by a statement trigger on auth.groups,
+-- auth.usr_group, transient.default_permissions and
+-- transient.object_source_permissions; invalidates the per-worker
+-- source-permission cache.
+-- ------------------------------------------------------------
+CREATE TABLE auth.permission_version (
+    id          SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version     BIGINT NOT NULL DEFAULT 0,
+    changed_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+INSERT INTO auth.permission_version (id) VALUES (1);
+
+CREATE OR REPLACE FUNCTION auth.bump_permission_version_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE auth.permission_version
+       SET version = version + 1, changed_at = now()
+     WHERE id = 1;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER groups_permission_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON auth.groups
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
+CREATE TRIGGER usr_group_permission_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON auth.usr_group
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
+-- transient.default_permissions carries the same trigger (transient.sql),
+-- as does transient.object_source_permissions (migration 0017).
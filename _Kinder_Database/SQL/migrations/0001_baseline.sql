@@ -0,0 +1,129 @@
+-- ============================================================
+-- 0001 — tables, columns and indexes the app relies on beyond the
+-- original Kinder DDL (formerly created at startup or per request).
+-- Idempotent, so databases that predate the migration runner adopt it.
+-- ============================================================
+
+-- auth.invitations — invitation tokens for new user sign-up
+CREATE TABLE IF NOT EXISTS auth.invitations (
+    token       TEXT PRIMARY KEY,
+    email       TEXT,
+    is_admin    BOOLEAN NOT NULL DEFAULT FALSE,
+    role        TEXT    NOT NULL DEFAULT 'user',
+    invited_by  INT     REFERENCES auth.users(usr_id) ON DELETE SET NULL,
+    invited_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+    status      TEXT    NOT NULL DEFAULT 'pending',
+    accepted_at TIMESTAMPTZ
+);
+
+-- auth.system_settings — generic key/value store
+CREATE TABLE IF NOT EXISTS auth.system_settings (
+    key        TEXT PRIMARY KEY,
+    value      TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE auth.users
+    ADD COLUMN IF NOT EXISTS api_key_requested_at TIMESTAMPTZ;
+
+-- transient.object_source_permissions — per-object per-source visibility
+CREATE TABLE IF NOT EXISTS transient.object_source_permissions (
+    id             SERIAL PRIMARY KEY,
+    object_name    TEXT NOT NULL,
+    data_type      TEXT NOT NULL CHECK (data_type IN ('phot', 'spec')),
+    source_name    TEXT NOT NULL,
+    allowed_groups INT[]    DEFAULT NULL,
+    is_public      BOOLEAN  NOT NULL DEFAULT FALSE,
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+    UNIQUE (object_name, data_type, source_name)
+);
+
+-- Unique constraint needed for ON CONFLICT in photometry inserts
+DO $$ BEGIN
+    BEGIN
+        ALTER TABLE transient.photometry
+            ADD CONSTRAINT phot_uniq UNIQUE (obj_id, "MJD", filter, source);
+    EXCEPTION WHEN duplicate_table THEN NULL;
+    END;
+END $$;
+
+-- Unique constraint for obs.logs upsert
+DO $$ BEGIN
+    BEGIN
+        ALTER TABLE obs.logs
+            ADD CONSTRAINT obs_logs_target_date_uniq UNIQUE (target_id, date);
+    EXCEPTION WHEN duplicate_table THEN NULL;
+    END;
+END $$;
+
+-- kinder_id — internal sequential ID: year*1_000_000 + letter_rank
+ALTER TABLE transient.objects
+    ADD COLUMN IF NOT EXISTS kinder_id BIGINT;
+CREATE UNIQUE INDEX IF NOT EXISTS objects_kinder_id_idx
+    ON transient.objects(kinder_id)
+    WHERE kinder_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS objects_discovery_date_idx
+    ON transient.objects(discovery_date DESC);
+CREATE INDEX IF NOT EXISTS objects_name_prefix_idx
+    ON transient.objects(name_prefix);
+CREATE INDEX IF NOT EXISTS objects_type_idx
+    ON transient.objects(type)
+    WHERE type IS NOT NULL AND type != '';
+CREATE INDEX IF NOT EXISTS objects_last_phot_date_idx
+    ON transient.objects(last_phot_date DESC);
+
+-- transient.objects — name lookup used by the name resolver
+CREATE UNIQUE INDEX IF NOT EXISTS objects_name_idx
+    ON transient.objects(name);
+
+-- Ensure tag always has a safe default even if an INSERT omits it.
+ALTER TABLE transient.objects
+    ALTER COLUMN tag SET DEFAULT '{}'::text[];
+UPDATE transient.objects
+   SET tag = '{}'::text[]
+ WHERE tag IS NULL;
+
+-- transient.cross_matches — DETECT columns added after the original DDL
+ALTER TABLE transient.cross_matches
+    ADD COLUMN IF NOT EXISTS flag       BOOLEAN DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS match_data JSONB,
+    ADD COLUMN IF NOT EXISTS match_ra   DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS match_dec  DOUBLE PRECISION;
+
+-- transient.tns_update_audit — which fields each TNS sync changed
+CREATE TABLE IF NOT EXISTS transient.tns_update_audit (
+    audit_id       BIGSERIAL PRIMARY KEY,
+    obj_id         BIGINT NOT NULL,
+    name           TEXT NOT NULL,
+    changed_fields TEXT[] NOT NULL DEFAULT '{}',
+    source         TEXT NOT NULL DEFAULT 'tns_sync',
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_tns_update_audit_updated_at
+    ON transient.tns_update_audit(updated_at DESC);
+
+-- obs.logs indexes — date index enables the sargable date-range filter
+CREATE INDEX IF NOT EXISTS obs_logs_date_idx
+    ON obs.logs(date);
+CREATE INDEX IF NOT EXISTS obs_logs_name_idx
+    ON obs.logs(name);
+
+-- obs.targets — auto exposure flag and active-only filtering index
+ALTER TABLE obs.targets
+    ADD COLUMN IF NOT EXISTS auto_exposure BOOLEAN NOT NULL DEFAULT FALSE;
+CREATE INDEX IF NOT EXISTS obs_targets_active_idx
+    ON obs.targets(active, name);
+
+-- cat.ned — NED cone-search result cache
+CREATE TABLE IF NOT EXISTS cat.ned (
+    ned_id        SERIAL PRIMARY KEY,
+    object_name   TEXT NOT NULL,
+    ra_center     DOUBLE PRECISION NOT NULL,
+    dec_center    DOUBLE PRECISION NOT NULL,
+    radius_arcsec DOUBLE PRECISION NOT NULL DEFAULT 60,
+    searched_at   TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    result_count  INT NOT NULL DEFAULT 0,
+    results       JSONB NOT NULL DEFAULT '[]'::jsonb
+);
+CREATE UNIQUE INDEX IF NOT EXISTS cat_ned_object_radius_idx
+    ON cat.ned (object_name, radius_arcsec);
@@ -0,0 +1,27 @@
+-- ============================================================
+-- 0002 — transient.spectra: one row per spectrum, samples packed as
+-- little-endian float64 (sorted by wavelength at write time).
+-- Supersedes the one-row-per-sample transient.spectroscopy layout;
+-- see modules/spectra_migration.py for moving legacy rows across.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS transient.spectra (
+    spectra_id     BIGSERIAL PRIMARY KEY,
+    obj_id         BIGINT NOT NULL
+                       REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    name           TEXT,
+    source         TEXT NOT NULL,
+    "MJD"          DOUBLE PRECISION NOT NULL,
+    n_points       INT  NOT NULL,
+    min_wavelength DOUBLE PRECISION,
+    max_wavelength DOUBLE PRECISION,
+    wavelength     BYTEA NOT NULL,
+    intensity      BYTEA NOT NULL,
+    permission     TEXT NOT NULL DEFAULT 'default'
+                       CHECK (permission IN ('default', 'public', 'login', 'groups')),
+    groups         INT[] NOT NULL DEFAULT '{}',
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+    UNIQUE (obj_id, source, "MJD")
+);
+CREATE INDEX IF NOT EXISTS spectra_source_mjd_idx
+    ON transient.spectra (source, "MJD");
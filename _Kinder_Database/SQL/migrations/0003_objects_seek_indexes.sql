@@ -0,0 +1,25 @@
+-- ============================================================
+-- 0003 — transient.objects seek indexes: one (sort key, obj_id) btree
+-- per marshal sort column, so keyset pagination in
+-- search_tns_objects_after() is a range scan at any depth.
+-- Must mirror transient._SORT_MAP.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS objects_discovery_date_seek_idx
+    ON transient.objects (discovery_date, obj_id);
+CREATE INDEX IF NOT EXISTS objects_last_modified_seek_idx
+    ON transient.objects (last_modified_date, obj_id);
+CREATE INDEX IF NOT EXISTS objects_discovery_mag_seek_idx
+    ON transient.objects (discovery_mag, obj_id);
+CREATE INDEX IF NOT EXISTS objects_name_seek_idx
+    ON transient.objects (name, obj_id);
+CREATE INDEX IF NOT EXISTS objects_received_date_seek_idx
+    ON transient.objects (received_date, obj_id);
+CREATE INDEX IF NOT EXISTS objects_last_phot_seek_idx
+    ON transient.objects ((COALESCE(last_phot_date, last_modified_date)), obj_id);
+CREATE INDEX IF NOT EXISTS objects_brightest_mag_seek_idx
+    ON transient.objects (brightest_mag, obj_id);
+CREATE INDEX IF NOT EXISTS objects_brightest_abs_mag_seek_idx
+    ON transient.objects (brightest_abs_mag, obj_id);
+CREATE INDEX IF NOT EXISTS objects_redshift_seek_idx
+    ON transient.objects (redshift, obj_id);
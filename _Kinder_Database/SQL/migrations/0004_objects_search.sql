@@ -0,0 +1,50 @@
+-- ============================================================
+-- 0004 — transient.objects search columns: normalised, '|'-delimited
+-- name and discoverer text maintained by PostgreSQL, matched by the
+-- marshal free-text search (see transient._search_clause).
+-- array_to_string is only STABLE, so the reporters join goes through an
+-- IMMUTABLE wrapper to be usable in a generated column.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION transient.search_norm(t TEXT)
+RETURNS TEXT LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT regexp_replace(
+               regexp_replace(lower(COALESCE(t, '')), '\s+', '', 'g'),
+               '[,;|]+', '|', 'g')
+$$;
+
+CREATE OR REPLACE FUNCTION transient.search_join(a TEXT[])
+RETURNS TEXT LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT lower(array_to_string(a, '|'))
+$$;
+
+ALTER TABLE transient.objects
+    ADD COLUMN IF NOT EXISTS search_text TEXT GENERATED ALWAYS AS (
+        '|' || transient.search_norm(COALESCE(name_prefix, '') || name)
+     || '|' || transient.search_norm(name)
+     || '|' || transient.search_norm(internal_name)
+     || '|' || transient.search_norm(other_name) || '|'
+    ) STORED;
+
+ALTER TABLE transient.objects
+    ADD COLUMN IF NOT EXISTS discoverer_text TEXT GENERATED ALWAYS AS (
+        '|' || lower(COALESCE(source_group, ''))
+     || '|' || lower(COALESCE(report_group, ''))
+     || '|' || transient.search_join(reporters) || '|'
+    ) STORED;
+
+-- TNS-designation prefix fast path: lower(name) LIKE '2026ab%'
+CREATE INDEX IF NOT EXISTS objects_name_lower_pattern_idx
+    ON transient.objects (lower(name) text_pattern_ops);
+
+-- Trigram GIN indexes need pg_trgm; without it the predicates still work,
+-- just as sequential scans, so a missing extension only raises a warning.
+DO $$ BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS objects_search_text_trgm_idx
+        ON transient.objects USING GIN (search_text gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS objects_discoverer_text_trgm_idx
+        ON transient.objects USING GIN (discoverer_text gin_trgm_ops);
+EXCEPTION WHEN OTHERS THEN
+    RAISE WARNING 'pg_trgm indexes skipped: %', SQLERRM;
+END $$;
@@ -0,0 +1,148 @@
+-- ============================================================
+-- 0005 — transient.stats_counters: marshal overview counts, kept
+-- current by statement-level triggers on objects/photometry so
+-- dashboards read a handful of rows instead of scanning both tables.
+-- transient.rebuild_stats_counters() recomputes them from scratch.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS transient.stats_counters (
+    name       TEXT PRIMARY KEY,
+    value      BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION transient.object_counter_keys(
+    status TEXT, name_prefix TEXT, type TEXT,
+    redshift DOUBLE PRECISION, tag TEXT[])
+RETURNS TEXT[] LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT array_remove(ARRAY[
+        'total',
+        'status:' || status,
+        CASE WHEN name_prefix = 'AT' THEN 'at' END,
+        CASE WHEN type IS NOT NULL AND type <> '' THEN 'typed' END,
+        CASE WHEN redshift IS NOT NULL THEN 'with_redshift' END,
+        CASE WHEN tag @> ARRAY['flag'] THEN 'flag' END
+    ], NULL)
+$$;
+
+-- Recompute from scratch in the caller's transaction.  The EXCLUSIVE lock
+-- makes concurrent trigger deltas wait, so they land on top of the fresh
+-- totals instead of being lost.
+CREATE OR REPLACE FUNCTION transient.rebuild_stats_counters()
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    LOCK TABLE transient.stats_counters IN EXCLUSIVE MODE;
+    DELETE FROM transient.stats_counters;
+    INSERT INTO transient.stats_counters (name, value)
+    SELECT k, COUNT(*)
+      FROM transient.objects o,
+           unnest(transient.object_counter_keys(
+               o.status, o.name_prefix, o.type, o.redshift, o.tag)) k
+     GROUP BY k;
+    INSERT INTO transient.stats_counters (name, value)
+    SELECT 'with_photometry', COUNT(DISTINCT obj_id) FROM transient.photometry;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.objects_counters_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    -- Counter rows are touched in key order so concurrent
+    -- writers cannot deadlock on them.
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT k, COUNT(*)
+          FROM new_rows n,
+               unnest(transient.object_counter_keys(
+                   n.status, n.name_prefix, n.type, n.redshift, n.tag)) k
+         GROUP BY k ORDER BY k
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT k, -COUNT(*)
+          FROM old_rows o,
+               unnest(transient.object_counter_keys(
+                   o.status, o.name_prefix, o.type, o.redshift, o.tag)) k
+         GROUP BY k ORDER BY k
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    ELSE
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT k, SUM(d)
+          FROM (
+              SELECT k, 1 AS d
+                FROM new_rows n,
+                     unnest(transient.object_counter_keys(
+                         n.status, n.name_prefix, n.type, n.redshift, n.tag)) k
+              UNION ALL
+              SELECT k, -1
+                FROM old_rows o,
+                     unnest(transient.object_counter_keys(
+                         o.status, o.name_prefix, o.type, o.redshift, o.tag)) k
+          ) delta
+         GROUP BY k HAVING SUM(d) <> 0 ORDER BY k
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.photometry_counters_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        -- Objects whose every photometry row arrived in this
+        -- statement just got their first point.
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT 'with_photometry', COUNT(*)
+          FROM (SELECT obj_id, COUNT(*) AS cnt
+                  FROM new_rows GROUP BY obj_id) n
+         WHERE (SELECT COUNT(*) FROM (
+                    SELECT 1 FROM transient.photometry p
+                     WHERE p.obj_id = n.obj_id LIMIT n.cnt + 1) q) = n.cnt
+        HAVING COUNT(*) > 0
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    ELSE
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT 'with_photometry', -COUNT(*)
+          FROM (SELECT DISTINCT obj_id FROM old_rows) o
+         WHERE NOT EXISTS (SELECT 1 FROM transient.photometry p
+                            WHERE p.obj_id = o.obj_id)
+        HAVING COUNT(*) > 0
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+-- Transition tables allow one event per trigger, hence the split.
+DROP TRIGGER IF EXISTS objects_counters_ins ON transient.objects;
+CREATE TRIGGER objects_counters_ins AFTER INSERT ON transient.objects
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_counters_trg();
+DROP TRIGGER IF EXISTS objects_counters_upd ON transient.objects;
+CREATE TRIGGER objects_counters_upd AFTER UPDATE ON transient.objects
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_counters_trg();
+DROP TRIGGER IF EXISTS objects_counters_del ON transient.objects;
+CREATE TRIGGER objects_counters_del AFTER DELETE ON transient.objects
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_counters_trg();
+DROP TRIGGER IF EXISTS photometry_counters_ins ON transient.photometry;
+CREATE TRIGGER photometry_counters_ins AFTER INSERT ON transient.photometry
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_counters_trg();
+DROP TRIGGER IF EXISTS photometry_counters_del ON transient.photometry;
+CREATE TRIGGER photometry_counters_del AFTER DELETE ON transient.photometry
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_counters_trg();
+
+DO $$ BEGIN
+    IF NOT EXISTS (SELECT 1 FROM transient.stats_counters) THEN
+        PERFORM transient.rebuild_stats_counters();
+    END IF;
+END $$;
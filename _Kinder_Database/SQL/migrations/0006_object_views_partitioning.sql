@@ -0,0 +1,108 @@
+-- ============================================================
+-- 0006 — transient.object_views_detail range-partitioned by UTC month
+-- on view_time, so retention is a partition drop (see
+-- transient.maintain_object_view_partitions), plus the per-day
+-- transient.object_views_daily rollup that outlives the partitions.
+-- A plain detail table from the original DDL is converted once, keeping
+-- view_id values and the sequence.  The DEFAULT partition only catches
+-- rows when the scheduled job has not created a month ahead of time.
+-- ============================================================
+
+-- Create the monthly partitions from the month containing `since`
+-- (default: this month) through months_ahead months from now.
+CREATE OR REPLACE FUNCTION transient.ensure_view_partitions(
+    since DATE DEFAULT NULL, months_ahead INT DEFAULT 2)
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    today DATE := (now() AT TIME ZONE 'UTC')::date;
+    m     DATE := date_trunc('month', COALESCE(since, today)::timestamp)::date;
+    stop  DATE := (date_trunc('month', today::timestamp)
+                   + make_interval(months => months_ahead))::date;
+    nxt   DATE;
+BEGIN
+    WHILE m <= stop LOOP
+        nxt := (m + interval '1 month')::date;
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS transient.%I '
+            'PARTITION OF transient.object_views_detail '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'object_views_detail_p' || to_char(m, 'YYYYMM'),
+            to_char(m, 'YYYY-MM-DD') || ' 00:00+00',
+            to_char(nxt, 'YYYY-MM-DD') || ' 00:00+00');
+        m := nxt;
+    END LOOP;
+END
+$$;
+
+DO $$
+DECLARE
+    kind  "char";
+    since DATE;
+BEGIN
+    SELECT c.relkind INTO kind FROM pg_class c
+     WHERE c.oid = to_regclass('transient.object_views_detail');
+    IF kind = 'p' THEN
+        PERFORM transient.ensure_view_partitions();
+        RETURN;
+    END IF;
+
+    CREATE SEQUENCE IF NOT EXISTS transient.object_views_detail_view_id_seq;
+    IF kind IS NOT NULL THEN
+        ALTER SEQUENCE transient.object_views_detail_view_id_seq OWNED BY NONE;
+        ALTER TABLE transient.object_views_detail RENAME TO object_views_detail_legacy;
+        ALTER TABLE transient.object_views_detail_legacy
+            RENAME CONSTRAINT object_views_detail_pkey TO object_views_detail_legacy_pkey;
+        DROP INDEX IF EXISTS transient.object_views_detail_view_time_idx;
+        DROP INDEX IF EXISTS transient.object_views_detail_obj_usr_idx;
+        SELECT (MIN(view_time) AT TIME ZONE 'UTC')::date INTO since
+          FROM transient.object_views_detail_legacy;
+    END IF;
+
+    CREATE TABLE transient.object_views_detail (
+        view_id     BIGINT NOT NULL
+                        DEFAULT nextval('transient.object_views_detail_view_id_seq'),
+        obj_id      BIGINT NOT NULL
+                        REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+        name        TEXT,
+        usr_id      INT
+                        REFERENCES auth.users(usr_id) ON DELETE SET NULL,
+        view_time   TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (view_id, view_time)
+    ) PARTITION BY RANGE (view_time);
+    ALTER SEQUENCE transient.object_views_detail_view_id_seq
+        OWNED BY transient.object_views_detail.view_id;
+    CREATE TABLE transient.object_views_detail_default
+        PARTITION OF transient.object_views_detail DEFAULT;
+    PERFORM transient.ensure_view_partitions(since);
+
+    IF kind IS NOT NULL THEN
+        INSERT INTO transient.object_views_detail (view_id, obj_id, name, usr_id, view_time)
+        SELECT view_id, obj_id, name, usr_id, view_time
+          FROM transient.object_views_detail_legacy;
+        DROP TABLE transient.object_views_detail_legacy;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS object_views_detail_view_time_idx
+    ON transient.object_views_detail (view_time);
+CREATE INDEX IF NOT EXISTS object_views_detail_obj_usr_idx
+    ON transient.object_views_detail (obj_id, usr_id);
+
+-- Views per object per UTC day, refreshed by transient.rollup_object_views().
+DO $$ BEGIN
+    IF to_regclass('transient.object_views_daily') IS NULL THEN
+        CREATE TABLE transient.object_views_daily (
+            day          DATE   NOT NULL,
+            obj_id       BIGINT NOT NULL
+                             REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+            views        INT    NOT NULL,
+            unique_users INT    NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, obj_id)
+        );
+        INSERT INTO transient.object_views_daily (day, obj_id, views, unique_users)
+        SELECT (view_time AT TIME ZONE 'UTC')::date, obj_id,
+               COUNT(*), COUNT(DISTINCT usr_id)
+          FROM transient.object_views_detail
+         GROUP BY 1, 2;
+    END IF;
+END $$;
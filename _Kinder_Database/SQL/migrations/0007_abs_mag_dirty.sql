@@ -0,0 +1,62 @@
+-- ============================================================
+-- 0007 — transient.abs_mag_dirty: objects whose brightest_mag /
+-- brightest_abs_mag need recomputing.  Filled by triggers on photometry
+-- writes and on redshift/coordinate changes (which covers ingest, manual
+-- redshift edits and the host-redshift sync); drained by
+-- transient.recompute_dirty_abs_mags().  marked_at lets the job delete
+-- only marks it has actually processed.
+-- ============================================================
+
+DO $$ BEGIN
+    IF to_regclass('transient.abs_mag_dirty') IS NULL THEN
+        CREATE TABLE transient.abs_mag_dirty (
+            obj_id     BIGINT PRIMARY KEY
+                           REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+            marked_at  TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+        );
+        -- Values used to be computed lazily on page views; queue every
+        -- object with photometry once so unviewed ones get filled in.
+        INSERT INTO transient.abs_mag_dirty (obj_id)
+        SELECT DISTINCT obj_id FROM transient.photometry;
+    END IF;
+END $$;
+
+CREATE OR REPLACE FUNCTION transient.photometry_abs_mag_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.abs_mag_dirty (obj_id)
+    SELECT DISTINCT obj_id FROM changed_rows ORDER BY obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.objects_abs_mag_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.abs_mag_dirty (obj_id) VALUES (NEW.obj_id)
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS photometry_abs_mag_dirty_ins ON transient.photometry;
+CREATE TRIGGER photometry_abs_mag_dirty_ins AFTER INSERT ON transient.photometry
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_abs_mag_dirty_trg();
+DROP TRIGGER IF EXISTS photometry_abs_mag_dirty_upd ON transient.photometry;
+CREATE TRIGGER photometry_abs_mag_dirty_upd AFTER UPDATE ON transient.photometry
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_abs_mag_dirty_trg();
+DROP TRIGGER IF EXISTS photometry_abs_mag_dirty_del ON transient.photometry;
+CREATE TRIGGER photometry_abs_mag_dirty_del AFTER DELETE ON transient.photometry
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_abs_mag_dirty_trg();
+DROP TRIGGER IF EXISTS objects_abs_mag_dirty ON transient.objects;
+CREATE TRIGGER objects_abs_mag_dirty
+    AFTER UPDATE OF redshift, ra, dec ON transient.objects
+    FOR EACH ROW
+    WHEN (OLD.redshift IS DISTINCT FROM NEW.redshift
+          OR OLD.ra IS DISTINCT FROM NEW.ra
+          OR OLD.dec IS DISTINCT FROM NEW.dec)
+    EXECUTE FUNCTION transient.objects_abs_mag_dirty_trg();
@@ -0,0 +1,49 @@
+-- ============================================================
+-- 0008 — transient.cross_matches.match_date and the
+-- transient.detect_daily_counts DETECT calendar summary.
+-- match_date is updated_date::date in the session time zone, exactly
+-- what the DETECT pages used to compute per row.  It is not a generated
+-- column because timestamptz::date is not IMMUTABLE; a trigger keeps it
+-- in step with updated_date so day lookups are plain index scans.
+-- ============================================================
+
+ALTER TABLE transient.cross_matches
+    ADD COLUMN IF NOT EXISTS match_date DATE;
+
+CREATE OR REPLACE FUNCTION transient.cross_matches_match_date_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.match_date := NEW.updated_date::date;
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS cross_matches_match_date ON transient.cross_matches;
+CREATE TRIGGER cross_matches_match_date
+    BEFORE INSERT OR UPDATE OF updated_date ON transient.cross_matches
+    FOR EACH ROW EXECUTE FUNCTION transient.cross_matches_match_date_trg();
+
+UPDATE transient.cross_matches SET match_date = updated_date::date
+ WHERE updated_date IS NOT NULL AND match_date IS NULL;
+
+CREATE INDEX IF NOT EXISTS cross_matches_match_date_idx
+    ON transient.cross_matches (match_date);
+
+-- One row per match_date that has matches.  Refreshed per touched day by
+-- transient.refresh_detect_daily_counts() from the cross-match writers.
+DO $$ BEGIN
+    IF to_regclass('transient.detect_daily_counts') IS NULL THEN
+        CREATE TABLE transient.detect_daily_counts (
+            match_date      DATE PRIMARY KEY,
+            unique_targets  INT  NOT NULL,
+            has_lens        BOOL NOT NULL DEFAULT FALSE,
+            updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+        INSERT INTO transient.detect_daily_counts (match_date, unique_targets, has_lens)
+        SELECT match_date, COUNT(DISTINCT obj_id),
+               COALESCE(BOOL_OR(catalog LIKE 'Lens_%'), FALSE)
+          FROM transient.cross_matches
+         WHERE match_date IS NOT NULL
+         GROUP BY match_date;
+    END IF;
+END $$;
@@ -0,0 +1,36 @@
+-- ============================================================
+-- 0009 — transient.status_rules: configurable status transitions.
+-- Each enabled rule is applied by apply_status_rules() as a single
+-- UPDATE ... RETURNING over transient.objects.  Rules of one rule_set
+-- run in priority order inside one transaction.
+-- Seeds reproduce the former auto_snoozed() / retire_stale_followups()
+-- loops; existing rows are left alone so tuned values survive.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS transient.status_rules (
+    rule_name   TEXT PRIMARY KEY,
+    rule_set    TEXT NOT NULL,                  -- auto_snooze, retire_followups
+    from_status TEXT[] NOT NULL,
+    to_status   TEXT NOT NULL
+                    CHECK (to_status IN ('Inbox', 'Snoozed', 'Follow-up', 'Finish')),
+    idle_days   DOUBLE PRECISION,               -- NULL: no age condition
+    idle_basis  TEXT NOT NULL DEFAULT 'last_activity'
+                    CHECK (idle_basis IN ('last_activity', 'last_phot')),
+    priority    INT  NOT NULL DEFAULT 100,
+    enabled     BOOLEAN NOT NULL DEFAULT TRUE,
+    description TEXT
+);
+
+CREATE INDEX IF NOT EXISTS status_rules_set_idx
+    ON transient.status_rules (rule_set, priority);
+
+INSERT INTO transient.status_rules
+    (rule_name, rule_set, from_status, to_status, idle_days, idle_basis, priority, description)
+VALUES
+    ('inbox_snooze',     'auto_snooze',      '{Inbox}',     'Snoozed', 15,   'last_activity', 10,
+     'Inbox objects without photometry or TNS updates for idle_days'),
+    ('snoozed_finish',   'retire_followups', '{Snoozed}',   'Finish',  NULL, 'last_phot',     10,
+     'Snoozed objects are retired'),
+    ('followup_finish',  'retire_followups', '{Follow-up}', 'Finish',  2,    'last_phot',     20,
+     'Follow-up objects whose last photometry is older than idle_days (or missing)')
+ON CONFLICT (rule_name) DO NOTHING;
@@ -0,0 +1,69 @@
+-- ============================================================
+-- 0010 — kinder_id assigned by PostgreSQL.
+-- transient.kinder_id_from_name() is the SQL form of the former
+-- Python _tns_name_to_kinder_id(): year * 1_000_000 + base-26 rank of
+-- the letter suffix ('2024ggi' -> 2024004923, '2026A' -> 2026000001).
+-- A BEFORE trigger fills kinder_id on insert / rename, and
+-- transient.backfill_kinder_ids() is the set-based catch-up pass.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION transient.kinder_id_from_name(obj_name TEXT)
+RETURNS BIGINT LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT CASE WHEN obj_name ~ '^[0-9]{4}[a-zA-Z]+$' THEN
+        left(obj_name, 4)::bigint * 1000000
+        + (SELECT SUM((ascii(substr(s, i, 1)) - 96)::bigint
+                      * power(26, length(s) - i)::bigint)
+             FROM (SELECT lower(substr(obj_name, 5)) AS s) x,
+                  generate_series(1, length(x.s)) AS i)
+    END
+$$;
+
+-- A name whose id is already taken (e.g. a manual '2026a' next to TNS
+-- '2026A') keeps kinder_id NULL instead of failing the insert on
+-- objects_kinder_id_idx.
+CREATE OR REPLACE FUNCTION transient.objects_kinder_id_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    kid BIGINT := transient.kinder_id_from_name(NEW.name);
+BEGIN
+    IF kid IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM transient.objects
+         WHERE kinder_id = kid AND obj_id <> NEW.obj_id
+    ) THEN
+        NEW.kinder_id := kid;
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS objects_kinder_id ON transient.objects;
+CREATE TRIGGER objects_kinder_id
+    BEFORE INSERT OR UPDATE OF name ON transient.objects
+    FOR EACH ROW WHEN (NEW.kinder_id IS NULL)
+    EXECUTE FUNCTION transient.objects_kinder_id_trg();
+
+-- Rows left without an id are few (non-TNS names, collisions); this
+-- partial index keeps the catch-up pass and its verification cheap.
+CREATE INDEX IF NOT EXISTS objects_kinder_id_missing_idx
+    ON transient.objects (obj_id) WHERE kinder_id IS NULL;
+
+CREATE OR REPLACE FUNCTION transient.backfill_kinder_ids()
+RETURNS INT LANGUAGE sql AS $$
+    WITH cand AS (
+        SELECT DISTINCT ON (kid) obj_id, kid
+          FROM (SELECT obj_id, transient.kinder_id_from_name(name) AS kid
+                  FROM transient.objects
+                 WHERE kinder_id IS NULL) t
+         WHERE kid IS NOT NULL
+           AND NOT EXISTS (SELECT 1 FROM transient.objects x WHERE x.kinder_id = t.kid)
+         ORDER BY kid, obj_id
+    ), upd AS (
+        UPDATE transient.objects o SET kinder_id = cand.kid
+          FROM cand
+         WHERE o.obj_id = cand.obj_id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::int FROM upd
+$$;
+
+SELECT transient.backfill_kinder_ids();
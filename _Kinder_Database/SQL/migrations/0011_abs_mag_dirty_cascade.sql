@@ -0,0 +1,18 @@
+-- ============================================================
+-- 0011 — photometry_abs_mag_dirty_trg skips objects that no longer
+-- exist.  Deleting an object cascades to its photometry, and the
+-- statement trigger used to queue the deleted obj_id, failing the
+-- abs_mag_dirty foreign key and with it the object delete.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION transient.photometry_abs_mag_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.abs_mag_dirty (obj_id)
+    SELECT DISTINCT c.obj_id FROM changed_rows c
+      JOIN transient.objects o ON o.obj_id = c.obj_id
+     ORDER BY c.obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
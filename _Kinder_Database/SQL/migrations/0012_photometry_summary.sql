@@ -0,0 +1,127 @@
+-- ============================================================
+-- 0012 — transient.photometry_summary: one row per object with
+-- photometry (point count, first/last epoch, latest and peak detection,
+-- per-filter counts).  Statement-level triggers on transient.photometry
+-- refresh the touched objects, so every ingest path keeps it current and
+-- readers never aggregate the raw points.
+-- A detection is a point with mag >= 0, the same rule the photometry
+-- readers apply.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS transient.photometry_summary (
+    obj_id          BIGINT PRIMARY KEY
+                        REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    n_points        INT NOT NULL DEFAULT 0,
+    n_detections    INT NOT NULL DEFAULT 0,
+    first_mjd       DOUBLE PRECISION,
+    last_mjd        DOUBLE PRECISION,
+    latest_mag      DOUBLE PRECISION,
+    latest_mag_err  DOUBLE PRECISION,
+    latest_filter   TEXT,
+    latest_mjd      DOUBLE PRECISION,
+    peak_mag        DOUBLE PRECISION,
+    peak_filter     TEXT,
+    peak_mjd        DOUBLE PRECISION,
+    filter_counts   JSONB NOT NULL DEFAULT '{}',
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Recompute the rows for ids.  The summary rows are locked before the
+-- points are read, so two writers touching the same object serialise and
+-- the later one sees the other's committed points.
+CREATE OR REPLACE FUNCTION transient.refresh_photometry_summary(ids BIGINT[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.photometry_summary (obj_id)
+    SELECT o.obj_id FROM transient.objects o
+     WHERE o.obj_id = ANY(ids)
+     ORDER BY o.obj_id
+    ON CONFLICT (obj_id) DO NOTHING;
+
+    PERFORM 1 FROM transient.photometry_summary
+      WHERE obj_id = ANY(ids) ORDER BY obj_id FOR UPDATE;
+
+    WITH pts AS (
+        SELECT p.obj_id, p."MJD" AS mjd, p.mag, p.mag_err, p.filter,
+               (p.mag IS NOT NULL AND p.mag >= 0) AS det
+          FROM transient.photometry p
+         WHERE p.obj_id = ANY(ids)
+    ), agg AS (
+        SELECT obj_id, COUNT(*) AS n_points, COUNT(*) FILTER (WHERE det) AS n_det,
+               MIN(mjd) AS first_mjd, MAX(mjd) AS last_mjd
+          FROM pts GROUP BY obj_id
+    ), latest AS (
+        SELECT DISTINCT ON (obj_id) obj_id, mag, mag_err, filter, mjd
+          FROM pts WHERE det ORDER BY obj_id, mjd DESC
+    ), peak AS (
+        SELECT DISTINCT ON (obj_id) obj_id, mag, filter, mjd
+          FROM pts WHERE det ORDER BY obj_id, mag ASC, mjd ASC
+    ), filt AS (
+        SELECT obj_id, jsonb_object_agg(f, n) AS filter_counts
+          FROM (SELECT obj_id, COALESCE(filter, '') AS f, COUNT(*) AS n
+                  FROM pts GROUP BY obj_id, COALESCE(filter, '')) x
+         GROUP BY obj_id
+    )
+    UPDATE transient.photometry_summary s SET
+        n_points       = agg.n_points,
+        n_detections   = agg.n_det,
+        first_mjd      = agg.first_mjd,
+        last_mjd       = agg.last_mjd,
+        latest_mag     = l.mag,
+        latest_mag_err = l.mag_err,
+        latest_filter  = l.filter,
+        latest_mjd     = l.mjd,
+        peak_mag       = pk.mag,
+        peak_filter    = pk.filter,
+        peak_mjd       = pk.mjd,
+        filter_counts  = filt.filter_counts,
+        updated_at     = now()
+      FROM agg
+      LEFT JOIN latest l USING (obj_id)
+      LEFT JOIN peak pk  USING (obj_id)
+      LEFT JOIN filt     USING (obj_id)
+     WHERE s.obj_id = agg.obj_id;
+
+    DELETE FROM transient.photometry_summary s
+     WHERE s.obj_id = ANY(ids)
+       AND NOT EXISTS (SELECT 1 FROM transient.photometry p WHERE p.obj_id = s.obj_id);
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.photometry_summary_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM transient.refresh_photometry_summary(
+        ARRAY(SELECT DISTINCT obj_id FROM changed_rows));
+    RETURN NULL;
+END
+$$;
+
+-- An UPDATE may move points between objects; refresh both sides.
+CREATE OR REPLACE FUNCTION transient.photometry_summary_upd_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM transient.refresh_photometry_summary(
+        ARRAY(SELECT obj_id FROM old_rows UNION SELECT obj_id FROM new_rows));
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS photometry_summary_ins ON transient.photometry;
+CREATE TRIGGER photometry_summary_ins AFTER INSERT ON transient.photometry
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_summary_trg();
+DROP TRIGGER IF EXISTS photometry_summary_upd ON transient.photometry;
+CREATE TRIGGER photometry_summary_upd AFTER UPDATE ON transient.photometry
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_summary_upd_trg();
+DROP TRIGGER IF EXISTS photometry_summary_del ON transient.photometry;
+CREATE TRIGGER photometry_summary_del AFTER DELETE ON transient.photometry
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_summary_trg();
+
+-- Backfill (no-op once every object with photometry has a row).
+SELECT transient.refresh_photometry_summary(ARRAY(
+    SELECT DISTINCT p.obj_id FROM transient.photometry p
+     WHERE NOT EXISTS (SELECT 1 FROM transient.photometry_summary s
+                        WHERE s.obj_id = p.obj_id)));
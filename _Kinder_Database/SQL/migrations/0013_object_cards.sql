@@ -0,0 +1,59 @@
+-- ============================================================
+-- 0013 — transient.object_cards: precomputed JSONB document per object
+-- for the object detail page, and the transient.object_card_dirty queue.
+-- Statement triggers on every table the card is built from mark the
+-- touched objects; rebuild_dirty_object_cards() (every minute) rebuilds
+-- them off the request path.  Cards are created on first view, so no
+-- backfill is needed.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS transient.object_cards (
+    obj_id      BIGINT PRIMARY KEY
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    card        JSONB NOT NULL,
+    built_at    TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS transient.object_card_dirty (
+    obj_id      BIGINT PRIMARY KEY
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    marked_at   TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
+
+-- Shared by all card triggers; the join skips objects deleted in the same
+-- statement (cascaded deletes of their children).
+CREATE OR REPLACE FUNCTION transient.object_card_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.object_card_dirty (obj_id)
+    SELECT DISTINCT c.obj_id FROM changed_rows c
+      JOIN transient.objects o ON o.obj_id = c.obj_id
+     ORDER BY c.obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['objects', 'photometry_summary', 'spectra',
+                             'comments', 'cross_matches', 'target_images']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS %1$s_card_dirty_ins ON transient.%1$s', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS %1$s_card_dirty_upd ON transient.%1$s', t);
+        EXECUTE format('CREATE TRIGGER %1$s_card_dirty_ins AFTER INSERT ON transient.%1$s '
+                       'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+                       'EXECUTE FUNCTION transient.object_card_dirty_trg()', t);
+        EXECUTE format('CREATE TRIGGER %1$s_card_dirty_upd AFTER UPDATE ON transient.%1$s '
+                       'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+                       'EXECUTE FUNCTION transient.object_card_dirty_trg()', t);
+        IF t <> 'objects' THEN
+            EXECUTE format('DROP TRIGGER IF EXISTS %1$s_card_dirty_del ON transient.%1$s', t);
+            EXECUTE format('CREATE TRIGGER %1$s_card_dirty_del AFTER DELETE ON transient.%1$s '
+                           'REFERENCING OLD TABLE AS changed_rows FOR EACH STATEMENT '
+                           'EXECUTE FUNCTION transient.object_card_dirty_trg()', t);
+        END IF;
+    END LOOP;
+END $$;
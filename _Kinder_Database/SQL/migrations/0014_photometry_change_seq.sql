@@ -0,0 +1,63 @@
+-- ============================================================
+-- 0014 — photometry change counter for incremental light-curve reads.
+-- Every inserted or updated point gets the next value of
+-- transient.photometry_change_seq in change_seq; removed points leave a
+-- row in transient.photometry_tombstones drawn from the same sequence.
+-- A client that remembers the largest change_seq it has seen for an object
+-- can ask for exactly the points added, changed or removed since then.
+-- Existing points keep change_seq = 0, so no table rewrite or backfill.
+-- ============================================================
+
+CREATE SEQUENCE IF NOT EXISTS transient.photometry_change_seq;
+
+ALTER TABLE transient.photometry
+    ADD COLUMN IF NOT EXISTS change_seq BIGINT NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS photometry_obj_change_seq_idx
+    ON transient.photometry (obj_id, change_seq);
+
+CREATE TABLE IF NOT EXISTS transient.photometry_tombstones (
+    phot_id     BIGINT PRIMARY KEY,
+    obj_id      BIGINT NOT NULL
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    source      TEXT,
+    change_seq  BIGINT NOT NULL,
+    deleted_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS photometry_tombstones_obj_seq_idx
+    ON transient.photometry_tombstones (obj_id, change_seq);
+
+-- The object row is locked before a number is drawn, so writers of one
+-- object take their numbers in commit order: a reader that has seen
+-- change_seq N of an object can never later find a smaller one appear.
+-- Objects being deleted (cascade) are not found and leave no tombstone.
+CREATE OR REPLACE FUNCTION transient.photometry_change_seq_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.obj_id IS DISTINCT FROM NEW.obj_id) THEN
+        PERFORM 1 FROM transient.objects WHERE obj_id = OLD.obj_id FOR NO KEY UPDATE;
+        IF FOUND THEN
+            INSERT INTO transient.photometry_tombstones (phot_id, obj_id, source, change_seq)
+            VALUES (OLD.phot_id, OLD.obj_id, OLD.source,
+                    nextval('transient.photometry_change_seq'))
+            ON CONFLICT (phot_id) DO UPDATE SET
+                obj_id     = EXCLUDED.obj_id,
+                source     = EXCLUDED.source,
+                change_seq = EXCLUDED.change_seq,
+                deleted_at = now();
+        END IF;
+        IF TG_OP = 'DELETE' THEN
+            RETURN OLD;
+        END IF;
+    END IF;
+    PERFORM 1 FROM transient.objects WHERE obj_id = NEW.obj_id FOR NO KEY UPDATE;
+    NEW.change_seq := nextval('transient.photometry_change_seq');
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS photometry_change_seq ON transient.photometry;
+CREATE TRIGGER photometry_change_seq
+    BEFORE INSERT OR UPDATE OR DELETE ON transient.photometry
+    FOR EACH ROW EXECUTE FUNCTION transient.photometry_change_seq_trg();
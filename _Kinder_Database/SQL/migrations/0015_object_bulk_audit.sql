@@ -0,0 +1,16 @@
+-- ============================================================
+-- 0015 — transient.object_bulk_audit: one row per bulk object mutation
+-- (status / tags / groups applied to many objects in one request).
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS transient.object_bulk_audit (
+    audit_id    BIGSERIAL PRIMARY KEY,
+    actor       TEXT NOT NULL,
+    operations  JSONB NOT NULL,             -- the validated operation list
+    obj_ids     BIGINT[] NOT NULL,          -- objects the request matched
+    changed     JSONB NOT NULL DEFAULT '{}', -- {"<index>:<op>": rows changed}
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS object_bulk_audit_created_idx
+    ON transient.object_bulk_audit (created_at DESC);
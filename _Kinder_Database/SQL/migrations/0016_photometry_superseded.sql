@@ -0,0 +1,146 @@
+-- ============================================================
+-- 0016 — photometry.superseded_by: TNS duplicates marked at ingest.
+-- A TNS-relayed point (source contains "TNS") is superseded by
+--   1. the nearest non-TNS point of the same filter within 1 day, or else
+--   2. the previous kept TNS point of the same filter within 1 day.
+-- These are the rules the photometry plot applied on every render.
+-- transient.mark_superseded_photometry(ids) recomputes the marks of the
+-- given objects; the ingest paths call it for every object that gained
+-- points.  Readers skip superseded points (the summary and abs-mag
+-- recompute unconditionally; permission-filtered readers only when the
+-- superseding point is visible).
+-- ============================================================
+
+ALTER TABLE transient.photometry
+    ADD COLUMN IF NOT EXISTS superseded_by BIGINT
+        REFERENCES transient.photometry(phot_id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS photometry_superseded_by_idx
+    ON transient.photometry (superseded_by) WHERE superseded_by IS NOT NULL;
+
+CREATE OR REPLACE FUNCTION transient.mark_superseded_photometry(ids BIGINT[])
+RETURNS int LANGUAGE plpgsql AS $$
+DECLARE
+    r          RECORD;
+    cur_obj    BIGINT;
+    cur_filter TEXT;
+    kept_mjd   DOUBLE PRECISION;
+    kept_id    BIGINT;
+    dup_ids    BIGINT[] := '{}';
+    by_ids     BIGINT[] := '{}';
+    n          INT;
+BEGIN
+    -- One sweep over the TNS points in (object, filter, MJD) order.  The
+    -- nearest survey point comes from an (obj_id, MJD) index probe; the
+    -- TNS self-duplicate rule only needs the last kept point of the run.
+    FOR r IN
+        SELECT t.phot_id, t.obj_id, t.filter, t."MJD" AS mjd, s.phot_id AS survey_id
+        FROM transient.photometry t
+        LEFT JOIN LATERAL (
+            SELECT q.phot_id FROM transient.photometry q
+            WHERE q.obj_id = t.obj_id
+              AND q."MJD" > t."MJD" - 1 AND q."MJD" < t."MJD" + 1
+              AND q.filter IS NOT DISTINCT FROM t.filter
+              AND COALESCE(q.source, '') NOT ILIKE '%tns%'
+            ORDER BY abs(q."MJD" - t."MJD"), q.phot_id
+            LIMIT 1
+        ) s ON TRUE
+        WHERE t.obj_id = ANY(ids) AND t.source ILIKE '%tns%'
+        ORDER BY t.obj_id, t.filter NULLS FIRST, t."MJD", t.phot_id
+    LOOP
+        IF r.obj_id IS DISTINCT FROM cur_obj OR r.filter IS DISTINCT FROM cur_filter THEN
+            cur_obj := r.obj_id;
+            cur_filter := r.filter;
+            kept_mjd := NULL;
+        END IF;
+        IF r.survey_id IS NOT NULL THEN
+            dup_ids := dup_ids || r.phot_id;
+            by_ids  := by_ids  || r.survey_id;
+        ELSIF kept_mjd IS NOT NULL AND r.mjd - kept_mjd < 1 THEN
+            dup_ids := dup_ids || r.phot_id;
+            by_ids  := by_ids  || kept_id;
+        ELSE
+            kept_mjd := r.mjd;
+            kept_id  := r.phot_id;
+        END IF;
+    END LOOP;
+
+    UPDATE transient.photometry p
+       SET superseded_by = m.by_id
+      FROM (SELECT q.phot_id, d.by_id
+              FROM transient.photometry q
+              LEFT JOIN unnest(dup_ids, by_ids) AS d(phot_id, by_id)
+                     ON d.phot_id = q.phot_id
+             WHERE q.obj_id = ANY(ids)) m
+     WHERE p.phot_id = m.phot_id
+       AND p.superseded_by IS DISTINCT FROM m.by_id;
+    GET DIAGNOSTICS n = ROW_COUNT;
+    RETURN n;
+END
+$$;
+
+-- The summary describes the clean light curve.
+CREATE OR REPLACE FUNCTION transient.refresh_photometry_summary(ids BIGINT[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.photometry_summary (obj_id)
+    SELECT o.obj_id FROM transient.objects o
+     WHERE o.obj_id = ANY(ids)
+     ORDER BY o.obj_id
+    ON CONFLICT (obj_id) DO NOTHING;
+
+    PERFORM 1 FROM transient.photometry_summary
+      WHERE obj_id = ANY(ids) ORDER BY obj_id FOR UPDATE;
+
+    WITH pts AS (
+        SELECT p.obj_id, p."MJD" AS mjd, p.mag, p.mag_err, p.filter,
+               (p.mag IS NOT NULL AND p.mag >= 0) AS det
+          FROM transient.photometry p
+         WHERE p.obj_id = ANY(ids) AND p.superseded_by IS NULL
+    ), agg AS (
+        SELECT obj_id, COUNT(*) AS n_points, COUNT(*) FILTER (WHERE det) AS n_det,
+               MIN(mjd) AS first_mjd, MAX(mjd) AS last_mjd
+          FROM pts GROUP BY obj_id
+    ), latest AS (
+        SELECT DISTINCT ON (obj_id) obj_id, mag, mag_err, filter, mjd
+          FROM pts WHERE det ORDER BY obj_id, mjd DESC
+    ), peak AS (
+        SELECT DISTINCT ON (obj_id) obj_id, mag, filter, mjd
+          FROM pts WHERE det ORDER BY obj_id, mag ASC, mjd ASC
+    ), filt AS (
+        SELECT obj_id, jsonb_object_agg(f, n) AS filter_counts
+          FROM (SELECT obj_id, COALESCE(filter, '') AS f, COUNT(*) AS n
+                  FROM pts GROUP BY obj_id, COALESCE(filter, '')) x
+         GROUP BY obj_id
+    )
+    UPDATE transient.photometry_summary s SET
+        n_points       = agg.n_points,
+        n_detections   = agg.n_det,
+        first_mjd      = agg.first_mjd,
+        last_mjd       = agg.last_mjd,
+        latest_mag     = l.mag,
+        latest_mag_err = l.mag_err,
+        latest_filter  = l.filter,
+        latest_mjd     = l.mjd,
+        peak_mag       = pk.mag,
+        peak_filter    = pk.filter,
+        peak_mjd       = pk.mjd,
+        filter_counts  = filt.filter_counts,
+        updated_at     = now()
+      FROM agg
+      LEFT JOIN latest l USING (obj_id)
+      LEFT JOIN peak pk  USING (obj_id)
+      LEFT JOIN filt     USING (obj_id)
+     WHERE s.obj_id = agg.obj_id;
+
+    DELETE FROM transient.photometry_summary s
+     WHERE s.obj_id = ANY(ids)
+       AND NOT EXISTS (SELECT 1 FROM transient.photometry p
+                        WHERE p.obj_id = s.obj_id AND p.superseded_by IS NULL);
+END
+$$;
+
+-- Backfill: mark every object that has TNS points.  The UPDATE fires the
+-- summary, abs-mag and card triggers for the objects that change.
+SELECT transient.mark_superseded_photometry(ARRAY(
+    SELECT DISTINCT obj_id FROM transient.photometry WHERE source ILIKE '%tns%'));
@@ -0,0 +1,46 @@
+-- ============================================================
+-- 0017 — auth.permission_version: one counter bumped by every change to
+-- the tables that decide source visibility (groups, memberships, default
+-- and per-object source permissions).  Workers cache the permission
+-- matrix and only reload it when the counter moves.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS auth.permission_version (
+    id          SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version     BIGINT NOT NULL DEFAULT 0,
+    changed_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+INSERT INTO auth.permission_version (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+
+-- Statement level, so a batch write bumps the counter once.  The row update
+-- becomes visible with the writer's commit, never before its data.
+CREATE OR REPLACE FUNCTION auth.bump_permission_version_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE auth.permission_version
+       SET version = version + 1, changed_at = now()
+     WHERE id = 1;
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS groups_permission_version ON auth.groups;
+CREATE TRIGGER groups_permission_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON auth.groups
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
+
+DROP TRIGGER IF EXISTS usr_group_permission_version ON auth.usr_group;
+CREATE TRIGGER usr_group_permission_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON auth.usr_group
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
+
+DROP TRIGGER IF EXISTS default_permissions_version ON transient.default_permissions;
+CREATE TRIGGER default_permissions_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON transient.default_permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
+
+DROP TRIGGER IF EXISTS object_source_permissions_version ON transient.object_source_permissions;
+CREATE TRIGGER object_source_permissions_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON transient.object_source_permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
@@ -0,0 +1,53 @@
+-- ============================================================
+-- 0018 — object cards are only marked dirty by writes that change what
+-- the card holds.  The card is the OBJECT_DETAIL_COLS projection of
+-- transient.objects, so:
+--   * an UPDATE of objects marks only rows whose card columns changed
+--     (last_phot_date, pin, host_name, permission... do not count);
+--   * the triggers on photometry_summary, spectra, comments,
+--     cross_matches and target_images are dropped — the per-section
+--     summaries they fed are no longer stored in the card.
+-- ============================================================
+
+-- Statement-level triggers cannot take UPDATE OF column lists with
+-- transition tables, so the old and new rows are compared here.
+CREATE OR REPLACE FUNCTION transient.objects_card_dirty_upd_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.object_card_dirty (obj_id)
+    SELECT n.obj_id FROM new_rows n
+      JOIN old_rows o ON o.obj_id = n.obj_id
+     WHERE (n.name_prefix, n.name, n.ra, n.dec, n.redshift, n.type,
+            n.report_group, n.source_group, n.discovery_date, n.discovery_mag,
+            n.discovery_filter, n.reporters, n.received_date, n.internal_name,
+            n.discovery_ADS, n.class_ADS, n.creation_date, n.last_modified_date,
+            n.brightest_mag, n.brightest_abs_mag, n.tag, n.status)
+           IS DISTINCT FROM
+           (o.name_prefix, o.name, o.ra, o.dec, o.redshift, o.type,
+            o.report_group, o.source_group, o.discovery_date, o.discovery_mag,
+            o.discovery_filter, o.reporters, o.received_date, o.internal_name,
+            o.discovery_ADS, o.class_ADS, o.creation_date, o.last_modified_date,
+            o.brightest_mag, o.brightest_abs_mag, o.tag, o.status)
+     ORDER BY n.obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS objects_card_dirty_upd ON transient.objects;
+CREATE TRIGGER objects_card_dirty_upd AFTER UPDATE ON transient.objects
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_card_dirty_upd_trg();
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['photometry_summary', 'spectra', 'comments',
+                             'cross_matches', 'target_images']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS %1$s_card_dirty_ins ON transient.%1$s', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS %1$s_card_dirty_upd ON transient.%1$s', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS %1$s_card_dirty_del ON transient.%1$s', t);
+    END LOOP;
+END $$;
@@ -0,0 +1,49 @@
+-- ============================================================
+-- 0019 — ensure_view_partitions() copes with rows in the DEFAULT
+-- partition.  Once object_views_detail_default held rows for a month
+-- (the job missed that month), CREATE TABLE ... PARTITION OF for it
+-- failed and the daily maintenance job errored from then on.
+-- A missing month is now built as a plain table, the DEFAULT rows of
+-- that range are moved into it, and it is attached.  The sweep also
+-- starts at the oldest DEFAULT row, so missed months get partitions
+-- (and are then dropped by retention like any other month).
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION transient.ensure_view_partitions(
+    since DATE DEFAULT NULL, months_ahead INT DEFAULT 2)
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    today DATE := (now() AT TIME ZONE 'UTC')::date;
+    oldest DATE;
+    m     DATE;
+    stop  DATE := (date_trunc('month', today::timestamp)
+                   + make_interval(months => months_ahead))::date;
+    nxt   DATE;
+    part  TEXT;
+    lo    TEXT;
+    hi    TEXT;
+BEGIN
+    SELECT (MIN(view_time) AT TIME ZONE 'UTC')::date INTO oldest
+      FROM transient.object_views_detail_default;
+    m := date_trunc('month', LEAST(COALESCE(since, today), COALESCE(oldest, today))::timestamp)::date;
+    WHILE m <= stop LOOP
+        nxt  := (m + interval '1 month')::date;
+        part := 'object_views_detail_p' || to_char(m, 'YYYYMM');
+        lo   := to_char(m, 'YYYY-MM-DD') || ' 00:00+00';
+        hi   := to_char(nxt, 'YYYY-MM-DD') || ' 00:00+00';
+        IF to_regclass('transient.' || part) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE transient.%I (LIKE transient.object_views_detail '
+                'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', part);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM transient.object_views_detail_default '
+                '  WHERE view_time >= %L AND view_time < %L RETURNING *) '
+                'INSERT INTO transient.%I SELECT * FROM moved', lo, hi, part);
+            EXECUTE format(
+                'ALTER TABLE transient.object_views_detail ATTACH PARTITION transient.%I '
+                'FOR VALUES FROM (%L) TO (%L)', part, lo, hi);
+        END IF;
+        m := nxt;
+    END LOOP;
+END
+$$;
@@ -16,6 +16,11 @@ CREATE TABLE transient.default_permissions (
     groups          INT[] NOT NULL DEFAULT '{}'
 );
 
+-- Invalidates the source-permission cache (auth.permission_version).
+CREATE TRIGGER default_permissions_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON transient.default_permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION auth.bump_permission_version_trg();
+
 -- ------------------------------------------------------------
 -- transient.objects
 -- Core transient object table (imported from TNS / internal)
@@ -62,6 +67,109 @@ CREATE INDEX objects_tag_idx           ON transient.objects USING GIN (tag);
 CREATE INDEX objects_groups_idx        ON transient.objects USING GIN (groups);
 CREATE INDEX objects_last_modified_idx ON transient.objects (last_modified_date);
 
+-- Keyset pagination for the marshal listing: one (sort key, obj_id) index per
+-- sortable column, see search_tns_objects_after().
+CREATE INDEX objects_discovery_date_seek_idx    ON transient.objects (discovery_date, obj_id);
+CREATE INDEX objects_last_modified_seek_idx     ON transient.objects (last_modified_date, obj_id);
+CREATE INDEX objects_discovery_mag_seek_idx     ON transient.objects (discovery_mag, obj_id);
+CREATE INDEX objects_name_seek_idx              ON transient.objects (name, obj_id);
+CREATE INDEX objects_received_date_seek_idx     ON transient.objects (received_date, obj_id);
+CREATE INDEX objects_last_phot_seek_idx         ON transient.objects ((COALESCE(last_phot_date, last_modified_date)), obj_id);
+CREATE INDEX objects_brightest_mag_seek_idx     ON transient.objects (brightest_mag, obj_id);
+CREATE INDEX objects_brightest_abs_mag_seek_idx ON transient.objects (brightest_abs_mag, obj_id);
+CREATE INDEX objects_redshift_seek_idx          ON transient.objects (redshift, obj_id);
+
+-- Marshal free-text search: normalised, '|'-delimited alias / discoverer text
+-- kept by PostgreSQL, matched with pg_trgm GIN indexes.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION transient.search_norm(t TEXT)
+RETURNS TEXT LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT regexp_replace(
+               regexp_replace(lower(COALESCE(t, '')), '\s+', '', 'g'),
+               '[,;|]+', '|', 'g')
+$$;
+
+-- array_to_string is only STABLE; generated columns need IMMUTABLE.
+CREATE OR REPLACE FUNCTION transient.search_join(a TEXT[])
+RETURNS TEXT LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT lower(array_to_string(a, '|'))
+$$;
+
+ALTER TABLE transient.objects
+    ADD COLUMN search_text TEXT GENERATED ALWAYS AS (
+        '|' || transient.search_norm(COALESCE(name_prefix, '') || name)
+     || '|' || transient.search_norm(name)
+     || '|' || transient.search_norm(internal_name)
+     || '|' || transient.search_norm(other_name) || '|'
+    ) STORED,
+    ADD COLUMN discoverer_text TEXT GENERATED ALWAYS AS (
+        '|' || lower(COALESCE(source_group, ''))
+     || '|' || lower(COALESCE(report_group, ''))
+     || '|' || transient.search_join(reporters) || '|'
+    ) STORED;
+
+CREATE INDEX objects_search_text_trgm_idx     ON transient.objects USING GIN (search_text gin_trgm_ops);
+CREATE INDEX objects_discoverer_text_trgm_idx ON transient.objects USING GIN (discoverer_text gin_trgm_ops);
+CREATE INDEX objects_name_lower_pattern_idx   ON transient.objects (lower(name) text_pattern_ops);
+
+-- kinder_id: year * 1_000_000 + base-26 rank of the letter suffix, filled by
+-- a BEFORE trigger from the TNS name.  backfill_kinder_ids() is the
+-- set-based catch-up pass used by sync_kinder_ids().
+ALTER TABLE transient.objects ADD COLUMN kinder_id BIGINT;
+CREATE UNIQUE INDEX objects_kinder_id_idx ON transient.objects (kinder_id) WHERE kinder_id IS NOT NULL;
+CREATE INDEX objects_kinder_id_missing_idx ON transient.objects (obj_id) WHERE kinder_id IS NULL;
+
+CREATE OR REPLACE FUNCTION transient.kinder_id_from_name(obj_name TEXT)
+RETURNS BIGINT LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT CASE WHEN obj_name ~ '^[0-9]{4}[a-zA-Z]+$' THEN
+        left(obj_name, 4)::bigint * 1000000
+        + (SELECT SUM((ascii(substr(s, i, 1)) - 96)::bigint
+                      * power(26, length(s) - i)::bigint)
+             FROM (SELECT lower(substr(obj_name, 5)) AS s) x,
+                  generate_series(1, length(x.s)) AS i)
+    END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.objects_kinder_id_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    kid BIGINT := transient.kinder_id_from_name(NEW.name);
+BEGIN
+    IF kid IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM transient.objects
+         WHERE kinder_id = kid AND obj_id <> NEW.obj_id
+    ) THEN
+        NEW.kinder_id := kid;
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER objects_kinder_id
+    BEFORE INSERT OR UPDATE OF name ON transient.objects
+    FOR EACH ROW WHEN (NEW.kinder_id IS NULL)
+    EXECUTE FUNCTION transient.objects_kinder_id_trg();
+
+CREATE OR REPLACE FUNCTION transient.backfill_kinder_ids()
+RETURNS INT LANGUAGE sql AS $$
+    WITH cand AS (
+        SELECT DISTINCT ON (kid) obj_id, kid
+          FROM (SELECT obj_id, transient.kinder_id_from_name(name) AS kid
+                  FROM transient.objects
+                 WHERE kinder_id IS NULL) t
+         WHERE kid IS NOT NULL
+           AND NOT EXISTS (SELECT 1 FROM transient.objects x WHERE x.kinder_id = t.kid)
+         ORDER BY kid, obj_id
+    ), upd AS (
+        UPDATE transient.objects o SET kinder_id = cand.kid
+          FROM cand
+         WHERE o.obj_id = cand.obj_id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::int FROM upd
+$$;
+
 -- ------------------------------------------------------------
 -- transient.photometry
 -- ------------------------------------------------------------
@@ -77,12 +185,251 @@ CREATE TABLE transient.photometry (
     source      TEXT,
     permission  TEXT NOT NULL DEFAULT 'default'
                     CHECK (permission IN ('default', 'public', 'login', 'groups')),
-    groups      INT[] NOT NULL DEFAULT '{}'
+    groups      INT[] NOT NULL DEFAULT '{}',
+    change_seq  BIGINT NOT NULL DEFAULT 0,  -- set by photometry_change_seq
+    superseded_by BIGINT                    -- TNS duplicate of this point
+                    REFERENCES transient.photometry(phot_id) ON DELETE SET NULL
 );
 
 CREATE INDEX photometry_obj_mjd_idx ON transient.photometry (obj_id, "MJD");
 CREATE INDEX photometry_source_idx  ON transient.photometry (source);
 CREATE INDEX photometry_groups_idx  ON transient.photometry USING GIN (groups);
+CREATE INDEX photometry_obj_change_seq_idx ON transient.photometry (obj_id, change_seq);
+CREATE INDEX photometry_superseded_by_idx
+    ON transient.photometry (superseded_by) WHERE superseded_by IS NOT NULL;
+
+-- ------------------------------------------------------------
+-- transient.mark_superseded_photometry
+-- A TNS-relayed point is superseded by the nearest non-TNS point of the
+-- same filter within 1 day, or else by the previous kept TNS point of the
+-- same filter within 1 day.  Called by the ingest paths for every object
+-- that gained points.
+-- ------------------------------------------------------------
+CREATE OR REPLACE FUNCTION transient.mark_superseded_photometry(ids BIGINT[])
+RETURNS int LANGUAGE plpgsql AS $$
+DECLARE
+    r          RECORD;
+    cur_obj    BIGINT;
+    cur_filter TEXT;
+    kept_mjd   DOUBLE PRECISION;
+    kept_id    BIGINT;
+    dup_ids    BIGINT[] := '{}';
+    by_ids     BIGINT[] := '{}';
+    n          INT;
+BEGIN
+    -- One sweep over the TNS points in (object, filter, MJD) order.  The
+    -- nearest survey point comes from an (obj_id, MJD) index probe; the
+    -- TNS self-duplicate rule only needs the last kept point of the run.
+    FOR r IN
+        SELECT t.phot_id, t.obj_id, t.filter, t."MJD" AS mjd, s.phot_id AS survey_id
+        FROM transient.photometry t
+        LEFT JOIN LATERAL (
+            SELECT q.phot_id FROM transient.photometry q
+            WHERE q.obj_id = t.obj_id
+              AND q."MJD" > t."MJD" - 1 AND q."MJD" < t."MJD" + 1
+              AND q.filter IS NOT DISTINCT FROM t.filter
+              AND COALESCE(q.source, '') NOT ILIKE '%tns%'
+            ORDER BY abs(q."MJD" - t."MJD"), q.phot_id
+            LIMIT 1
+        ) s ON TRUE
+        WHERE t.obj_id = ANY(ids) AND t.source ILIKE '%tns%'
+        ORDER BY t.obj_id, t.filter NULLS FIRST, t."MJD", t.phot_id
+    LOOP
+        IF r.obj_id IS DISTINCT FROM cur_obj OR r.filter IS DISTINCT FROM cur_filter THEN
+            cur_obj := r.obj_id;
+            cur_filter := r.filter;
+            kept_mjd := NULL;
+        END IF;
+        IF r.survey_id IS NOT NULL THEN
+            dup_ids := dup_ids || r.phot_id;
+            by_ids  := by_ids  || r.survey_id;
+        ELSIF kept_mjd IS NOT NULL AND r.mjd - kept_mjd < 1 THEN
+            dup_ids := dup_ids || r.phot_id;
+            by_ids  := by_ids  || kept_id;
+        ELSE
+            kept_mjd := r.mjd;
+            kept_id  := r.phot_id;
+        END IF;
+    END LOOP;
+
+    UPDATE transient.photometry p
+       SET superseded_by = m.by_id
+      FROM (SELECT q.phot_id, d.by_id
+              FROM transient.photometry q
+              LEFT JOIN unnest(dup_ids, by_ids) AS d(phot_id, by_id)
+                     ON d.phot_id = q.phot_id
+             WHERE q.obj_id = ANY(ids)) m
+     WHERE p.phot_id = m.phot_id
+       AND p.superseded_by IS DISTINCT FROM m.by_id;
+    GET DIAGNOSTICS n = ROW_COUNT;
+    RETURN n;
+END
+$$;
+
+-- ------------------------------------------------------------
+-- transient.photometry_tombstones / photometry_change_seq
+-- Change counter for incremental light-curve reads: inserted and
+-- updated points take the next sequence value, removed points leave a
+-- tombstone with one.  The object row is locked first so one object's
+-- numbers become visible in increasing order.
+-- ------------------------------------------------------------
+CREATE SEQUENCE transient.photometry_change_seq;
+
+CREATE TABLE transient.photometry_tombstones (
+    phot_id     BIGINT PRIMARY KEY,
+    obj_id      BIGINT NOT NULL
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    source      TEXT,
+    change_seq  BIGINT NOT NULL,
+    deleted_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX photometry_tombstones_obj_seq_idx
+    ON transient.photometry_tombstones (obj_id, change_seq);
+
+CREATE OR REPLACE FUNCTION transient.photometry_change_seq_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.obj_id IS DISTINCT FROM NEW.obj_id) THEN
+        PERFORM 1 FROM transient.objects WHERE obj_id = OLD.obj_id FOR NO KEY UPDATE;
+        IF FOUND THEN
+            INSERT INTO transient.photometry_tombstones (phot_id, obj_id, source, change_seq)
+            VALUES (OLD.phot_id, OLD.obj_id, OLD.source,
+                    nextval('transient.photometry_change_seq'))
+            ON CONFLICT (phot_id) DO UPDATE SET
+                obj_id     = EXCLUDED.obj_id,
+                source     = EXCLUDED.source,
+                change_seq = EXCLUDED.change_seq,
+                deleted_at = now();
+        END IF;
+        IF TG_OP = 'DELETE' THEN
+            RETURN OLD;
+        END IF;
+    END IF;
+    PERFORM 1 FROM transient.objects WHERE obj_id = NEW.obj_id FOR NO KEY UPDATE;
+    NEW.change_seq := nextval('transient.photometry_change_seq');
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER photometry_change_seq
+    BEFORE INSERT OR UPDATE OR DELETE ON transient.photometry
+    FOR EACH ROW EXECUTE FUNCTION transient.photometry_change_seq_trg();
+
+-- ------------------------------------------------------------
+-- transient.photometry_summary
+-- Per-object photometry facts (counts, latest / peak detection,
+-- per-filter counts), refreshed by statement triggers on photometry
+-- ------------------------------------------------------------
+CREATE TABLE transient.photometry_summary (
+    obj_id          BIGINT PRIMARY KEY
+                        REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    n_points        INT NOT NULL DEFAULT 0,
+    n_detections    INT NOT NULL DEFAULT 0,
+    first_mjd       DOUBLE PRECISION,
+    last_mjd        DOUBLE PRECISION,
+    latest_mag      DOUBLE PRECISION,
+    latest_mag_err  DOUBLE PRECISION,
+    latest_filter   TEXT,
+    latest_mjd      DOUBLE PRECISION,
+    peak_mag        DOUBLE PRECISION,
+    peak_filter     TEXT,
+    peak_mjd        DOUBLE PRECISION,
+    filter_counts   JSONB NOT NULL DEFAULT '{}',
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Recompute the rows for ids.  The summary rows are locked before the
+-- points are read, so two writers touching the same object serialise and
+-- the later one sees the other's committed points.
+CREATE OR REPLACE FUNCTION transient.refresh_photometry_summary(ids BIGINT[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.photometry_summary (obj_id)
+    SELECT o.obj_id FROM transient.objects o
+     WHERE o.obj_id = ANY(ids)
+     ORDER BY o.obj_id
+    ON CONFLICT (obj_id) DO NOTHING;
+
+    PERFORM 1 FROM transient.photometry_summary
+      WHERE obj_id = ANY(ids) ORDER BY obj_id FOR UPDATE;
+
+    WITH pts AS (
+        SELECT p.obj_id, p."MJD" AS mjd, p.mag, p.mag_err, p.filter,
+               (p.mag IS NOT NULL AND p.mag >= 0) AS det
+          FROM transient.photometry p
+         WHERE p.obj_id = ANY(ids) AND p.superseded_by IS NULL
+    ), agg AS (
+        SELECT obj_id, COUNT(*) AS n_points, COUNT(*) FILTER (WHERE det) AS n_det,
+               MIN(mjd) AS first_mjd, MAX(mjd) AS last_mjd
+          FROM pts GROUP BY obj_id
+    ), latest AS (
+        SELECT DISTINCT ON (obj_id) obj_id, mag, mag_err, filter, mjd
+          FROM pts WHERE det ORDER BY obj_id, mjd DESC
+    ), peak AS (
+        SELECT DISTINCT ON (obj_id) obj_id, mag, filter, mjd
+          FROM pts WHERE det ORDER BY obj_id, mag ASC, mjd ASC
+    ), filt AS (
+        SELECT obj_id, jsonb_object_agg(f, n) AS filter_counts
+          FROM (SELECT obj_id, COALESCE(filter, '') AS f, COUNT(*) AS n
+                  FROM pts GROUP BY obj_id, COALESCE(filter, '')) x
+         GROUP BY obj_id
+    )
+    UPDATE transient.photometry_summary s SET
+        n_points       = agg.n_points,
+        n_detections   = agg.n_det,
+        first_mjd      = agg.first_mjd,
+        last_mjd       = agg.last_mjd,
+        latest_mag     = l.mag,
+        latest_mag_err = l.mag_err,
+        latest_filter  = l.filter,
+        latest_mjd     = l.mjd,
+        peak_mag       = pk.mag,
+        peak_filter    = pk.filter,
+        peak_mjd       = pk.mjd,
+        filter_counts  = filt.filter_counts,
+        updated_at     = now()
+      FROM agg
+      LEFT JOIN latest l USING (obj_id)
+      LEFT JOIN peak pk  USING (obj_id)
+      LEFT JOIN filt     USING (obj_id)
+     WHERE s.obj_id = agg.obj_id;
+
+    DELETE FROM transient.photometry_summary s
+     WHERE s.obj_id = ANY(ids)
+       AND NOT EXISTS (SELECT 1 FROM transient.photometry p
+                        WHERE p.obj_id = s.obj_id AND p.superseded_by IS NULL);
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.photometry_summary_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM transient.refresh_photometry_summary(
+        ARRAY(SELECT DISTINCT obj_id FROM changed_rows));
+    RETURN NULL;
+END
+$$;
+
+-- An UPDATE may move points between objects; refresh both sides.
+CREATE OR REPLACE FUNCTION transient.photometry_summary_upd_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM transient.refresh_photometry_summary(
+        ARRAY(SELECT obj_id FROM old_rows UNION SELECT obj_id FROM new_rows));
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER photometry_summary_ins AFTER INSERT ON transient.photometry
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_summary_trg();
+CREATE TRIGGER photometry_summary_upd AFTER UPDATE ON transient.photometry
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_summary_upd_trg();
+CREATE TRIGGER photometry_summary_del AFTER DELETE ON transient.photometry
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_summary_trg();
 
 -- ------------------------------------------------------------
 -- transient.spectroscopy
@@ -104,6 +451,33 @@ CREATE TABLE transient.spectroscopy (
 CREATE INDEX spectroscopy_obj_mjd_idx ON transient.spectroscopy (obj_id, "MJD");
 CREATE INDEX spectroscopy_groups_idx  ON transient.spectroscopy USING GIN (groups);
 
+-- ------------------------------------------------------------
+-- transient.spectra
+-- One row per spectrum; samples packed as little-endian float64
+-- BYTEA, sorted by wavelength. Replaces transient.spectroscopy
+-- (legacy rows are moved by modules/spectra_migration.py)
+-- ------------------------------------------------------------
+CREATE TABLE transient.spectra (
+    spectra_id      BIGSERIAL PRIMARY KEY,
+    obj_id          BIGINT NOT NULL
+                        REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    name            TEXT,                   -- denormalized cache
+    source          TEXT NOT NULL,
+    "MJD"           DOUBLE PRECISION NOT NULL,
+    n_points        INT NOT NULL,
+    min_wavelength  DOUBLE PRECISION,       -- Angstrom
+    max_wavelength  DOUBLE PRECISION,       -- Angstrom
+    wavelength      BYTEA NOT NULL,         -- float64[n_points], Angstrom
+    intensity       BYTEA NOT NULL,         -- float64[n_points], NaN = missing
+    permission      TEXT NOT NULL DEFAULT 'default'
+                        CHECK (permission IN ('default', 'public', 'login', 'groups')),
+    groups          INT[] NOT NULL DEFAULT '{}',
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+    UNIQUE (obj_id, source, "MJD")
+);
+
+CREATE INDEX spectra_source_mjd_idx ON transient.spectra (source, "MJD");
+
 -- ------------------------------------------------------------
 -- transient.cross_matches
 -- Results from DETECT cross-match pipeline
@@ -121,11 +495,66 @@ CREATE TABLE transient.cross_matches (
     note            TEXT,
     run_date        TIMESTAMPTZ,
     status          TEXT,               -- Success, Error, Retry-Success
-    error_message   TEXT
+    error_message   TEXT,
+    match_date      DATE                -- updated_date::date, set by trigger
 );
 
 CREATE INDEX cross_matches_obj_catalog_idx ON transient.cross_matches (obj_id, catalog);
 CREATE INDEX cross_matches_is_host_idx     ON transient.cross_matches (obj_id, is_host);
+CREATE INDEX cross_matches_match_date_idx  ON transient.cross_matches (match_date);
+
+CREATE OR REPLACE FUNCTION transient.cross_matches_match_date_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.match_date := NEW.updated_date::date;
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER cross_matches_match_date
+    BEFORE INSERT OR UPDATE OF updated_date ON transient.cross_matches
+    FOR EACH ROW EXECUTE FUNCTION transient.cross_matches_match_date_trg();
+
+-- ------------------------------------------------------------
+-- transient.detect_daily_counts
+-- DETECT calendar summary, one row per match_date with matches
+-- ------------------------------------------------------------
+CREATE TABLE transient.detect_daily_counts (
+    match_date      DATE PRIMARY KEY,
+    unique_targets  INT  NOT NULL,
+    has_lens        BOOL NOT NULL DEFAULT FALSE,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- ------------------------------------------------------------
+-- transient.status_rules
+-- Status transition rules applied by apply_status_rules(); one
+-- UPDATE ... RETURNING per enabled rule, in priority order
+-- ------------------------------------------------------------
+CREATE TABLE transient.status_rules (
+    rule_name   TEXT PRIMARY KEY,
+    rule_set    TEXT NOT NULL,                  -- auto_snooze, retire_followups
+    from_status TEXT[] NOT NULL,
+    to_status   TEXT NOT NULL
+                    CHECK (to_status IN ('Inbox', 'Snoozed', 'Follow-up', 'Finish')),
+    idle_days   DOUBLE PRECISION,               -- NULL: no age condition
+    idle_basis  TEXT NOT NULL DEFAULT 'last_activity'
+                    CHECK (idle_basis IN ('last_activity', 'last_phot')),
+    priority    INT  NOT NULL DEFAULT 100,
+    enabled     BOOLEAN NOT NULL DEFAULT TRUE,
+    description TEXT
+);
+CREATE INDEX status_rules_set_idx ON transient.status_rules (rule_set, priority);
+
+INSERT INTO transient.status_rules
+    (rule_name, rule_set, from_status, to_status, idle_days, idle_basis, priority, description)
+VALUES
+    ('inbox_snooze',     'auto_snooze',      '{Inbox}',     'Snoozed', 15,   'last_activity', 10,
+     'Inbox objects without photometry or TNS updates for idle_days'),
+    ('snoozed_finish',   'retire_followups', '{Snoozed}',   'Finish',  NULL, 'last_phot',     10,
+     'Snoozed objects are retired'),
+    ('followup_finish',  'retire_followups', '{Follow-up}', 'Finish',  2,    'last_phot',     20,
+     'Follow-up objects whose last photometry is older than idle_days (or missing)');
 
 -- ------------------------------------------------------------
 -- transient.target_images
@@ -187,22 +616,44 @@ CREATE TABLE transient.object_views (
 
 -- ------------------------------------------------------------
 -- transient.object_views_detail
--- Rolling window detail log (e.g. 30 days)
--- Periodically prune: DELETE WHERE view_time < now() - INTERVAL 'XX days'
+-- Per-view log, range-partitioned by UTC month on view_time.
+-- Retention drops whole partitions (maintain_object_view_partitions);
+-- long-term popularity lives in transient.object_views_daily.
 -- ------------------------------------------------------------
 CREATE TABLE transient.object_views_detail (
-    view_id     BIGSERIAL PRIMARY KEY,
+    view_id     BIGSERIAL,
     obj_id      BIGINT NOT NULL
                     REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
     name        TEXT,                   -- denormalized cache
     usr_id      INT
                     REFERENCES auth.users(usr_id) ON DELETE SET NULL,
-    view_time   TIMESTAMPTZ NOT NULL DEFAULT now()
-);
+    view_time   TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (view_id, view_time)
+) PARTITION BY RANGE (view_time);
+
+-- One partition per month, created two months ahead by the daily job, e.g.
+CREATE TABLE transient.object_views_detail_p202610
+    PARTITION OF transient.object_views_detail
+    FOR VALUES FROM ('2026-10-01 00:00+00') TO ('2026-11-01 00:00+00');
+CREATE TABLE transient.object_views_detail_default
+    PARTITION OF transient.object_views_detail DEFAULT;
 
 CREATE INDEX object_views_detail_view_time_idx ON transient.object_views_detail (view_time);
 CREATE INDEX object_views_detail_obj_usr_idx   ON transient.object_views_detail (obj_id, usr_id);
 
+-- ------------------------------------------------------------
+-- transient.object_views_daily
+-- Views per object per UTC day, rolled up hourly from the detail log
+-- ------------------------------------------------------------
+CREATE TABLE transient.object_views_daily (
+    day          DATE   NOT NULL,
+    obj_id       BIGINT NOT NULL
+                     REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    views        INT    NOT NULL,
+    unique_users INT    NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, obj_id)
+);
+
 -- ------------------------------------------------------------
 -- transient.comments
 -- ------------------------------------------------------------
@@ -218,3 +669,250 @@ CREATE TABLE transient.comments (
 );
 
 CREATE INDEX comments_obj_idx ON transient.comments (obj_id);
+
+-- ------------------------------------------------------------
+-- transient.stats_counters
+-- Whole-catalogue counts for the marshal overview and /api/stats,
+-- kept current by statement-level triggers on objects/photometry.
+-- Keys: total, at, typed, with_redshift, flag, with_photometry,
+-- status:<status>.  Rebuilt from scratch by rebuild_stats_counters().
+-- ------------------------------------------------------------
+CREATE TABLE transient.stats_counters (
+    name        TEXT PRIMARY KEY,
+    value       BIGINT NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION transient.object_counter_keys(
+    status TEXT, name_prefix TEXT, type TEXT,
+    redshift DOUBLE PRECISION, tag TEXT[])
+RETURNS TEXT[] LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT array_remove(ARRAY[
+        'total',
+        'status:' || status,
+        CASE WHEN name_prefix = 'AT' THEN 'at' END,
+        CASE WHEN type IS NOT NULL AND type <> '' THEN 'typed' END,
+        CASE WHEN redshift IS NOT NULL THEN 'with_redshift' END,
+        CASE WHEN tag @> ARRAY['flag'] THEN 'flag' END
+    ], NULL)
+$$;
+
+CREATE OR REPLACE FUNCTION transient.objects_counters_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    -- Counter rows are touched in key order so concurrent
+    -- writers cannot deadlock on them.
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT k, COUNT(*)
+          FROM new_rows n,
+               unnest(transient.object_counter_keys(
+                   n.status, n.name_prefix, n.type, n.redshift, n.tag)) k
+         GROUP BY k ORDER BY k
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT k, -COUNT(*)
+          FROM old_rows o,
+               unnest(transient.object_counter_keys(
+                   o.status, o.name_prefix, o.type, o.redshift, o.tag)) k
+         GROUP BY k ORDER BY k
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    ELSE
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT k, SUM(d)
+          FROM (
+              SELECT k, 1 AS d
+                FROM new_rows n,
+                     unnest(transient.object_counter_keys(
+                         n.status, n.name_prefix, n.type, n.redshift, n.tag)) k
+              UNION ALL
+              SELECT k, -1
+                FROM old_rows o,
+                     unnest(transient.object_counter_keys(
+                         o.status, o.name_prefix, o.type, o.redshift, o.tag)) k
+          ) delta
+         GROUP BY k HAVING SUM(d) <> 0 ORDER BY k
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.photometry_counters_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        -- Objects whose every photometry row arrived in this
+        -- statement just got their first point.
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT 'with_photometry', COUNT(*)
+          FROM (SELECT obj_id, COUNT(*) AS cnt
+                  FROM new_rows GROUP BY obj_id) n
+         WHERE (SELECT COUNT(*) FROM (
+                    SELECT 1 FROM transient.photometry p
+                     WHERE p.obj_id = n.obj_id LIMIT n.cnt + 1) q) = n.cnt
+        HAVING COUNT(*) > 0
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    ELSE
+        INSERT INTO transient.stats_counters AS c (name, value)
+        SELECT 'with_photometry', -COUNT(*)
+          FROM (SELECT DISTINCT obj_id FROM old_rows) o
+         WHERE NOT EXISTS (SELECT 1 FROM transient.photometry p
+                            WHERE p.obj_id = o.obj_id)
+        HAVING COUNT(*) > 0
+        ON CONFLICT (name) DO UPDATE
+            SET value = c.value + EXCLUDED.value, updated_at = now();
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER objects_counters_ins AFTER INSERT ON transient.objects
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_counters_trg();
+CREATE TRIGGER objects_counters_upd AFTER UPDATE ON transient.objects
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_counters_trg();
+CREATE TRIGGER objects_counters_del AFTER DELETE ON transient.objects
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_counters_trg();
+CREATE TRIGGER photometry_counters_ins AFTER INSERT ON transient.photometry
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_counters_trg();
+CREATE TRIGGER photometry_counters_del AFTER DELETE ON transient.photometry
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_counters_trg();
+
+-- ------------------------------------------------------------
+-- transient.abs_mag_dirty
+-- Objects whose brightest_mag / brightest_abs_mag must be recomputed.
+-- Marked by triggers, drained every 5 min by recompute_dirty_abs_mags().
+-- ------------------------------------------------------------
+CREATE TABLE transient.abs_mag_dirty (
+    obj_id      BIGINT PRIMARY KEY
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    marked_at   TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
+
+CREATE OR REPLACE FUNCTION transient.photometry_abs_mag_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    -- Cascaded deletes of an object must not queue the deleted obj_id.
+    INSERT INTO transient.abs_mag_dirty (obj_id)
+    SELECT DISTINCT c.obj_id FROM changed_rows c
+      JOIN transient.objects o ON o.obj_id = c.obj_id
+     ORDER BY c.obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION transient.objects_abs_mag_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.abs_mag_dirty (obj_id) VALUES (NEW.obj_id)
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER photometry_abs_mag_dirty_ins AFTER INSERT ON transient.photometry
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_abs_mag_dirty_trg();
+CREATE TRIGGER photometry_abs_mag_dirty_upd AFTER UPDATE ON transient.photometry
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_abs_mag_dirty_trg();
+CREATE TRIGGER photometry_abs_mag_dirty_del AFTER DELETE ON transient.photometry
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.photometry_abs_mag_dirty_trg();
+CREATE TRIGGER objects_abs_mag_dirty
+    AFTER UPDATE OF redshift, ra, dec ON transient.objects
+    FOR EACH ROW
+    WHEN (OLD.redshift IS DISTINCT FROM NEW.redshift
+          OR OLD.ra IS DISTINCT FROM NEW.ra
+          OR OLD.dec IS DISTINCT FROM NEW.dec)
+    EXECUTE FUNCTION transient.objects_abs_mag_dirty_trg();
+
+-- ------------------------------------------------------------
+-- transient.object_cards / transient.object_card_dirty
+-- Precomputed JSONB document for the object detail page.  Statement
+-- triggers on the tables a card is built from mark the touched objects;
+-- rebuild_dirty_object_cards() rebuilds them every minute.
+-- ------------------------------------------------------------
+CREATE TABLE transient.object_cards (
+    obj_id      BIGINT PRIMARY KEY
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    card        JSONB NOT NULL,
+    built_at    TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE transient.object_card_dirty (
+    obj_id      BIGINT PRIMARY KEY
+                    REFERENCES transient.objects(obj_id) ON DELETE CASCADE,
+    marked_at   TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
+
+CREATE OR REPLACE FUNCTION transient.object_card_dirty_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.object_card_dirty (obj_id)
+    SELECT DISTINCT c.obj_id FROM changed_rows c
+      JOIN transient.objects o ON o.obj_id = c.obj_id
+     ORDER BY c.obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+-- An UPDATE marks only objects whose card (OBJECT_DETAIL_COLS) columns
+-- changed; statement triggers cannot use UPDATE OF with transition tables.
+CREATE OR REPLACE FUNCTION transient.objects_card_dirty_upd_trg()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO transient.object_card_dirty (obj_id)
+    SELECT n.obj_id FROM new_rows n
+      JOIN old_rows o ON o.obj_id = n.obj_id
+     WHERE (n.name_prefix, n.name, n.ra, n.dec, n.redshift, n.type,
+            n.report_group, n.source_group, n.discovery_date, n.discovery_mag,
+            n.discovery_filter, n.reporters, n.received_date, n.internal_name,
+            n.discovery_ADS, n.class_ADS, n.creation_date, n.last_modified_date,
+            n.brightest_mag, n.brightest_abs_mag, n.tag, n.status)
+           IS DISTINCT FROM
+           (o.name_prefix, o.name, o.ra, o.dec, o.redshift, o.type,
+            o.report_group, o.source_group, o.discovery_date, o.discovery_mag,
+            o.discovery_filter, o.reporters, o.received_date, o.internal_name,
+            o.discovery_ADS, o.class_ADS, o.creation_date, o.last_modified_date,
+            o.brightest_mag, o.brightest_abs_mag, o.tag, o.status)
+     ORDER BY n.obj_id
+    ON CONFLICT (obj_id) DO UPDATE SET marked_at = clock_timestamp();
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER objects_card_dirty_ins AFTER INSERT ON transient.objects
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.object_card_dirty_trg();
+CREATE TRIGGER objects_card_dirty_upd AFTER UPDATE ON transient.objects
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION transient.objects_card_dirty_upd_trg();
+
+-- ------------------------------------------------------------
+-- transient.object_bulk_audit
+-- One row per bulk status / tag / group mutation request.
+-- ------------------------------------------------------------
+CREATE TABLE transient.object_bulk_audit (
+    audit_id    BIGSERIAL PRIMARY KEY,
+    actor       TEXT NOT NULL,
+    operations  JSONB NOT NULL,
+    obj_ids     BIGINT[] NOT NULL,
+    changed     JSONB NOT NULL DEFAULT '{}',
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX object_bulk_audit_created_idx
+    ON transient.object_bulk_audit (created_at DESC);
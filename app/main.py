@@ -244,7 +244,10 @@ from modules.auto_tns_download import start_auto_tns_downloader
 from modules.tns_gap_filler import start_gap_filler
 from modules.db_monitor import check_and_alert as _db_check_and_alert
 from modules.database import recycle_idle_connections as _db_recycle
-from modules.database.transient import sync_host_redshifts
+from modules.database.transient import (
+    sync_host_redshifts, rebuild_stats_counters, rollup_object_views, maintain_object_view_partitions,
+    recompute_dirty_abs_mags, rebuild_dirty_object_cards,
+)
 from routes.detect.detect_routes import prewarm_detect_page_cache
 from modules.spectral_lines import warm_cache_async as _warm_spec_lines
 
@@ -282,6 +285,11 @@ if _acquired_bg_lock:
         _scheduler.add_job(_tracked('daily_target_mag_update', update_target_mags),           'cron', hour=5, minute=0,  id='daily_target_mag_update')
         _scheduler.add_job(_tracked('daily_retire_stale_followups', retire_stale_followups),  'cron', hour=5, minute=30, id='daily_retire_stale_followups')
         _scheduler.add_job(_tracked('daily_host_redshift_sync', sync_host_redshifts),         'cron', hour=6, minute=0,  id='daily_host_redshift_sync')
+        _scheduler.add_job(_tracked('daily_stats_counters_rebuild', rebuild_stats_counters),  'cron', hour=6, minute=30, id='daily_stats_counters_rebuild')
+        _scheduler.add_job(_tracked('daily_view_partitions', maintain_object_view_partitions), 'cron', hour=6, minute=45, id='daily_view_partitions')
+        _scheduler.add_job(_tracked('view_rollup', rollup_object_views),                      'interval', minutes=60,   id='view_rollup')
+        _scheduler.add_job(_tracked('abs_mag_recompute', recompute_dirty_abs_mags),           'interval', minutes=5,    id='abs_mag_recompute')
+        _scheduler.add_job(_tracked('object_card_rebuild', rebuild_dirty_object_cards),       'interval', minutes=1,    id='object_card_rebuild')
         _scheduler.add_job(_tracked('db_monitor', _db_check_and_alert),                       'interval', minutes=10,   id='db_monitor')
         _scheduler.add_job(_tracked('db_recycle', _db_recycle),                               'interval', minutes=30,   id='db_recycle')
         _scheduler.add_job(_tracked('detect_page_prewarm', prewarm_detect_page_cache),        'interval', minutes=30,   id='detect_page_prewarm')
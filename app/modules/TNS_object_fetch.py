@@ -37,10 +37,10 @@ from psycopg2 import extras
 
 try:
     from modules.database import get_db_connection
-    from modules.database.transient import log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch
+    from modules.database.transient import log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch, apply_status_rules
 except ImportError:
     from database import get_db_connection
-    from database.transient import log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch
+    from database.transient import log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch, apply_status_rules
 
 
 def _norm_text(v):
@@ -467,67 +467,22 @@ def addin_database(filepath, debug=False):
 
 
 def auto_snoozed(time_now_utc, debug=False):
-    """Auto-snooze objects with no photometry for 15+ days"""
-    snoozed_count = 0
-    finished_follow_count = 0
+    """Apply the 'auto_snooze' status rules (transient.status_rules).
 
+    Ages are measured from 00:00 UTC of *time_now_utc*, as before; each rule
+    is a single set-based UPDATE, see apply_status_rules()."""
     try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-
-            # Calculate cutoff as MJD (15 days ago)
-            cutoff_mjd = (time_now_utc.date() - _MJD_EPOCH).days - 15
-
+        as_of = (_date.fromisoformat(time_now_utc.strftime('%Y-%m-%d')) - _MJD_EPOCH).days
+        changed = apply_status_rules('auto_snooze', as_of_mjd=as_of)
+        for rule, rows in changed.items():
             if debug:
-                logger.debug(f"Processing transient.objects with cutoff MJD: {cutoff_mjd}")
-
-            # Find non-snoozed objects with old photometry or old last_modified_date
-            cursor.execute('''
-                SELECT obj_id, name, last_phot_date, status
-                FROM transient.objects
-                WHERE status != 'Snoozed'
-                AND (
-                    (last_phot_date IS NOT NULL AND last_phot_date < %s)
-                    OR
-                    (last_phot_date IS NULL AND last_modified_date < %s)
-                )
-            ''', (cutoff_mjd, cutoff_mjd))
-
-            objects_to_snooze = cursor.fetchall()
-
-            for obj in objects_to_snooze:
-                obj_id, name, last_phot_date, cur_status = obj
-
-                if cur_status == 'Follow-up':
-                    # Was being followed — mark as Finish (auto-completed)
-                    cursor.execute('''
-                        UPDATE transient.objects
-                        SET status = 'Finish'
-                        WHERE obj_id = %s
-                    ''', (obj_id,))
-                    finished_follow_count += 1
-                    if debug:
-                        logger.debug(f"Snoozed & finished follow: {name} (last_phot: {last_phot_date})")
-                else:
-                    # Snooze it
-                    cursor.execute('''
-                        UPDATE transient.objects
-                        SET status = 'Snoozed'
-                        WHERE obj_id = %s
-                    ''', (obj_id,))
-                    if debug:
-                        logger.debug(f"Snoozed: {name} (last_phot: {last_phot_date})")
-
-                snoozed_count += 1
-            
-            conn.commit()
-            cursor.close()
-        
-        logger.info(f"Auto-snooze completed: {snoozed_count} objects snoozed ({finished_follow_count} finished follow)")
+                for r in rows:
+                    logger.debug("%s: %s %s -> %s", rule, r['name'], r['prev_status'], r['status'])
+            logger.info("Auto-snooze rule %s: %d objects", rule, len(rows))
         return True
-        
+
     except Exception as e:
-        logger.exception(f"Error in auto_snoozed: {e}")
+        logger.exception("Error in auto_snoozed: %s", e)
         return False
 
 
@@ -13,10 +13,16 @@ from psycopg2 import extras
 
 try:
     from modules.database import get_db_connection
-    from modules.database.transient import log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch
+    from modules.database.transient import (
+        log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch,
+        _merge_photometry_rows, apply_status_rules,
+    )
 except ImportError:
     from database import get_db_connection
-    from database.transient import log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch
+    from database.transient import (
+        log_download_attempt, update_download_log, sync_kinder_ids, log_tns_update_batch,
+        _merge_photometry_rows, apply_status_rules,
+    )
 
 # ---- Paths ----
 _module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -462,51 +468,19 @@ def addin_database(filepath, debug=False, fetch_phot_for_new=False):
                 log_tns_update_batch(update_audit_batch)
 
             # ---- Bulk insert discovery photometry ----
-            # Resolve name → obj_id in one query then bulk-insert
+            # COPY into a staging table, resolve names and merge in one pass.
+            # New photometry re-activates dormant objects:
+            # Snoozed → Inbox (needs re-evaluation), Finish → Follow-up (new data warrants follow-up)
             if phot_batch:
-                names = list({p[0] for p in phot_batch})
-                cursor.execute(
-                    "SELECT name, obj_id FROM transient.objects WHERE name = ANY(%s)",
-                    (names,)
+                inserted = _merge_photometry_rows(
+                    cursor,
+                    ((None, name, mjd, mag, 0.01, filt, f"{src} (TNS)" if src else "(TNS)")
+                     for (name, mjd, mag, filt, src) in phot_batch),
+                    reactivate_finished=True,
                 )
-                name_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-                phot_rows = []
-                for (name, mjd, mag, filt, src) in phot_batch:
-                    oid = name_map.get(name)
-                    if oid:
-                        phot_rows.append((oid, name, mjd, mag, 0.01, filt, f"{src} (TNS)" if src else "(TNS)"))
-
-                if phot_rows:
-                    extras.execute_batch(cursor, '''
-                        INSERT INTO transient.photometry
-                            (obj_id, name, "MJD", mag, mag_err, filter, source)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT ON CONSTRAINT phot_uniq DO NOTHING
-                    ''', phot_rows, page_size=BATCH_SIZE)
-
-                    # Update last_phot_date and un-snooze for each affected object
-                    max_mjd_by_oid: dict = {}
-                    for oid, _, mjd, *__ in phot_rows:
-                        if oid not in max_mjd_by_oid or mjd > max_mjd_by_oid[oid]:
-                            max_mjd_by_oid[oid] = mjd
-                    for oid, max_mjd in max_mjd_by_oid.items():
-                        # New photometry re-activates dormant objects:
-                        # Snoozed → Inbox (needs re-evaluation), Finish → Follow-up (new data warrants follow-up)
-                        cursor.execute(
-                            "UPDATE transient.objects "
-                            "SET last_phot_date = %s, "
-                            "    status = CASE "
-                            "        WHEN status = 'Snoozed' THEN 'Inbox' "
-                            "        WHEN status = 'Finish' THEN 'Follow-up' "
-                            "        ELSE status "
-                            "    END "
-                            "WHERE obj_id = %s AND (last_phot_date IS NULL OR last_phot_date < %s)",
-                            (max_mjd, oid, max_mjd)
-                        )
-                    conn.commit()
-                    if debug:
-                        logger.debug("Inserted %d photometry points", len(phot_rows))
+                conn.commit()
+                if debug:
+                    logger.debug("Inserted %d photometry points", inserted)
 
             cursor.close()
 
@@ -561,42 +535,18 @@ def _fetch_phot_for_new_objects(names, debug=False):
 
 
 def auto_snoozed(time_now_utc, debug=False):
-    """Auto-snooze objects with no photometry for 15+ days."""
-    snoozed_count = 0
+    """Apply the 'auto_snooze' status rules (transient.status_rules).
 
+    Ages are measured from 00:00 UTC of *time_now_utc*, as before; each rule
+    is a single set-based UPDATE, see apply_status_rules()."""
     try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-
-            cutoff_mjd = (_date.fromisoformat(time_now_utc.strftime('%Y-%m-%d')) - _MJD_EPOCH).days - 15
-
+        as_of = (_date.fromisoformat(time_now_utc.strftime('%Y-%m-%d')) - _MJD_EPOCH).days
+        changed = apply_status_rules('auto_snooze', as_of_mjd=as_of)
+        for rule, rows in changed.items():
             if debug:
-                logger.debug("Auto-snooze cutoff MJD: %d", cutoff_mjd)
-
-            # Only Inbox objects are candidates for snoozing — never touch Follow-up or Finish
-            cursor.execute('''
-                SELECT obj_id, name, last_phot_date
-                FROM transient.objects
-                WHERE status = 'Inbox'
-                AND (
-                    (last_phot_date IS NOT NULL AND last_phot_date < %s)
-                    OR (last_phot_date IS NULL AND last_modified_date < %s)
-                )
-            ''', (cutoff_mjd, cutoff_mjd))
-
-            for obj_id, name, last_phot in cursor.fetchall():
-                cursor.execute(
-                    "UPDATE transient.objects SET status = 'Snoozed' WHERE obj_id = %s",
-                    (obj_id,)
-                )
-                snoozed_count += 1
-                if debug:
-                    logger.debug("Snoozed: %s (last_phot MJD: %s)", name, last_phot)
-
-            conn.commit()
-            cursor.close()
-
-        logger.info("Auto-snooze: %d snoozed", snoozed_count)
+                for r in rows:
+                    logger.debug("%s: %s %s -> %s", rule, r['name'], r['prev_status'], r['status'])
+            logger.info("Auto-snooze rule %s: %d objects", rule, len(rows))
         return True
 
     except Exception as e:
@@ -604,6 +554,7 @@ def auto_snoozed(time_now_utc, debug=False):
         return False
 
 
+
 def main():
     logger.info("Bot started at %s", datetime.now(timezone.utc))
 
@@ -5,6 +5,8 @@ import plotly.graph_objects as go
 import plotly.offline as pyo
 from datetime import datetime, timedelta, timezone
 
+from . import lod
+
 logger = logging.getLogger(__name__)
 
 # Import external module for absolute magnitude calculation
@@ -73,8 +75,30 @@ class DataVisualization:
         return layout
     
     @staticmethod
-    def create_photometry_plot_from_db(photometry_data, redshift=None, ra=None, dec=None, as_json=False, apply_extinction=True, apply_k_corr=True):
-        """Create interactive photometry plot from database data"""
+    def _lod_select(indices, data, width=None, mjd_window=None):
+        """Reduce one light-curve trace (indices into a filter/telescope group)
+        to the MJD window and an M4 selection sized for `width` pixels."""
+        if not indices or (not width and not mjd_window):
+            return indices
+        idx = np.asarray(indices)
+        mjd = np.array([data['mjd'][i] for i in indices], dtype=float)
+        mag = np.array([data['magnitude'][i] for i in indices], dtype=float)
+        order = np.argsort(mjd, kind='stable')
+        order = order[~np.isnan(mjd[order])]
+        idx, mjd, mag = idx[order], mjd[order], mag[order]
+        if mjd_window:
+            start, stop = lod.window_bounds(mjd, *mjd_window)
+            idx, mjd, mag = idx[start:stop], mjd[start:stop], mag[start:stop]
+        if width:
+            idx = idx[lod.m4_indices(mjd, mag, int(width))]
+        return idx.tolist()
+
+    @staticmethod
+    def create_photometry_plot_from_db(photometry_data, redshift=None, ra=None, dec=None, as_json=False, apply_extinction=True, apply_k_corr=True, as_figure=False,
+                                       width=None, mjd_window=None):
+        """Create interactive photometry plot from database data.
+        as_figure=True returns the go.Figure itself (used by the binary plot frame).
+        width (px) / mjd_window ((min, max) MJD) enable per-trace LOD downsampling."""
         if not photometry_data:
             return None
             
@@ -95,64 +119,13 @@ class DataVisualization:
             dec = None
         
         # ── TNS deduplication ──────────────────────────────────────────────────
-        # Rule 1: suppress a TNS point when any non-TNS point shares the same
-        #         filter and falls within 1 day.
-        # Rule 2: among TNS points with the same filter+telescope, keep only the
-        #         first one per 1-day window (deduplicate TNS self-repetition).
-        def _is_tns(telescope_str):
-            return 'tns' in str(telescope_str).lower()
-
-        TNS_DEDUP_WINDOW = 1.0  # days
-
-        # Pre-parse to floats for fast comparison
-        _pts = []
-        for p in photometry_data:
-            try:
-                mjd_f = float(p.get('mjd')) if p.get('mjd') is not None else None
-            except (ValueError, TypeError):
-                mjd_f = None
-            _pts.append((p, mjd_f))
-
-        # Build a lookup: filter -> list of (mjd) for NON-TNS points
-        _non_tns_by_filter = {}
-        for p, mjd_f in _pts:
-            if mjd_f is None:
-                continue
-            tel = p.get('telescope', 'Unknown')
-            if not _is_tns(tel):
-                flt = p.get('filter', 'Unknown')
-                _non_tns_by_filter.setdefault(flt, []).append(mjd_f)
-
-        # Walk TNS points in (filter, telescope) order, tracking seen windows
-        _tns_seen = {}   # (filter, telescope) -> list of accepted mjds
-        _keep_flags = []
-        for p, mjd_f in _pts:
-            tel = p.get('telescope', 'Unknown')
-            flt = p.get('filter', 'Unknown')
-            if not _is_tns(tel) or mjd_f is None:
-                _keep_flags.append(True)
-                continue
-
-            # Rule 1: any non-TNS point within 1 day for same filter?
-            non_tns_mjds = _non_tns_by_filter.get(flt, [])
-            if any(abs(mjd_f - m) < TNS_DEDUP_WINDOW for m in non_tns_mjds):
-                _keep_flags.append(False)
-                continue
-
-            # Rule 2: already accepted a TNS point within 1 day for same filter?
-            # Use filter only — telescope names like "ZTF (TNS)" vs "ZTF(TNS)" are
-            # the same source and should be treated as one group.
-            key = flt
-            accepted = _tns_seen.get(key, [])
-            if any(abs(mjd_f - m) < TNS_DEDUP_WINDOW for m in accepted):
-                _keep_flags.append(False)
-                continue
-
-            # Keep this point
-            _tns_seen.setdefault(flt, []).append(mjd_f)
-            _keep_flags.append(True)
-
-        photometry_data = [p for (p, _), keep in zip(_pts, _keep_flags) if keep]
+        # Duplicates are marked at ingest (photometry.superseded_by).  Hide a
+        # point only when the point that supersedes it is on this plot, so a
+        # user who cannot see the survey data still gets the TNS relay.
+        _kept_ids = {p.get('id') for p in photometry_data}
+        photometry_data = [p for p in photometry_data
+                           if p.get('superseded_by') is None
+                           or p.get('superseded_by') not in _kept_ids]
         # ── end TNS deduplication ───────────────────────────────────────────
 
         # Group data by filter and telescope
@@ -293,6 +266,9 @@ class DataVisualization:
                     # None, NaN, or 0 => upper limit (non-detection)
                     without_errors.append(i)
             
+            with_errors = DataVisualization._lod_select(with_errors, data, width, mjd_window)
+            without_errors = DataVisualization._lod_select(without_errors, data, width, mjd_window)
+
             # Add trace for points with error bars
             if with_errors:
                 # Calculate absolute magnitudes and store errors for hover
@@ -511,6 +487,8 @@ class DataVisualization:
 
         fig = go.Figure(data=traces, layout=layout)
         
+        if as_figure:
+            return fig
         if as_json:
             return fig.to_json()
         
@@ -519,20 +497,45 @@ class DataVisualization:
         return plot_div
     
     @staticmethod
+    def _spectrum_records(spectrum_data):
+        """Normalise spectrum input to one record per spectrum with float64
+        'wavelength' / 'intensity' arrays sorted by wavelength.
+
+        Accepts records from TNSObjectDB.get_spectrum_arrays as-is, or the
+        legacy per-sample dicts from get_spectroscopy (grouped by spectrum_id)."""
+        if not spectrum_data:
+            return []
+        if isinstance(spectrum_data[0].get('wavelength'), np.ndarray):
+            return spectrum_data
+        groups = {}
+        for point in spectrum_data:
+            groups.setdefault(point.get('spectrum_id'), []).append(point)
+        records = []
+        for spectrum_id, points in groups.items():
+            wl = np.array([p.get('wavelength') for p in points], dtype=float)
+            it = np.array([p.get('intensity') for p in points], dtype=float)
+            order = np.argsort(wl, kind='stable')
+            rec = {k: v for k, v in points[0].items() if k not in ('wavelength', 'intensity')}
+            rec['spectrum_id'] = spectrum_id
+            rec['wavelength'] = wl[order]
+            rec['intensity'] = it[order]
+            records.append(rec)
+        return records
+
     @staticmethod
     def _yrange_from_window(all_wls, all_ints, w_min=4500, w_max=7000, pad=0.12):
         """Return [ymin, ymax] from 4500-7000 Å window (2nd/98th pct + padding).
         Falls back to None (autorange) if window has no data."""
-        import numpy as np
-        vals = [
-            v
-            for wls, ints in zip(all_wls, all_ints)
-            for w, v in zip(wls, ints)
-            if w is not None and v is not None and w_min <= w <= w_max
-        ]
-        if not vals:
+        chunks = []
+        for wls, ints in zip(all_wls, all_ints):
+            wls = np.asarray(wls, dtype=float)
+            ints = np.asarray(ints, dtype=float)
+            mask = (wls >= w_min) & (wls <= w_max) & ~np.isnan(ints)
+            if mask.any():
+                chunks.append(ints[mask])
+        if not chunks:
             return None
-        arr = np.array(vals, dtype=float)
+        arr = np.concatenate(chunks)
         lo = float(np.percentile(arr, 2))
         hi = float(np.percentile(arr, 98))
         span = hi - lo or abs(hi) * 0.1 or 0.1
@@ -542,51 +545,69 @@ class DataVisualization:
     def _window_norm_scale(wavelengths, intensities, w_min=5000, w_max=7000):
         """Compute normalisation scale using median flux in [w_min, w_max] Å window.
         Falls back to 98th-percentile of full spectrum if window is empty."""
-        import numpy as np
-        window_vals = [
-            v for w, v in zip(wavelengths, intensities)
-            if w is not None and v is not None and w_min <= w <= w_max
-        ]
-        if window_vals:
-            arr = np.abs(np.array(window_vals, dtype=float))
-            scale = np.median(arr)
+        wls = np.asarray(wavelengths, dtype=float)
+        ints = np.asarray(intensities, dtype=float)
+        valid = ~np.isnan(ints)
+        window = valid & (wls >= w_min) & (wls <= w_max)
+        arr = np.abs(ints[valid])
+        if window.any():
+            scale = np.median(np.abs(ints[window]))
         else:
-            arr = np.abs(np.array([v for v in intensities if v is not None], dtype=float))
             scale = np.percentile(arr, 98) if len(arr) else 1.0
-        return float(scale) if scale and scale > 0 else float(np.max(arr)) or 1.0
+        if scale and scale > 0:
+            return float(scale)
+        return (float(np.max(arr)) if len(arr) else 0.0) or 1.0
 
     @staticmethod
-    def create_spectrum_plot_from_db(spectrum_data, spectrum_id, rest_frame=False, redshift=None, normalise=False):
-        """Create interactive spectrum plot from database data"""
-        if not spectrum_data:
+    def _list_norm_scale(intensities):
+        """98th-percentile |flux| scale used to put list-view spectra on a common footing."""
+        arr = np.abs(np.asarray(intensities, dtype=float))
+        arr = arr[~np.isnan(arr)]
+        if not len(arr):
+            return 1.0
+        scale = float(np.percentile(arr, 98))
+        return scale or float(np.max(arr)) or 1.0
+
+    @staticmethod
+    def _observed_window(window, rest_frame=False, redshift=None):
+        """Map a display-unit wavelength window back to observed-frame Å."""
+        if not window:
             return None
-        
-        # Filter data for specific spectrum_id
-        spectrum_points = [point for point in spectrum_data if point.get('spectrum_id') == spectrum_id]
-        
-        if not spectrum_points:
+        lo, hi = window
+        if rest_frame and redshift is not None:
+            f = 1 + float(redshift)
+            lo = lo * f if lo is not None else None
+            hi = hi * f if hi is not None else None
+        return lo, hi
+
+    @staticmethod
+    def create_spectrum_plot_from_db(spectrum_data, spectrum_id, rest_frame=False, redshift=None, normalise=False, as_figure=False,
+                                     width=None, window=None, object_name=None):
+        """Create interactive spectrum plot from database data.
+        width (px) / window (display-unit wavelength range) enable LOD downsampling."""
+        records = [r for r in DataVisualization._spectrum_records(spectrum_data)
+                   if r.get('spectrum_id') == spectrum_id]
+        if not records:
             return None
-        
-        # Sort by wavelength
-        spectrum_points.sort(key=lambda x: x.get('wavelength', 0))
-        
-        wavelengths = [point.get('wavelength') for point in spectrum_points]
-        intensities = [point.get('intensity') for point in spectrum_points]
-        
+        record = records[0]
+
+        wavelengths = record['wavelength']
+        intensities = record['intensity']
+        if not len(wavelengths):
+            return None
+
         # Apply rest-frame correction
         if rest_frame and redshift is not None:
-            z = float(redshift)
-            wavelengths = [w / (1 + z) if w is not None else None for w in wavelengths]
-        
+            wavelengths = wavelengths / (1 + float(redshift))
+
         # Apply normalisation: median flux in 5000-7000 Å window (rest or observed)
-        if normalise and intensities:
-            norm_scale = DataVisualization._window_norm_scale(wavelengths, intensities)
-            intensities = [v / norm_scale if v is not None else None for v in intensities]
-        
+        if normalise:
+            intensities = intensities / DataVisualization._window_norm_scale(wavelengths, intensities)
+
         # Get spectrum metadata
-        telescope = spectrum_points[0].get('telescope', 'Unknown')
-        phase = spectrum_points[0].get('phase')
-        spectrum_label = spectrum_points[0].get('spectrum_label') or telescope or 'Spectrum'
+        telescope = record.get('telescope', 'Unknown')
+        phase = record.get('phase')
+        spectrum_label = record.get('spectrum_label') or telescope or 'Spectrum'
         
         x_label = 'Rest-frame Wavelength (Å)' if (rest_frame and redshift is not None) else 'Wavelength (Å)'
         y_label = 'Normalized Intensity' if normalise else 'Relative Intensity'
@@ -597,6 +618,12 @@ class DataVisualization:
         if yrange:
             yaxis_cfg['range'] = yrange
 
+        idx = lod.lod_indices((object_name, record.get('spectrum_id')),
+                              record['wavelength'], record['intensity'], width,
+                              DataVisualization._observed_window(window, rest_frame, redshift))
+        if idx is not None:
+            wavelengths, intensities = wavelengths[idx], intensities[idx]
+
         # Create trace
         # Emerald green sits in a gap between the spectral-line overlay hues (see
         # SPECTRUM_TRACE_COLORS) so the data line never blends into a line marker.
@@ -638,25 +665,22 @@ class DataVisualization:
         layout = DataVisualization._apply_unified_plot_style(layout, legend_right=False)
         
         fig = go.Figure(data=[trace], layout=layout)
+        if as_figure:
+            return fig
         
         # Convert to HTML div
         plot_div = pyo.plot(fig, output_type='div', include_plotlyjs=False)
         return plot_div
     
     @staticmethod
-    def create_spectrum_list_plot_from_db(spectrum_data, rest_frame=False, redshift=None, normalise=False, stack=False):
-        """Create plot showing all available spectra for an object"""
-        if not spectrum_data:
+    def create_spectrum_list_plot_from_db(spectrum_data, rest_frame=False, redshift=None, normalise=False, stack=False, as_figure=False,
+                                          width=None, window=None, object_name=None):
+        """Create plot showing all available spectra for an object.
+        width (px) / window (display-unit wavelength range) enable LOD downsampling."""
+        records = DataVisualization._spectrum_records(spectrum_data)
+        if not records:
             return None
         
-        # Group by spectrum_id
-        spectrum_groups = {}
-        for point in spectrum_data:
-            spectrum_id = point.get('spectrum_id')
-            if spectrum_id not in spectrum_groups:
-                spectrum_groups[spectrum_id] = []
-            spectrum_groups[spectrum_id].append(point)
-        
         traces = []
         all_wls_for_range = []   # collect processed wavelengths for y-range
         all_ints_for_range = []  # collect processed intensities for y-range
@@ -665,41 +689,41 @@ class DataVisualization:
         # matches a line marker: emerald(130°), indigo(240°), purple(296°), rose(345°),
         # then a darker emerald and a lighter indigo for the 5th/6th spectra.
         colors = ['#3ddc84', '#6c7bf0', '#cf6be0', '#f76a87', '#28a866', '#a9b2f7']
+        obs_window = DataVisualization._observed_window(window, rest_frame, redshift)
         
-        for i, (spectrum_id, points) in enumerate(spectrum_groups.items()):
-            # Sort by wavelength
-            points.sort(key=lambda x: x.get('wavelength', 0))
-            
-            wavelengths = [point.get('wavelength') for point in points]
-            intensities = [point.get('intensity') for point in points]
+        for i, record in enumerate(records):
+            wavelengths = record['wavelength']
+            intensities = record['intensity']
+            if not len(wavelengths):
+                continue
             
             # Apply rest-frame correction
             if rest_frame and redshift is not None:
-                z = float(redshift)
-                wavelengths = [w / (1 + z) if w is not None else None for w in wavelengths]
+                wavelengths = wavelengths / (1 + float(redshift))
             
             # Normalise: window-based (5000-7000 Å) when requested;
             # always apply basic 98th-pct scale in list view for readable comparison
-            if normalise and intensities:
+            if normalise:
                 norm_scale = DataVisualization._window_norm_scale(wavelengths, intensities)
             else:
-                import numpy as np
-                arr = np.abs(np.array([v for v in intensities if v is not None], dtype=float))
-                norm_scale = np.percentile(arr, 98) if len(arr) else 1.0
-                if norm_scale == 0:
-                    norm_scale = np.max(arr) or 1.0
-            intensities = [v / norm_scale if v is not None else None for v in intensities]
+                norm_scale = DataVisualization._list_norm_scale(intensities)
+            intensities = intensities / norm_scale
             
             # Apply vertical offset per spectrum only when stack=True
             if stack:
-                intensities = [v + i * 1.2 if v is not None else None for v in intensities]
+                intensities = intensities + i * 1.2
             
             all_wls_for_range.append(wavelengths)
             all_ints_for_range.append(intensities)
+
+            idx = lod.lod_indices((object_name, record.get('spectrum_id')),
+                                  record['wavelength'], record['intensity'], width, obs_window)
+            if idx is not None:
+                wavelengths, intensities = wavelengths[idx], intensities[idx]
             
-            telescope = points[0].get('telescope', 'Unknown')
-            phase = points[0].get('phase')
-            spectrum_label = points[0].get('spectrum_label') or spectrum_id or telescope or 'Spectrum'
+            telescope = record.get('telescope', 'Unknown')
+            phase = record.get('phase')
+            spectrum_label = record.get('spectrum_label') or record.get('spectrum_id') or telescope or 'Spectrum'
             
             name = spectrum_label
             if phase is not None:
@@ -758,6 +782,8 @@ class DataVisualization:
         layout = DataVisualization._apply_unified_plot_style(layout, legend_right=True)
 
         fig = go.Figure(data=traces, layout=layout)
+        if as_figure:
+            return fig
 
         # Convert to HTML div
         plot_div = pyo.plot(fig, output_type='div', include_plotlyjs=False)
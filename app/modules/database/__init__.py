@@ -58,7 +58,7 @@ def init_connection_pool(minconn: int = _POOL_MIN, maxconn: int = _POOL_MAX):
             keepalives_interval=10,  # retry probe every 10 s
             keepalives_count=5,      # 5 failed probes → close socket
         )
-        _ensure_extra_tables()
+        _run_migrations()
         logger.info("Kinder connection pool initialised (%d–%d) [debug=%s]",
                     minconn, maxconn, _DEBUG)
     return _connection_pool
@@ -265,170 +265,20 @@ def is_db_available(force: bool = False) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# Extra tables not in the original Kinder schema DDL (backward-compat needs)
+# Schema migrations (numbered SQL files, see migrations.py)
 # ---------------------------------------------------------------------------
 
-def _ensure_extra_tables():
-    """Create supplementary tables used by app logic that are absent from the
-    core Kinder schema DDL.  All created under appropriate schemas."""
-    conn = None
+def _run_migrations():
+    """Apply pending schema migrations.  Failures are logged, not raised,
+    so the site still comes up against an older schema."""
     try:
-        conn = psycopg2.connect(
-            host=DB_HOST, port=int(DB_PORT),
-            database=DB_NAME,
-            user=DB_USER, password=DB_PASSWORD,
-            connect_timeout=5,
-        )
-        cur = conn.cursor()
-
-        # auth.invitations — invitation tokens for new user sign-up
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS auth.invitations (
-                token       TEXT PRIMARY KEY,
-                email       TEXT,
-                is_admin    BOOLEAN NOT NULL DEFAULT FALSE,
-                role        TEXT    NOT NULL DEFAULT 'user',
-                invited_by  INT     REFERENCES auth.users(usr_id) ON DELETE SET NULL,
-                invited_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
-                status      TEXT    NOT NULL DEFAULT 'pending',
-                accepted_at TIMESTAMPTZ
-            )
-        """)
-
-        # auth.system_settings — generic key/value store
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS auth.system_settings (
-                key        TEXT PRIMARY KEY,
-                value      TEXT,
-                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
-            )
-        """)
-
-        # transient.object_source_permissions — per-object per-source visibility
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS transient.object_source_permissions (
-                id             SERIAL PRIMARY KEY,
-                object_name    TEXT NOT NULL,
-                data_type      TEXT NOT NULL CHECK (data_type IN ('phot', 'spec')),
-                source_name    TEXT NOT NULL,
-                allowed_groups INT[]    DEFAULT NULL,
-                is_public      BOOLEAN  NOT NULL DEFAULT FALSE,
-                updated_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
-                UNIQUE (object_name, data_type, source_name)
-            )
-        """)
-
-        # Unique constraint needed for ON CONFLICT in photometry inserts
-        cur.execute("""
-            DO $$ BEGIN
-                BEGIN
-                    ALTER TABLE transient.photometry
-                        ADD CONSTRAINT phot_uniq UNIQUE (obj_id, "MJD", filter, source);
-                EXCEPTION WHEN duplicate_table THEN NULL;
-                END;
-            END $$
-        """)
-
-        # Unique constraint for obs.logs upsert
-        cur.execute("""
-            DO $$ BEGIN
-                BEGIN
-                    ALTER TABLE obs.logs
-                        ADD CONSTRAINT obs_logs_target_date_uniq UNIQUE (target_id, date);
-                EXCEPTION WHEN duplicate_table THEN NULL;
-                END;
-            END $$
-        """)
-
-        # kinder_id — internal sequential ID: year*1_000_000 + letter_rank
-        cur.execute("""
-            ALTER TABLE transient.objects
-                ADD COLUMN IF NOT EXISTS kinder_id BIGINT
-        """)
-        cur.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS objects_kinder_id_idx
-                ON transient.objects(kinder_id)
-                WHERE kinder_id IS NOT NULL
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS objects_discovery_date_idx
-                ON transient.objects(discovery_date DESC)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS objects_name_prefix_idx
-                ON transient.objects(name_prefix)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS objects_type_idx
-                ON transient.objects(type)
-                WHERE type IS NOT NULL AND type != ''
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS objects_last_phot_date_idx
-                ON transient.objects(last_phot_date DESC)
-        """)
-
-        # obs.logs indexes — date index enables the sargable date-range filter
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS obs_logs_date_idx
-                ON obs.logs(date)
-        """)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS obs_logs_name_idx
-                ON obs.logs(name)
-        """)
-
-        # obs.targets index — speeds up active-only filtering
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS obs_targets_active_idx
-                ON obs.targets(active, name)
-        """)
-
-        # transient.objects — name lookup used by _resolve_obj_id_with_prefix
-        cur.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS objects_name_idx
-                ON transient.objects(name)
-        """)
-
-        # Ensure tag always has a safe default even if an INSERT omits it.
-        cur.execute("""
-            ALTER TABLE transient.objects
-                ALTER COLUMN tag SET DEFAULT '{}'::text[]
-        """)
-        cur.execute("""
-            UPDATE transient.objects
-               SET tag = '{}'::text[]
-             WHERE tag IS NULL
-        """)
-
-        # cat.ned — NED cone-search result cache
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS cat.ned (
-                ned_id        SERIAL PRIMARY KEY,
-                object_name   TEXT NOT NULL,
-                ra_center     DOUBLE PRECISION NOT NULL,
-                dec_center    DOUBLE PRECISION NOT NULL,
-                radius_arcsec DOUBLE PRECISION NOT NULL DEFAULT 60,
-                searched_at   TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-                result_count  INT NOT NULL DEFAULT 0,
-                results       JSONB NOT NULL DEFAULT '[]'::jsonb
-            )
-        """)
-        cur.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS cat_ned_object_radius_idx
-                ON cat.ned (object_name, radius_arcsec)
-        """)
-
-        conn.commit()
-        cur.close()
+        from .migrations import migrate
+        applied = migrate()
+        if applied:
+            logger.info("Applied schema migrations: %s",
+                        ', '.join(f"{v:04d}" for v in applied))
     except Exception as e:
-        logger.warning("_ensure_extra_tables: %s", e)
-    finally:
-        if conn is not None:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        logger.warning("schema migrations: %s", e)
 
 
 # ---------------------------------------------------------------------------
@@ -493,3 +343,44 @@ OBJECT_COMPAT_COLS = """
     o.permission,
     o.groups
 """
+
+# Columns of the object detail page (object_detail.html), also stored as the
+# 'object' part of the precomputed object card.
+OBJECT_DETAIL_COLS = """
+    o.obj_id                                                               AS objid,
+    o.name_prefix,
+    o.name,
+    o.ra,
+    o.dec                                                                  AS declination,
+    o.redshift,
+    NULL::int                                                              AS typeid,
+    o.type,
+    NULL::int                                                              AS reporting_groupid,
+    o.report_group                                                         AS reporting_group,
+    NULL::int                                                              AS source_groupid,
+    o.source_group,
+    to_char(TIMESTAMP '1858-11-17' + o.discovery_date * INTERVAL '1 day',
+            'YYYY-MM-DD HH24:MI:SS')                                       AS discoverydate,
+    o.discovery_mag                                                        AS discoverymag,
+    o.discovery_filter                                                     AS discmagfilter,
+    o.discovery_filter                                                     AS filter,
+    array_to_string(o.reporters, ', ')                                     AS reporters,
+    to_char(TIMESTAMP '1858-11-17' + o.received_date * INTERVAL '1 day',
+            'YYYY-MM-DD HH24:MI:SS')                                       AS time_received,
+    COALESCE(o.internal_name, '')                                          AS internal_names,
+    o.discovery_ADS                                                        AS discovery_ads_bibcode,
+    o.class_ADS                                                            AS class_ads_bibcodes,
+    to_char(TIMESTAMP '1858-11-17' + o.creation_date * INTERVAL '1 day',
+            'YYYY-MM-DD HH24:MI:SS')                                       AS creationdate,
+    to_char(TIMESTAMP '1858-11-17' + o.last_modified_date * INTERVAL '1 day',
+            'YYYY-MM-DD HH24:MI:SS')                                       AS lastmodified,
+    o.brightest_mag,
+    o.brightest_abs_mag,
+    array_to_string(o.tag, ', ')                                           AS tags,
+    CASE o.status
+        WHEN 'Finish'    THEN 'finished'
+        WHEN 'Follow-up' THEN 'followup'
+        WHEN 'Snoozed'   THEN 'snoozed'
+        ELSE 'object'
+    END                                                                    AS tag
+"""
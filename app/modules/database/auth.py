@@ -8,6 +8,9 @@ Return dicts use backward-compatible key names matching the legacy kinder_web DB
 import logging
 import secrets
 import string
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 
 from psycopg2 import extras
@@ -17,25 +20,6 @@ from . import get_db_connection
 logger = logging.getLogger(__name__)
 
 
-# ---------------------------------------------------------------------------
-# One-time schema migration: ensure api_key_requested_at column exists
-# ---------------------------------------------------------------------------
-
-def _ensure_api_key_request_col() -> None:
-    try:
-        with get_db_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                "ALTER TABLE auth.users "
-                "ADD COLUMN IF NOT EXISTS api_key_requested_at TIMESTAMPTZ"
-            )
-            conn.commit()
-    except Exception as e:
-        logger.warning("_ensure_api_key_request_col: %s", e)
-
-_ensure_api_key_request_col()
-
-
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -382,6 +366,7 @@ def create_group(name: str, description: str = '',
             )
             row = cur.fetchone()
             conn.commit()
+        invalidate_permission_cache()
         return _group_row_to_dict(row) if row else None
     except Exception as e:
         logger.error("create_group %s: %s", name, e)
@@ -395,6 +380,7 @@ def delete_group(name: str) -> bool:
             cur.execute("DELETE FROM auth.groups WHERE name = %s", (name,))
             deleted = cur.rowcount > 0
             conn.commit()
+        invalidate_permission_cache()
         return deleted
     except Exception as e:
         logger.error("delete_group %s: %s", name, e)
@@ -430,6 +416,7 @@ def add_user_to_group(email: str, group_name: str,
                 (ur[0], gr[0], status)
             )
             conn.commit()
+        invalidate_permission_cache()
         return True
     except Exception as e:
         logger.error("add_user_to_group %s %s: %s", email, group_name, e)
@@ -448,6 +435,7 @@ def remove_user_from_group(email: str, group_name: str) -> bool:
             )
             deleted = cur.rowcount > 0
             conn.commit()
+        invalidate_permission_cache()
         return deleted
     except Exception as e:
         logger.error("remove_user_from_group: %s", e)
@@ -552,6 +540,7 @@ def update_group_request_status(email: str, group_name: str,
             )
             updated = cur.rowcount > 0
             conn.commit()
+        invalidate_permission_cache()
         return updated
     except Exception as e:
         logger.error("update_group_request_status: %s", e)
@@ -563,7 +552,7 @@ def delete_group_request(email: str, group_name: str) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# Invitations  (auth.invitations — created by _ensure_extra_tables)
+# Invitations  (auth.invitations — created by migration 0001_baseline)
 # ---------------------------------------------------------------------------
 
 def get_invitations(status: str = 'pending') -> list[dict]:
@@ -904,6 +893,7 @@ def set_source_permissions_batch(object_name: str, data_type: str,
                      p.get('allowed_groups'))
                 )
             conn.commit()
+        invalidate_permission_cache()
         return True
     except Exception as e:
         logger.error("set_source_permissions_batch: %s", e)
@@ -930,6 +920,7 @@ def set_default_source_permissions_batch(permissions: list[dict]) -> bool:
                      p.get('groups', []))
                 )
             conn.commit()
+        invalidate_permission_cache()
         return True
     except Exception as e:
         logger.error("set_default_source_permissions_batch: %s", e)
@@ -945,6 +936,143 @@ def _system_default_for_source(source_name: str) -> str:
     return 'login'
 
 
+# Source-permission cache.  filter_by_source_permissions() runs on every
+# photometry / spectrum / plot / download request, while the tables it reads
+# change rarely.  Each worker keeps the group map, the default permissions,
+# per-object overrides and per-user decisions in one state dict tagged with
+# auth.permission_version (migration 0017), and rereads that stamp at most
+# every _PERM_VERSION_CHECK seconds; a moved stamp replaces the whole state.
+# The mutators above also drop the state at once, so the worker that made a
+# change does not wait for the next stamp check.
+
+_PERM_VERSION_CHECK = 5.0
+_PERM_OVERRIDES_MAX = 4096
+_PERM_USERS_MAX = 1024
+_perm_state: dict | None = None
+_perm_checked_at = 0.0
+_perm_lock = threading.Lock()
+
+
+def invalidate_permission_cache():
+    """Forget every cached source-permission decision in this worker."""
+    global _perm_state
+    with _perm_lock:
+        _perm_state = None
+
+
+def _permission_state() -> dict:
+    """Return the current state dict, reloading it when the version stamp
+    moved.  The dict is replaced, never cleared, so readers holding the old
+    one finish with a consistent view."""
+    global _perm_state, _perm_checked_at
+    state = _perm_state
+    now = time.monotonic()
+    if state is not None and now - _perm_checked_at < _PERM_VERSION_CHECK:
+        return state
+    with get_db_connection() as conn:
+        cur = conn.cursor(cursor_factory=extras.RealDictCursor)
+        # Stamp first: a change committed between the reads leaves newer data
+        # under an older stamp, which the next check reloads.
+        cur.execute("SELECT version FROM auth.permission_version WHERE id = 1")
+        row = cur.fetchone()
+        version = row['version'] if row else None
+        if state is None or version is None or state['version'] != version:
+            cur.execute("SELECT name, group_id FROM auth.groups")
+            id_to_name = {r['group_id']: r['name'] for r in cur.fetchall()}
+            cur.execute("SELECT source, permissions_set, groups FROM transient.default_permissions")
+            defaults = {r['source']: r for r in cur.fetchall()}
+            state = {
+                'version':    version,
+                'id_to_name': id_to_name,
+                'defaults':   defaults,
+                'overrides':  OrderedDict(),   # (object_name, data_type) -> {source: row}
+                'users':      OrderedDict(),   # (logged_in, groups) -> matrix
+            }
+    with _perm_lock:
+        _perm_state = state
+        # Without a stamp row nothing can be trusted past this call.
+        _perm_checked_at = now if version is not None else 0.0
+    return state
+
+
+def _object_overrides(state: dict, object_name: str, data_type: str) -> dict:
+    """{source_name: row} of transient.object_source_permissions for one
+    object; objects without overrides are cached as {} too."""
+    key = (object_name, data_type)
+    with _perm_lock:
+        hit = state['overrides'].get(key)
+        if hit is not None:
+            state['overrides'].move_to_end(key)
+            return hit
+    with get_db_connection() as conn:
+        cur = conn.cursor(cursor_factory=extras.RealDictCursor)
+        cur.execute(
+            "SELECT source_name, is_public, allowed_groups "
+            "FROM transient.object_source_permissions "
+            "WHERE object_name = %s AND data_type = %s",
+            (object_name, data_type)
+        )
+        rows = {r['source_name']: r for r in cur.fetchall()}
+    with _perm_lock:
+        state['overrides'][key] = rows
+        while len(state['overrides']) > _PERM_OVERRIDES_MAX:
+            state['overrides'].popitem(last=False)
+    return rows
+
+
+def _user_matrix(state: dict, logged_in: bool, user_groups) -> dict:
+    """Per-user entry: the user's group ids and a {source: allowed} map of
+    decisions that do not depend on the object (defaults / system default)."""
+    key = (logged_in, frozenset(user_groups or ()))
+    with _perm_lock:
+        hit = state['users'].get(key)
+        if hit is not None:
+            state['users'].move_to_end(key)
+            return hit
+        names = key[1]
+        hit = {
+            'logged_in': logged_in,
+            'group_ids': {gid for gid, name in state['id_to_name'].items() if name in names},
+            'sources':   {},
+        }
+        state['users'][key] = hit
+        while len(state['users']) > _PERM_USERS_MAX:
+            state['users'].popitem(last=False)
+    return hit
+
+
+def _source_allowed(state: dict, user: dict, overrides: dict, src: str) -> bool:
+    r = overrides.get(src)
+    if r is not None:
+        if r['is_public']:
+            return True
+        if not user['logged_in']:
+            return False  # not logged in, not public
+        ag = r.get('allowed_groups')  # None = login mode, [] = blocked, [ids...] = specific groups
+        if ag is None:
+            return True   # login mode override: any logged-in user
+        return bool(user['group_ids'].intersection(ag))  # [] → nobody except admin
+
+    allowed = user['sources'].get(src)
+    if allowed is not None:
+        return allowed
+    d = state['defaults'].get(src)
+    if d is not None:
+        perm = d.get('permissions_set', 'login')
+        if perm == 'public':
+            allowed = True
+        elif perm == 'login':
+            allowed = user['logged_in']
+        else:  # 'groups'
+            default_ids = {gid for gid in (d.get('groups') or []) if gid in state['id_to_name']}
+            allowed = user['logged_in'] and (not default_ids or bool(user['group_ids'] & default_ids))
+    else:
+        # System default: TNS sources are public, everything else needs login
+        allowed = _system_default_for_source(src) == 'public' or user['logged_in']
+    user['sources'][src] = allowed
+    return allowed
+
+
 def filter_by_source_permissions(object_name: str, data_type: str,
                                   source_list: list,
                                   user_email: str | None = None,
@@ -953,95 +1081,33 @@ def filter_by_source_permissions(object_name: str, data_type: str,
     """Return subset of sources/records the user is allowed to see.
     user_groups: list of group NAME strings from session.
     object_source_permissions.allowed_groups: INT[] (group IDs) in DB.
-    NULL = login-mode override, [] = blocked, [ids] = specific groups."""
+    NULL = login-mode override, [] = blocked, [ids] = specific groups.
+    Decisions come from the per-worker permission cache; see
+    _permission_state()."""
     if not source_list:
         return []
     if is_admin:
         return source_list
 
     is_record_list = isinstance(source_list[0], dict)
-    source_names = []
     if is_record_list:
-        for item in source_list:
-            source_names.append(
-                item.get('telescope') or item.get('source') or item.get('source_name') or 'Unknown'
-            )
+        source_names = [
+            item.get('telescope') or item.get('source') or item.get('source_name') or 'Unknown'
+            for item in source_list
+        ]
     else:
         source_names = list(source_list)
 
-    user_group_set = set(user_groups or [])
-
     try:
-        with get_db_connection() as conn:
-            cur = conn.cursor(cursor_factory=extras.RealDictCursor)
-            # Per-object overrides (allowed_groups is INT[] of group IDs)
-            cur.execute(
-                "SELECT source_name, is_public, allowed_groups "
-                "FROM transient.object_source_permissions "
-                "WHERE object_name = %s AND data_type = %s AND source_name = ANY(%s)",
-                (object_name, data_type, source_names)
-            )
-            overrides = {r['source_name']: r for r in cur.fetchall()}
-
-            # System-wide defaults (groups stored as INT[] of group IDs)
-            cur.execute(
-                "SELECT source, permissions_set, groups "
-                "FROM transient.default_permissions "
-                "WHERE source = ANY(%s)",
-                (source_names,)
-            )
-            defaults = {r['source']: r for r in cur.fetchall()}
-
-            # Build id->name map for defaults comparison
-            cur.execute("SELECT name, group_id FROM auth.groups")
-            id_to_name = {r['group_id']: r['name'] for r in cur.fetchall()}
-
-        allowed_sources = set()
-        for src in source_names:
-            if src in overrides:
-                r = overrides[src]
-                if r['is_public']:
-                    allowed_sources.add(src)
-                elif user_email is None:
-                    pass  # not logged in, not public
-                else:
-                    ag = r.get('allowed_groups')  # None = login mode, [] = blocked, [ids...] = specific groups
-                    if ag is None:
-                        allowed_sources.add(src)  # login mode override: any logged-in user
-                    elif len(ag) == 0:
-                        pass  # blocked — empty array means nobody except admin
-                    else:
-                        ag_names = {id_to_name[gid] for gid in ag if gid in id_to_name}
-                        if user_group_set & ag_names:
-                            allowed_sources.add(src)
-                    # no intersection → denied
-            elif src in defaults:
-                d = defaults[src]
-                perm = d.get('permissions_set', 'login')
-                if perm == 'public':
-                    allowed_sources.add(src)
-                elif perm == 'login':
-                    if user_email is not None:
-                        allowed_sources.add(src)
-                else:  # 'groups'
-                    if user_email is not None:
-                        group_ids = d.get('groups') or []
-                        default_group_names = {id_to_name[gid] for gid in group_ids if gid in id_to_name}
-                        if not default_group_names or (user_group_set & default_group_names):
-                            allowed_sources.add(src)
-            else:
-                # System default: TNS sources are public, everything else needs login
-                perm = _system_default_for_source(src)
-                if perm == 'public':
-                    allowed_sources.add(src)
-                elif user_email is not None:
-                    allowed_sources.add(src)
+        state = _permission_state()
+        overrides = _object_overrides(state, object_name, data_type)
+        user = _user_matrix(state, user_email is not None, user_groups)
+        allowed_sources = {src for src in set(source_names)
+                           if _source_allowed(state, user, overrides, src)}
 
         if is_record_list:
-            return [
-                item for item in source_list
-                if (item.get('telescope') or item.get('source') or item.get('source_name') or 'Unknown') in allowed_sources
-            ]
+            return [item for item, src in zip(source_list, source_names)
+                    if src in allowed_sources]
         return [src for src in source_list if src in allowed_sources]
     except Exception as e:
         logger.error("filter_by_source_permissions: %s", e)
@@ -0,0 +1,173 @@
+"""Versioned schema migrations for the Kinder database.
+
+Migrations are the numbered SQL files in _Kinder_Database/SQL/migrations
+(``0001_baseline.sql``, ``0002_spectra.sql`` ...).  Each pending file runs
+once, in its own transaction, and is recorded in public.schema_version with
+a checksum of its contents.  The files are idempotent, so a database that
+predates the runner adopts it by simply recording the versions.
+
+init_connection_pool() applies pending migrations once per process; a
+PostgreSQL advisory lock keeps concurrent workers from racing.  Request
+handlers never issue DDL — new columns, tables and indexes go into a new
+numbered file, never into application code.
+
+Usage:
+    python -m modules.database.migrations            # apply pending migrations
+    python -m modules.database.migrations status     # list applied / pending
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sys
+
+import psycopg2
+
+from . import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', '_Kinder_Database', 'SQL', 'migrations',
+))
+
+_FILE_RE = re.compile(r'^(\d{4})_(\w+)\.sql$')
+
+# pg_advisory_lock key shared by every process running migrations.
+_LOCK_KEY = 0x4B494E44   # 'KIND'
+
+
+def discover_migrations(path: str = MIGRATIONS_DIR) -> list[tuple[int, str, str]]:
+    """Return (version, name, file_path) for every migration file, in order."""
+    found = []
+    for fname in sorted(os.listdir(path)):
+        m = _FILE_RE.match(fname)
+        if m:
+            found.append((int(m.group(1)), m.group(2), os.path.join(path, fname)))
+    versions = [v for v, _, _ in found]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"duplicate migration version in {path}")
+    return found
+
+
+def _checksum(sql: str) -> str:
+    return hashlib.sha256(sql.encode('utf-8')).hexdigest()
+
+
+def _connect():
+    return psycopg2.connect(
+        host=DB_HOST, port=int(DB_PORT),
+        database=DB_NAME,
+        user=DB_USER, password=DB_PASSWORD,
+        connect_timeout=5,
+        application_name='kinder_migrations',
+    )
+
+
+def _ensure_version_table(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS public.schema_version (
+            version    INT PRIMARY KEY,
+            name       TEXT NOT NULL,
+            checksum   TEXT NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+
+
+def _applied(cur) -> dict:
+    cur.execute("SELECT version, checksum, applied_at FROM public.schema_version")
+    return {r[0]: (r[1], r[2]) for r in cur.fetchall()}
+
+
+def migrate(target: int | None = None) -> list[int]:
+    """Apply every pending migration up to *target* (default: all).
+    Returns the versions applied; raises on the first failing file, whose
+    transaction is rolled back so it is retried on the next run."""
+    conn = _connect()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT pg_advisory_lock(%s)", (_LOCK_KEY,))
+        _ensure_version_table(cur)
+        applied = _applied(cur)
+        done = []
+        for version, name, path in discover_migrations():
+            if target is not None and version > target:
+                break
+            with open(path, encoding='utf-8') as f:
+                sql = f.read()
+            checksum = _checksum(sql)
+            if version in applied:
+                if applied[version][0] != checksum:
+                    logger.warning("migration %04d_%s was edited after it was applied", version, name)
+                continue
+            logger.info("applying migration %04d_%s", version, name)
+            conn.autocommit = False
+            try:
+                cur.execute(sql)
+                cur.execute(
+                    "INSERT INTO public.schema_version (version, name, checksum) "
+                    "VALUES (%s, %s, %s)",
+                    (version, name, checksum),
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.autocommit = True
+            done.append(version)
+        return done
+    finally:
+        try:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (_LOCK_KEY,))
+        except Exception:
+            pass
+        conn.close()
+
+
+def migration_status() -> list[dict]:
+    """One dict per migration file: version, name, applied_at (None when
+    pending) and modified (file changed since it was applied)."""
+    conn = _connect()
+    try:
+        cur = conn.cursor()
+        _ensure_version_table(cur)
+        conn.commit()
+        applied = _applied(cur)
+    finally:
+        conn.close()
+    rows = []
+    for version, name, path in discover_migrations():
+        with open(path, encoding='utf-8') as f:
+            checksum = _checksum(f.read())
+        checksum_applied, applied_at = applied.get(version, (None, None))
+        rows.append({
+            'version':    version,
+            'name':       name,
+            'applied_at': applied_at,
+            'modified':   checksum_applied is not None and checksum_applied != checksum,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+    command = sys.argv[1] if len(sys.argv) > 1 else 'up'
+    if command == 'status':
+        for row in migration_status():
+            state = row['applied_at'].strftime('%Y-%m-%d %H:%M') if row['applied_at'] else 'pending'
+            flag = '  (modified)' if row['modified'] else ''
+            print(f"{row['version']:04d}_{row['name']:<32} {state}{flag}")
+    elif command == 'up':
+        applied = migrate()
+        print(f"Applied {len(applied)} migration(s).")
+    else:
+        print(f"Unknown command: {command} (expected 'up' or 'status')")
+        sys.exit(1)
@@ -12,20 +12,6 @@ from . import get_db_connection
 logger = logging.getLogger(__name__)
 
 
-def _ensure_auto_exposure_column() -> None:
-    """Add auto_exposure column to obs.targets if not present (idempotent)."""
-    try:
-        with get_db_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                "ALTER TABLE obs.targets "
-                "ADD COLUMN IF NOT EXISTS auto_exposure BOOLEAN NOT NULL DEFAULT FALSE"
-            )
-            conn.commit()
-    except Exception as e:
-        logger.error("_ensure_auto_exposure_column: %s", e)
-
-
 def _parse_mag_value(value) -> float | None:
     """Parse a magnitude value that may be empty, None, or prefixed with '>'.
 
@@ -146,7 +132,6 @@ def _target_to_dict(row) -> dict:
 
 
 def get_observation_targets(active_only: bool = True) -> list[dict]:
-    _ensure_auto_exposure_column()
     with get_db_connection() as conn:
         cur = conn.cursor(cursor_factory=extras.RealDictCursor)
         if active_only:
@@ -204,7 +189,6 @@ def save_observation_target(name: str, ra: float, dec: float,
                 r = cur.fetchone()
                 create_by = r[0] if r else None
 
-            _ensure_auto_exposure_column()
             cur.execute(
                 "INSERT INTO obs.targets "
                 "(active, name, mag, ra, dec, telescope, program, priority, "
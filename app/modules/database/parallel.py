@@ -0,0 +1,87 @@
+"""Request-scoped parallel reads over the Kinder connection pool.
+
+A page that needs several independent reads can run them on separate pooled
+connections instead of one after another on a single connection:
+
+    results = run_parallel({
+        'full': lambda cur: ...,
+        'name': lambda cur: ...,
+    })
+
+Each task receives its own cursor and returns a value.  Fan-out per call is
+bounded, and the whole call has a deadline: every task's transaction carries a
+``statement_timeout`` equal to the time left, so a slow query is cancelled by
+the server rather than holding its connection after the request gave up.
+Tasks that fail or miss the deadline yield None.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from . import get_db_connection, get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+MAX_FAN_OUT      = 4      # concurrent connections one call may hold
+DEFAULT_DEADLINE = 3.0    # seconds
+_POOL_RESERVE    = 10     # leave this many connections for other requests
+
+
+def _run_task(key, fn, cursor_factory, stop_at):
+    remaining_ms = int((stop_at - time.monotonic()) * 1000)
+    if remaining_ms <= 0:
+        logger.warning("run_parallel: %s skipped, deadline passed", key)
+        return None
+    try:
+        with get_db_connection() as conn:
+            cur = conn.cursor(cursor_factory=cursor_factory) if cursor_factory else conn.cursor()
+            cur.execute("SET LOCAL statement_timeout = %s", (remaining_ms,))
+            return fn(cur)
+    except Exception as e:
+        logger.warning("run_parallel: %s failed: %s", key, e)
+        return None
+
+
+def _fan_out(n_tasks: int, max_workers: int) -> int:
+    """Workers for this call: at most max_workers, and 1 when the pool is
+    nearly exhausted so a burst of page loads cannot starve it."""
+    stats = get_pool_stats()
+    free = stats['pool_max'] - stats['in_use']
+    if stats['pool_max'] and free - _POOL_RESERVE < min(n_tasks, max_workers):
+        return 1
+    return max(1, min(n_tasks, max_workers))
+
+
+def run_parallel(tasks: dict, max_workers: int = MAX_FAN_OUT,
+                 deadline: float = DEFAULT_DEADLINE, cursor_factory=None) -> dict:
+    """Run {key: fn(cursor)} concurrently and return {key: result}.
+
+    Results for tasks that raised or did not finish within deadline seconds
+    are None.  With a single worker the tasks run in the calling thread.
+    """
+    if not tasks:
+        return {}
+    stop_at = time.monotonic() + deadline
+    workers = _fan_out(len(tasks), max_workers)
+
+    if workers == 1:
+        return {key: _run_task(key, fn, cursor_factory, stop_at)
+                for key, fn in tasks.items()}
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='parallel_load')
+    try:
+        futures = {key: pool.submit(_run_task, key, fn, cursor_factory, stop_at)
+                   for key, fn in tasks.items()}
+        wait(futures.values(), timeout=max(0.0, stop_at - time.monotonic()))
+        results = {}
+        for key, fut in futures.items():
+            if fut.done():
+                results[key] = fut.result()
+            else:
+                logger.warning("run_parallel: %s missed the %.1fs deadline", key, deadline)
+                results[key] = None
+        return results
+    finally:
+        # Do not block on stragglers; statement_timeout ends their queries.
+        pool.shutdown(wait=False, cancel_futures=True)
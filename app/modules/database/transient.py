@@ -5,67 +5,222 @@ All SQL targets the 'Kinder' database transient schema.
 Return values use backward-compatible column aliases matching legacy tns_objects.
 """
 
+import atexit
+import base64
+import hashlib
+import io
 import json
 import logging
+import math
 import os
 import re as _re
+import threading
 import time as _time
-from datetime import datetime, timezone
+from collections import OrderedDict, deque
+from datetime import date, datetime, timedelta, timezone
 from contextlib import contextmanager
 
+import numpy as np
 import psycopg2
 from psycopg2 import extras
 
-from . import get_db_connection, OBJECT_COMPAT_COLS
+from . import get_db_connection, OBJECT_COMPAT_COLS, OBJECT_DETAIL_COLS
 
 logger = logging.getLogger(__name__)
 
 _marshal_stats_cache = {'expires_at': 0.0, 'value': None}
 
+# search_objects_page() results keyed by the normalised filter; entries are
+# (expires_at, value).  Short TTL, so a status change shows up within
+# seconds even on workers that did not make it.
+_LISTING_CACHE_MAX = 256
+_listing_cache: OrderedDict = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
+# get_facet_counts() results, one entry per (facet, hash of the filters the
+# facet depends on); cleared together with the listing cache.
+_FACET_CACHE_MAX = 512
+_facet_cache: OrderedDict = OrderedDict()
+_facet_cache_lock = threading.Lock()
 
-def _ensure_cross_matches_flag_column(cur, conn=None):
-    try:
-        cur.execute(
-            "ALTER TABLE transient.cross_matches "
-            "ADD COLUMN IF NOT EXISTS flag BOOLEAN DEFAULT FALSE"
-        )
-        if conn is not None:
-            conn.commit()
-    except Exception as e:
-        if conn is not None:
-            conn.rollback()
-        logger.error("_ensure_cross_matches_flag_column: %s", e)
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Name → obj_id resolver cache.  Every TNSObjectDB helper and most routes
+# start by turning a display name into obj_id; within one page load the same
+# object is resolved a dozen times.  Resolved rows seed both the bare and
+# the prefixed name at once, misses are not cached,
+# and entries expire after _RESOLVER_TTL so renames/deletes made by other
+# worker processes are picked up without cross-process signalling.
+# Internal/other names are only cached once they resolved unambiguously.
+
+_RESOLVER_MAX = 20000
+_RESOLVER_TTL = 300.0
+_PREFIX_RE = _re.compile(r'^(?:AT|SN|FRB|TDE|EP)(.+)$')
+_resolver_cache: OrderedDict = OrderedDict()   # key -> (expires_at, obj_id)
+_resolver_keys: dict = {}                       # obj_id -> set(keys)
+_resolver_lock = threading.Lock()
+
+
+def _resolver_get(key: str) -> int | None:
+    with _resolver_lock:
+        hit = _resolver_cache.get(key)
+        if hit is None:
+            return None
+        if _time.monotonic() >= hit[0]:
+            _resolver_drop_key(key)
+            return None
+        _resolver_cache.move_to_end(key)
+        return hit[1]
+
+
+def _resolver_drop_key(key: str):
+    """Caller holds _resolver_lock."""
+    hit = _resolver_cache.pop(key, None)
+    if hit is not None:
+        keys = _resolver_keys.get(hit[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del _resolver_keys[hit[1]]
+
+
+def _name_aliases(name, name_prefix) -> set:
+    return {name, f"{name_prefix or ''}{name}"}
+
+
+def _row_aliases(name, name_prefix, internal_name, other_name) -> set:
+    aliases = _name_aliases(name, name_prefix)
+    for field in (internal_name, other_name):
+        for alias in _re.split(r'[,;]', field or ''):
+            alias = alias.strip()
+            if alias:
+                aliases.add(alias)
+    return aliases
+
+
+def _resolver_store(obj_id: int, aliases):
+    expires_at = _time.monotonic() + _RESOLVER_TTL
+    with _resolver_lock:
+        for key in aliases:
+            if key in _resolver_cache:
+                _resolver_drop_key(key)
+            _resolver_cache[key] = (expires_at, obj_id)
+            _resolver_keys.setdefault(obj_id, set()).add(key)
+        while len(_resolver_cache) > _RESOLVER_MAX:
+            key, _ = next(iter(_resolver_cache.items()))
+            _resolver_drop_key(key)
+
+
+def invalidate_resolver(obj_ids=None, names=None):
+    """Forget cached resolutions for the given objects / names (everything
+    when both are None).  Call after inserting, renaming or deleting objects."""
+    with _resolver_lock:
+        if obj_ids is None and names is None:
+            _resolver_cache.clear()
+            _resolver_keys.clear()
+            return
+        for obj_id in obj_ids or ():
+            for key in list(_resolver_keys.get(obj_id, ())):
+                _resolver_drop_key(key)
+        for name in names or ():
+            obj_id = _resolver_cache.get(name, (None, None))[1]
+            if obj_id is not None:
+                for key in list(_resolver_keys.get(obj_id, ())):
+                    _resolver_drop_key(key)
+
+
+def _name_candidates(name: str) -> list[str]:
+    m = _PREFIX_RE.match(name)
+    return [name, m.group(1)] if m else [name]
+
+
+def resolve_many(names, cur=None) -> dict:
+    """Resolve display names (bare, prefixed or internal) to obj_id in at most
+    two queries for all cache misses.  Returns {input_name: obj_id}; names
+    that match nothing (or an ambiguous internal name) are omitted."""
+    result = {}
+    missing = []
+    for name in dict.fromkeys(n.strip() for n in names if n and n.strip()):
+        obj_id = _resolver_get(name)
+        if obj_id is not None:
+            result[name] = obj_id
+        else:
+            missing.append(name)
+    if not missing:
+        return result
+
+    if cur is None:
+        with get_db_connection() as conn:
+            result.update(_resolve_missing(conn.cursor(), missing))
+    else:
+        result.update(_resolve_missing(cur, missing))
+    return result
+
+
+def _resolve_missing(cur, missing: list[str]) -> dict:
+    found = {}
+    candidates = sorted({c for n in missing for c in _name_candidates(n)})
+    cur.execute(
+        "SELECT obj_id, name, name_prefix FROM transient.objects WHERE name = ANY(%s)",
+        (candidates,)
+    )
+    by_name = {}
+    for obj_id, name, prefix in cur.fetchall():
+        by_name[name] = obj_id
+        _resolver_store(obj_id, _name_aliases(name, prefix))
+    for n in missing:
+        for c in _name_candidates(n):
+            if c in by_name:
+                found[n] = by_name[c]
+                break
+
+    # Remaining names may be survey designations (ATLAS26abc, ZTF26aaxyz):
+    # match them as whole aliases in the trigram-indexed search_text.
+    rest = [n for n in missing if n not in found]
+    if rest:
+        patterns = [f"%|{_like_escape(_normalize_search_term(n))}|%" for n in rest]
+        cur.execute(
+            "SELECT obj_id, name, name_prefix, internal_name, other_name "
+            "FROM transient.objects WHERE search_text LIKE ANY(%s)",
+            (patterns,)
+        )
+        owners: dict = {}
+        for obj_id, name, prefix, internal, other in cur.fetchall():
+            norm = {_normalize_search_term(a)
+                    for a in _row_aliases(name, prefix, internal, other)}
+            for n in rest:
+                if _normalize_search_term(n) in norm:
+                    owners.setdefault(n, set()).add(obj_id)
+        for n, ids in owners.items():
+            if len(ids) == 1:
+                found[n] = next(iter(ids))
+                _resolver_store(found[n], {n})
+    return found
+
+
 def _resolve_obj_id(cur, name: str) -> int | None:
     """Return obj_id for a given object name (bare name without prefix)."""
+    obj_id = _resolver_get(name)
+    if obj_id is not None:
+        return obj_id
     cur.execute(
-        "SELECT obj_id FROM transient.objects WHERE name = %s LIMIT 1",
+        "SELECT obj_id, name, name_prefix FROM transient.objects WHERE name = %s LIMIT 1",
         (name,)
     )
     row = cur.fetchone()
-    return row[0] if row else None
+    if not row:
+        return None
+    _resolver_store(row[0], _name_aliases(row[1], row[2]))
+    return row[0]
 
 
 def _resolve_obj_id_with_prefix(cur, name: str) -> int | None:
-    """Return obj_id for name, handling optional AT/SN/… prefix in a single query."""
-    m = _re.match(r'^(?:AT|SN|FRB|TDE|EP)(.+)$', name)
-    bare = m.group(1) if m else None
-    if bare:
-        cur.execute(
-            "SELECT obj_id FROM transient.objects WHERE name = %s OR name = %s LIMIT 1",
-            (name, bare)
-        )
-    else:
-        cur.execute(
-            "SELECT obj_id FROM transient.objects WHERE name = %s LIMIT 1",
-            (name,)
-        )
-    row = cur.fetchone()
-    return row[0] if row else None
+    """Return obj_id for name, handling optional AT/SN/… prefix and internal
+    names; served from the resolver cache when possible."""
+    return resolve_many([name], cur).get(name.strip()) if name else None
 
 
 def _mjd_update(cur, obj_id: int, mjd: float):
@@ -81,6 +236,108 @@ def _mjd_update(cur, obj_id: int, mjd: float):
     )
 
 
+# ---------------------------------------------------------------------------
+# Bulk photometry ingest  (COPY → temp staging table → set-based merge)
+# ---------------------------------------------------------------------------
+
+_PHOT_STAGE_COLS = ('obj_id', 'name', '"MJD"', 'mag', 'mag_err', 'filter', 'source')
+
+
+def _copy_field(value) -> str:
+    """Encode one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, float):
+        return 'NaN' if math.isnan(value) else repr(value)
+    if isinstance(value, (int, bool)):
+        return str(int(value))
+    text = str(value)
+    return (text.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _merge_photometry_rows(cur, rows, reactivate_finished: bool = False) -> int:
+    """Ingest photometry rows in one COPY plus one merge statement.
+
+    rows: iterable of (obj_id, name, mjd, mag, mag_err, filter, source).
+    obj_id may be None, in which case it is resolved from the exact name.
+    Negative (unphysical) magnitudes are dropped; duplicates of phot_uniq are
+    skipped.  For every object that gained a newer point, last_phot_date is
+    advanced and Snoozed objects return to Inbox (and, with
+    reactivate_finished, Finish goes back to Follow-up) in the same statement.
+    The caller commits.  Returns the number of points inserted."""
+    buf = io.StringIO()
+    n = 0
+    for row in rows:
+        buf.write('\t'.join(_copy_field(v) for v in row))
+        buf.write('\n')
+        n += 1
+    if not n:
+        return 0
+    buf.seek(0)
+
+    cur.execute(
+        'CREATE TEMP TABLE IF NOT EXISTS phot_stage ('
+        '  obj_id BIGINT, name TEXT, "MJD" DOUBLE PRECISION, mag DOUBLE PRECISION,'
+        '  mag_err DOUBLE PRECISION, filter TEXT, source TEXT'
+        ') ON COMMIT DROP'
+    )
+    cur.execute('TRUNCATE phot_stage')
+    cur.copy_expert(
+        f"COPY phot_stage ({', '.join(_PHOT_STAGE_COLS)}) FROM STDIN", buf
+    )
+    cur.execute(
+        "UPDATE phot_stage s SET obj_id = o.obj_id "
+        "FROM transient.objects o "
+        "WHERE s.obj_id IS NULL AND o.name = s.name"
+    )
+    finish_clause = "WHEN o.status = 'Finish' THEN 'Follow-up' " if reactivate_finished else ''
+    cur.execute(
+        'WITH ins AS ('
+        '  INSERT INTO transient.photometry '
+        '    (obj_id, name, "MJD", mag, mag_err, filter, source) '
+        '  SELECT obj_id, name, "MJD", mag, mag_err, filter, source '
+        '  FROM phot_stage '
+        '  WHERE obj_id IS NOT NULL AND "MJD" IS NOT NULL '
+        '    AND (mag IS NULL OR mag >= 0) '
+        # The change_seq row trigger locks each parent objects row; inserting
+        # in obj_id order keeps concurrent ingests from deadlocking.
+        '  ORDER BY obj_id '
+        '  ON CONFLICT ON CONSTRAINT phot_uniq DO NOTHING '
+        '  RETURNING obj_id, "MJD"'
+        '), latest AS ('
+        '  SELECT obj_id, MAX("MJD") AS mjd FROM ins GROUP BY obj_id'
+        '), upd AS ('
+        '  UPDATE transient.objects o '
+        '  SET last_phot_date = l.mjd, '
+        "      status = CASE WHEN o.status = 'Snoozed' THEN 'Inbox' "
+        + finish_clause +
+        '                    ELSE o.status END '
+        '  FROM latest l '
+        '  WHERE o.obj_id = l.obj_id '
+        '    AND (o.last_phot_date IS NULL OR o.last_phot_date < l.mjd) '
+        '  RETURNING o.obj_id'
+        ') '
+        'SELECT (SELECT COUNT(*) FROM ins), (SELECT COUNT(*) FROM upd), '
+        '       ARRAY(SELECT DISTINCT obj_id FROM ins)'
+    )
+    inserted, advanced, touched = cur.fetchone()
+    cur.execute('TRUNCATE phot_stage')
+    superseded = _mark_superseded(cur, touched)
+    logger.debug("_merge_photometry_rows: staged=%d inserted=%d objects_advanced=%d "
+                 "superseded_changed=%d", n, inserted, advanced, superseded)
+    return int(inserted)
+
+
+def _mark_superseded(cur, obj_ids) -> int:
+    """Re-mark TNS duplicates (photometry.superseded_by, migration 0016) for
+    obj_ids; returns the number of points whose mark changed."""
+    if not obj_ids:
+        return 0
+    cur.execute("SELECT transient.mark_superseded_photometry(%s)", (sorted(obj_ids),))
+    return cur.fetchone()[0] or 0
+
+
 def _clean_spectrum_source_name(raw: str | None) -> str:
     text = str(raw or '').strip()
     if not text:
@@ -260,57 +517,197 @@ def _resolve_spectrum_source_and_mjd(
 
 
 # ---------------------------------------------------------------------------
-# Kinder ID helpers  (year * 1_000_000 + letter_rank)
+# Packed spectrum arrays  (transient.spectra)
 # ---------------------------------------------------------------------------
 
-_KINDER_NAME_RE = _re.compile(r'^(\d{4})([a-z]+)$')
+_SPECTRUM_DTYPE = np.dtype('<f8')
+
+
+def _pack_spectrum(wavelength_data, intensity_data) -> tuple[np.ndarray, np.ndarray]:
+    """Return (wavelength, intensity) as float64 arrays sorted by wavelength.
+    Samples with a missing wavelength are dropped; missing intensities become NaN."""
+    wl = np.asarray([np.nan if w is None else w for w in wavelength_data], dtype=np.float64)
+    it = np.asarray([np.nan if v is None else v for v in intensity_data], dtype=np.float64)
+    n = min(wl.size, it.size)
+    wl, it = wl[:n], it[:n]
+    keep = ~np.isnan(wl)
+    wl, it = wl[keep], it[keep]
+    order = np.argsort(wl, kind='stable')
+    return wl[order], it[order]
+
+
+def _unpack_spectrum_array(buf) -> np.ndarray:
+    """Decode a BYTEA column written by _pack_spectrum (read-only, zero-copy view)."""
+    if buf is None:
+        return np.empty(0, dtype=np.float64)
+    return np.frombuffer(buf, dtype=_SPECTRUM_DTYPE)
+
+
+def _spectrum_meta(item: dict) -> dict:
+    """Add the display/identity keys shared by every spectrum record."""
+    source_name = item.pop('source_name', '')
+    observation_mjd = item.get('observation_mjd')
+    item['telescope'] = source_name or 'Unknown'
+    item['phase'] = _phase_from_stored_value(observation_mjd)
+    item['spectrum_id'] = _build_spectrum_id(source_name, observation_mjd)
+    item['spectrum_label'] = _build_spectrum_label(source_name, observation_mjd)
+    item['observation_date_label'] = _format_spectrum_observation_label(observation_mjd)
+    return item
+
+
+def _fetch_spectrum_records(cur, obj_id: int | None = None,
+                            source_name: str | None = None,
+                            observation_mjd: float | None = None) -> list[dict]:
+    """Return one record per spectrum with NumPy wavelength/intensity arrays.
+
+    Reads transient.spectra first and falls back to spectra that still live in
+    the legacy per-sample transient.spectroscopy table (aggregated server-side
+    so each spectrum is still a single row)."""
+    where, params = [], []
+    if obj_id is not None:
+        where.append('obj_id = %s')
+        params.append(obj_id)
+    if source_name is not None:
+        where.append('source = %s')
+        params.append(source_name)
+    if observation_mjd is not None:
+        where.append('ABS("MJD" - %s) < 1e-6')
+        params.append(observation_mjd)
+    where_sql = ('WHERE ' + ' AND '.join(where)) if where else ''
 
+    cur.execute(
+        'SELECT obj_id, name AS object_name, source AS source_name, '
+        '"MJD" AS observation_mjd, wavelength, intensity '
+        'FROM transient.spectra ' + where_sql +
+        ' ORDER BY "MJD" DESC NULLS LAST, spectra_id DESC',
+        params
+    )
+    records, seen = [], set()
+    for row in cur.fetchall():
+        obj, name, src, mjd, wl, it = row
+        seen.add((obj, src, mjd))
+        records.append({
+            'object_name': name, 'source_name': src, 'observation_mjd': mjd,
+            'wavelength': _unpack_spectrum_array(wl),
+            'intensity': _unpack_spectrum_array(it),
+        })
 
-def _tns_name_to_kinder_id(name: str) -> int | None:
-    """Convert TNS name → internal kinder_id.
+    cur.execute(
+        'SELECT obj_id, MIN(name) AS object_name, source AS source_name, '
+        '"MJD" AS observation_mjd, '
+        'array_agg(wavelength ORDER BY wavelength), '
+        'array_agg(intensity ORDER BY wavelength) '
+        'FROM transient.spectroscopy ' + where_sql +
+        ' GROUP BY obj_id, source, "MJD" ORDER BY "MJD" DESC NULLS LAST',
+        params
+    )
+    for row in cur.fetchall():
+        obj, name, src, mjd, wl, it = row
+        if (obj, src, mjd) in seen:
+            continue
+        records.append({
+            'object_name': name, 'source_name': src, 'observation_mjd': mjd,
+            'wavelength': np.asarray(wl, dtype=np.float64),
+            'intensity': np.asarray(it, dtype=np.float64),
+        })
+    return [_spectrum_meta(r) for r in records]
+
+
+def migrate_legacy_spectroscopy(obj_limit: int | None = None) -> int:
+    """Move per-sample transient.spectroscopy rows into transient.spectra.
+
+    Works one object per transaction: the object's spectra are packed and
+    inserted, then its legacy rows are deleted.  A spectrum already present in
+    transient.spectra (e.g. re-uploaded since) wins over the legacy copy.
+    Returns the number of spectra processed.  Safe to re-run."""
+    migrated = 0
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            'SELECT DISTINCT obj_id FROM transient.spectroscopy ORDER BY obj_id'
+            + (' LIMIT %s' if obj_limit else ''),
+            (obj_limit,) if obj_limit else None
+        )
+        obj_ids = [r[0] for r in cur.fetchall()]
+        for obj_id in obj_ids:
+            try:
+                cur.execute(
+                    'SELECT MIN(name), source, "MJD", '
+                    'array_agg(wavelength ORDER BY wavelength), '
+                    'array_agg(intensity ORDER BY wavelength), '
+                    'MIN(permission), MIN(groups::text)::int[] '
+                    'FROM transient.spectroscopy WHERE obj_id = %s '
+                    'GROUP BY source, "MJD"',
+                    (obj_id,)
+                )
+                for name, src, mjd, wl, it, perm, grps in cur.fetchall():
+                    wl_arr, it_arr = _pack_spectrum(wl, it)
+                    _upsert_spectrum(cur, obj_id, name, src or 'Unknown', mjd,
+                                     wl_arr, it_arr, perm or 'default', grps or [],
+                                     overwrite=False)
+                    migrated += 1
+                cur.execute("DELETE FROM transient.spectroscopy WHERE obj_id = %s", (obj_id,))
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error("migrate_legacy_spectroscopy: obj_id=%s %s", obj_id, e)
+    return migrated
+
+
+def _upsert_spectrum(cur, obj_id: int, name: str, source: str, mjd: float,
+                     wl: np.ndarray, it: np.ndarray,
+                     permission: str = 'default', groups=None, overwrite: bool = True):
+    """Write one packed spectrum row.  Re-uploading the same (object, source,
+    MJD) replaces the samples unless overwrite=False."""
+    on_conflict = (
+        'DO UPDATE SET '
+        '  name = EXCLUDED.name, n_points = EXCLUDED.n_points, '
+        '  min_wavelength = EXCLUDED.min_wavelength, '
+        '  max_wavelength = EXCLUDED.max_wavelength, '
+        '  wavelength = EXCLUDED.wavelength, intensity = EXCLUDED.intensity'
+        if overwrite else 'DO NOTHING'
+    )
+    cur.execute(
+        'INSERT INTO transient.spectra '
+        '(obj_id, name, source, "MJD", n_points, min_wavelength, max_wavelength, '
+        ' wavelength, intensity, permission, groups) '
+        'VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s) '
+        'ON CONFLICT (obj_id, source, "MJD") ' + on_conflict,
+        (
+            obj_id, name, source, mjd, int(wl.size),
+            float(wl[0]) if wl.size else None,
+            float(wl[-1]) if wl.size else None,
+            psycopg2.Binary(wl.astype(_SPECTRUM_DTYPE, copy=False).tobytes()),
+            psycopg2.Binary(it.astype(_SPECTRUM_DTYPE, copy=False).tobytes()),
+            permission, list(groups or []),
+        )
+    )
 
-    Examples:
-      '2024ggi' → 2024_004923   (rank of 'ggi': 7*676+7*26+9 = 4923)
-      '2026zzzz' → 2026_475254  (rank of 'zzzz': 26+676+17576+456976)
-    Formula: year * 1_000_000 + sum((ord(c)-96) * 26^i
-                                    for i,c in enumerate(reversed(suffix)))
-    """
-    m = _KINDER_NAME_RE.match(name)
-    if not m:
-        return None
-    year   = int(m.group(1))
-    suffix = m.group(2)
-    rank   = sum((ord(c) - 96) * (26 ** i) for i, c in enumerate(reversed(suffix)))
-    return year * 1_000_000 + rank
 
+# ---------------------------------------------------------------------------
+# Kinder ID helpers  (year * 1_000_000 + letter_rank)
+# ---------------------------------------------------------------------------
+# kinder_id is assigned by PostgreSQL: the objects_kinder_id trigger calls
+# transient.kinder_id_from_name() on insert / rename (migration 0010), e.g.
+#   '2024ggi' → 2024_004923   (rank of 'ggi': 7*676+7*26+9 = 4923)
+#   '2026zzzz' → 2026_475254  (rank of 'zzzz': 26+676+17576+456976)
 
 def sync_kinder_ids() -> int:
-    """Compute and write kinder_id for all rows where it is NULL.
-    Handles both lowercase multi-letter ('2026aa') and uppercase single-letter ('2026A') names.
-    Returns the number of rows updated.
+    """Verify that every TNS-style name has a kinder_id.
+
+    The trigger makes this a no-op; rows that predate it (or were written
+    with the trigger disabled) are fixed by transient.backfill_kinder_ids()
+    in one statement.  Returns the number of rows updated.
     """
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            cur.execute(
-                "SELECT obj_id, name FROM transient.objects "
-                "WHERE kinder_id IS NULL AND name ~ '^[0-9]{4}[a-zA-Z]+$'"
-            )
-            updates = []
-            for obj_id, name in cur.fetchall():
-                # _tns_name_to_kinder_id uses lowercase-only regex; handle uppercase here
-                kid = _tns_name_to_kinder_id(name) or _tns_name_to_kinder_id(name.lower())
-                if kid is not None:
-                    updates.append((kid, obj_id))
-            if updates:
-                extras.execute_batch(
-                    cur,
-                    "UPDATE transient.objects SET kinder_id = %s WHERE obj_id = %s",
-                    updates,
-                    page_size=1000,
-                )
-                conn.commit()
-            return len(updates)
+            cur.execute("SELECT transient.backfill_kinder_ids()")
+            n = cur.fetchone()[0]
+            conn.commit()
+        if n:
+            logger.warning("sync_kinder_ids: backfilled %d kinder_ids missed at insert", n)
+        return n
     except Exception as e:
         logger.error("sync_kinder_ids: %s", e)
         return 0
@@ -356,23 +753,6 @@ def update_download_log(log_id: int, status: str,
         logger.error("update_download_log: %s", e)
 
 
-def _ensure_tns_update_audit_table(cur):
-    cur.execute(
-        "CREATE TABLE IF NOT EXISTS transient.tns_update_audit ("
-        "audit_id BIGSERIAL PRIMARY KEY, "
-        "obj_id BIGINT NOT NULL, "
-        "name TEXT NOT NULL, "
-        "changed_fields TEXT[] NOT NULL DEFAULT '{}', "
-        "source TEXT NOT NULL DEFAULT 'tns_sync', "
-        "updated_at TIMESTAMPTZ NOT NULL DEFAULT now()"
-        ")"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_tns_update_audit_updated_at "
-        "ON transient.tns_update_audit(updated_at DESC)"
-    )
-
-
 def log_tns_update_batch(rows: list[tuple[int, str, list[str], str]]):
     """rows: (obj_id, name, changed_fields, source)."""
     if not rows:
@@ -380,7 +760,6 @@ def log_tns_update_batch(rows: list[tuple[int, str, list[str], str]]):
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            _ensure_tns_update_audit_table(cur)
             extras.execute_batch(
                 cur,
                 "INSERT INTO transient.tns_update_audit (obj_id, name, changed_fields, source) "
@@ -393,10 +772,222 @@ def log_tns_update_batch(rows: list[tuple[int, str, list[str], str]]):
         logger.error("log_tns_update_batch: %s", e)
 
 
+# ---------------------------------------------------------------------------
+# Object view write-behind buffer
+# ---------------------------------------------------------------------------
+
+# Page views are queued in memory and written by a per-process flusher
+# thread every _VIEW_FLUSH_INTERVAL seconds: one multi-row insert into
+# object_views_detail and one aggregated counts = counts + n upsert per
+# object.  The queue is bounded; when the database falls behind, new views
+# are dropped (and counted) rather than growing memory or blocking requests.
+_VIEW_QUEUE_MAX = 10000
+_VIEW_FLUSH_INTERVAL = 5.0
+
+_view_queue: deque = deque()
+_view_lock = threading.Lock()
+_view_wakeup = threading.Event()
+_view_thread: threading.Thread | None = None
+_view_stats = {'enqueued': 0, 'dropped': 0, 'written': 0, 'failed': 0,
+               'flushes': 0, 'last_flush': None}
+
+
+def _start_view_flusher():
+    global _view_thread
+    if _view_thread is not None and _view_thread.is_alive():
+        return
+    _view_thread = threading.Thread(target=_view_flush_loop, daemon=True,
+                                    name='object_view_flush')
+    _view_thread.start()
+
+
+def _view_flush_loop():
+    while True:
+        _view_wakeup.wait(_VIEW_FLUSH_INTERVAL)
+        _view_wakeup.clear()
+        try:
+            flush_object_views()
+        except Exception as e:
+            logger.error("object view flush: %s", e)
+
+
+def enqueue_object_view(object_name: str, user_email: str | None = None) -> bool:
+    """Queue one page view.  Returns False if the buffer was full."""
+    with _view_lock:
+        if len(_view_queue) >= _VIEW_QUEUE_MAX:
+            _view_stats['dropped'] += 1
+            return False
+        _view_queue.append((object_name, user_email or None, datetime.now(timezone.utc)))
+        _view_stats['enqueued'] += 1
+        if _view_thread is None or not _view_thread.is_alive():
+            _start_view_flusher()
+    return True
+
+
+def flush_object_views() -> int:
+    """Write every queued view in one transaction; returns rows written."""
+    with _view_lock:
+        if not _view_queue:
+            return 0
+        batch = list(_view_queue)
+        _view_queue.clear()
+    try:
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            ids = resolve_many({name for name, _, _ in batch}, cur)
+            emails = sorted({email for _, email, _ in batch if email})
+            usr_ids = {}
+            if emails:
+                cur.execute("SELECT email, usr_id FROM auth.users WHERE email = ANY(%s)", (emails,))
+                usr_ids = dict(cur.fetchall())
+
+            detail = []
+            per_obj = {}
+            for name, email, ts in batch:
+                obj_id = ids.get(name.strip())
+                if obj_id is None:
+                    continue
+                detail.append((obj_id, name, usr_ids.get(email), ts))
+                _, n, last = per_obj.get(obj_id, (name, 0, ts))
+                per_obj[obj_id] = (name, n + 1, max(last, ts))
+            if detail:
+                extras.execute_values(
+                    cur,
+                    "INSERT INTO transient.object_views_detail (obj_id, name, usr_id, view_time) "
+                    "VALUES %s",
+                    detail, page_size=1000,
+                )
+                # Sorted so concurrent flushes from other workers lock rows
+                # in the same order.
+                extras.execute_values(
+                    cur,
+                    "INSERT INTO transient.object_views (obj_id, name, counts, last_view) "
+                    "VALUES %s "
+                    "ON CONFLICT (obj_id) DO UPDATE "
+                    "SET counts = transient.object_views.counts + EXCLUDED.counts, "
+                    "    last_view = GREATEST(transient.object_views.last_view, EXCLUDED.last_view)",
+                    [(obj_id,) + per_obj[obj_id] for obj_id in sorted(per_obj)],
+                    page_size=1000,
+                )
+            conn.commit()
+    except Exception as e:
+        logger.error("flush_object_views (%d views lost): %s", len(batch), e)
+        with _view_lock:
+            _view_stats['failed'] += len(batch)
+        return 0
+    with _view_lock:
+        _view_stats['written'] += len(detail)
+        _view_stats['flushes'] += 1
+        _view_stats['last_flush'] = datetime.now(timezone.utc).isoformat()
+    return len(detail)
+
+
+def get_view_log_stats() -> dict:
+    """Counters for the view buffer: enqueued, dropped (queue full), written,
+    failed (flush errors), flushes, last_flush and the current queue depth."""
+    with _view_lock:
+        return dict(_view_stats, queued=len(_view_queue), queue_max=_VIEW_QUEUE_MAX)
+
+
+atexit.register(flush_object_views)
+
+# Detail partitions older than this are dropped; the daily rollups are kept.
+VIEW_DETAIL_RETENTION_DAYS = 180
+_VIEW_PARTITION_RE = _re.compile(r'^object_views_detail_p(\d{4})(\d{2})$')
+
+
+def _month_start(d: date, months: int = 0) -> date:
+    m = d.year * 12 + d.month - 1 + months
+    return date(m // 12, m % 12 + 1, 1)
+
+
+def _rollup_object_views(cur, since: date | None = None, until: date | None = None):
+    """Recompute transient.object_views_daily for the UTC days in
+    [since, until) (open-ended when None) from the detail partitions."""
+    cur.execute("""
+        INSERT INTO transient.object_views_daily (day, obj_id, views, unique_users)
+        SELECT (view_time AT TIME ZONE 'UTC')::date, obj_id,
+               COUNT(*), COUNT(DISTINCT usr_id)
+          FROM transient.object_views_detail
+         WHERE (%(since)s::date IS NULL OR view_time >= %(since)s::timestamp AT TIME ZONE 'UTC')
+           AND (%(until)s::date IS NULL OR view_time <  %(until)s::timestamp AT TIME ZONE 'UTC')
+         GROUP BY 1, 2
+        ON CONFLICT (day, obj_id) DO UPDATE
+           SET views = EXCLUDED.views, unique_users = EXCLUDED.unique_users
+    """, {'since': since, 'until': until})
+
+
+def rollup_object_views(days: int = 2):
+    """Refresh transient.object_views_daily for the last `days` UTC days
+    (today included).  Scheduled hourly; idempotent."""
+    flush_object_views()
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        _rollup_object_views(cur, since=since)
+        conn.commit()
+
+
+def maintain_object_view_partitions(retention_days: int = VIEW_DETAIL_RETENTION_DAYS,
+                                    months_ahead: int = 2) -> list[str]:
+    """Create upcoming monthly detail partitions and drop the ones that
+    ended more than retention_days ago, rolling each up one last time
+    before it goes.  Rows stranded in the DEFAULT partition are moved into
+    their month by ensure_view_partitions() (migration 0019); any left
+    before the cutoff are deleted (the hourly rollup already counted them).
+    Returns the names of the dropped partitions."""
+    cutoff = datetime.now(timezone.utc).date() - timedelta(days=retention_days)
+    dropped = []
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT transient.ensure_view_partitions(NULL, %s)", (months_ahead,))
+        cutoff_month = _month_start(cutoff, 0)
+        cur.execute(
+            "DELETE FROM transient.object_views_detail_default "
+            "WHERE view_time < %s::timestamp AT TIME ZONE 'UTC'",
+            (cutoff_month,)
+        )
+        cur.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'transient.object_views_detail'::regclass"
+        )
+        for (relname,) in sorted(cur.fetchall()):
+            m = _VIEW_PARTITION_RE.match(relname)
+            if not m:
+                continue
+            start = date(int(m.group(1)), int(m.group(2)), 1)
+            end = _month_start(start, 1)
+            if end > cutoff:
+                continue
+            _rollup_object_views(cur, since=start, until=end)
+            cur.execute(f"DROP TABLE transient.{relname}")
+            dropped.append(relname)
+        conn.commit()
+    if dropped:
+        logger.info("maintain_object_view_partitions: dropped %s", ', '.join(dropped))
+    return dropped
+
+
 # ---------------------------------------------------------------------------
 # TNSObjectDB — photometry, spectroscopy, comments, object views
 # ---------------------------------------------------------------------------
 
+# Rows per FETCH for the streaming photometry iterator.
+PHOT_STREAM_ITERSIZE = 5000
+
+# TNS duplicates (superseded_by, migration 0016) are hidden.  With a source
+# allow-list a duplicate stays visible when its superseding point is not
+# (one %s: the allowed sources).
+_NOT_SUPERSEDED_SQL = "superseded_by IS NULL"
+_NOT_SUPERSEDED_FOR_SQL = (
+    "(superseded_by IS NULL OR NOT EXISTS ("
+    "SELECT 1 FROM transient.photometry sp "
+    "WHERE sp.phot_id = photometry.superseded_by "
+    "AND COALESCE(sp.source, 'Unknown') = ANY(%s)))"
+)
+
+
 class TNSObjectDB:
 
     @staticmethod
@@ -431,6 +1022,7 @@ class TNSObjectDB:
             phot_id = row[0] if row else None
             if phot_id:
                 _mjd_update(cur, obj_id, mjd)
+                _mark_superseded(cur, [obj_id])
             conn.commit()
         return phot_id
 
@@ -443,82 +1035,30 @@ class TNSObjectDB:
             obj_id = _resolve_obj_id_with_prefix(cur, object_name)
             if obj_id is None:
                 return 0
-            inserted = 0
-            max_mjd = None
-            for p in points:
-                mag = p.get('magnitude')
-                # Skip negative apparent magnitudes
-                if mag is not None:
-                    try:
-                        if float(mag) < 0:
-                            continue
-                    except (TypeError, ValueError):
-                        pass
-                cur.execute(
-                    "INSERT INTO transient.photometry "
-                    "(obj_id, name, \"MJD\", mag, mag_err, filter, source) "
-                    "VALUES (%s,%s,%s,%s,%s,%s,%s) "
-                    "ON CONFLICT ON CONSTRAINT phot_uniq DO NOTHING "
-                    "RETURNING phot_id",
-                    (obj_id, object_name, p['mjd'],
-                     p.get('magnitude'), p.get('magnitude_error'),
-                     p.get('filter'),
-                     p.get('telescope', p.get('source', 'Unknown')))
-                )
-                if cur.fetchone():
-                    inserted += 1
-                    if max_mjd is None or p['mjd'] > max_mjd:
-                        max_mjd = p['mjd']
-            if max_mjd is not None:
-                _mjd_update(cur, obj_id, max_mjd)
+            inserted = _merge_photometry_rows(cur, (
+                (obj_id, object_name, p['mjd'],
+                 p.get('magnitude'), p.get('magnitude_error'),
+                 p.get('filter'),
+                 p.get('telescope', p.get('source', 'Unknown')))
+                for p in points
+            ))
             conn.commit()
         return inserted
 
     @staticmethod
-    def add_photometry_bulk(photometry_data):
-        """Bulk insert: list of (object_name, mjd, magnitude, mag_err, filter, telescope)."""
+    def add_photometry_bulk(photometry_data) -> int:
+        """Bulk insert: list of (object_name, mjd, magnitude, mag_err, filter, telescope).
+        Streams through COPY; see _merge_photometry_rows.  Returns points inserted."""
         if not photometry_data:
-            return
+            return 0
         with get_db_connection() as conn:
             cur = conn.cursor()
-            # Resolve names to obj_ids in bulk
-            names = list({row[0] for row in photometry_data})
-            cur.execute(
-                "SELECT name, obj_id FROM transient.objects WHERE name = ANY(%s)",
-                (names,)
-            )
-            name_map = {r[0]: r[1] for r in cur.fetchall()}
-            rows = []
-            max_mjd_by_oid: dict = {}
-            for row in photometry_data:
-                oid = name_map.get(row[0])
-                if oid:
-                    mag = row[2]
-                    # Skip negative apparent magnitudes
-                    if mag is not None:
-                        try:
-                            if float(mag) < 0:
-                                continue
-                        except (TypeError, ValueError):
-                            pass
-                    mjd = row[1]
-                    rows.append((oid, row[0], mjd, mag, row[3], row[4], row[5]))
-                    if oid not in max_mjd_by_oid or mjd > max_mjd_by_oid[oid]:
-                        max_mjd_by_oid[oid] = mjd
-            if rows:
-                extras.execute_batch(
-                    cur,
-                    "INSERT INTO transient.photometry "
-                    "(obj_id, name, \"MJD\", mag, mag_err, filter, source) "
-                    "VALUES (%s,%s,%s,%s,%s,%s,%s) "
-                    "ON CONFLICT ON CONSTRAINT phot_uniq DO NOTHING",
-                    rows,
-                    page_size=1000
-                )
-                # Update last_phot_date and un-snooze for each affected object
-                for oid, max_mjd in max_mjd_by_oid.items():
-                    _mjd_update(cur, oid, max_mjd)
+            inserted = _merge_photometry_rows(cur, (
+                (None, row[0], row[1], row[2], row[3], row[4], row[5])
+                for row in photometry_data
+            ))
             conn.commit()
+        return inserted
 
     @staticmethod
     def sync_last_photometry_date(object_name: str):
@@ -533,8 +1073,9 @@ class TNSObjectDB:
             )
             max_mjd = cur.fetchone()[0]
             cur.execute(
-                "UPDATE transient.objects SET last_phot_date = %s WHERE obj_id = %s",
-                (max_mjd, obj_id)
+                "UPDATE transient.objects SET last_phot_date = %s "
+                "WHERE obj_id = %s AND last_phot_date IS DISTINCT FROM %s",
+                (max_mjd, obj_id, max_mjd)
             )
             conn.commit()
 
@@ -547,7 +1088,8 @@ class TNSObjectDB:
                 return []
             cur.execute(
                 'SELECT phot_id AS id, name AS object_name, "MJD" AS mjd, '
-                'mag AS magnitude, mag_err AS magnitude_error, filter, source AS telescope '
+                'mag AS magnitude, mag_err AS magnitude_error, filter, source AS telescope, '
+                'superseded_by '
                 'FROM transient.photometry WHERE obj_id = %s '
                 'AND (mag IS NULL OR mag >= 0) '
                 'ORDER BY "MJD" ASC',
@@ -555,12 +1097,180 @@ class TNSObjectDB:
             )
             return [dict(r) for r in cur.fetchall()]
 
+    @staticmethod
+    def drop_superseded(points: list[dict]) -> list[dict]:
+        """Drop the TNS duplicates among get_photometry() rows whose
+        superseding point is itself in *points* (i.e. survived the caller's
+        source-permission filter), and strip the superseded_by key."""
+        kept_ids = {p.get('id') for p in points}
+        out = []
+        for p in points:
+            if p.pop('superseded_by', None) not in kept_ids:
+                out.append(p)
+        return out
+
+    @staticmethod
+    def get_photometry_sources(object_name: str) -> list[str]:
+        """Distinct photometry sources of an object ('Unknown' for NULL), the
+        keys filter_by_source_permissions() works on."""
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            obj_id = _resolve_obj_id_with_prefix(cur, object_name)
+            if obj_id is None:
+                return []
+            cur.execute(
+                "SELECT DISTINCT COALESCE(source, 'Unknown') "
+                "FROM transient.photometry WHERE obj_id = %s ORDER BY 1",
+                (obj_id,)
+            )
+            return [r[0] for r in cur.fetchall()]
+
+    @staticmethod
+    def iter_photometry(object_name: str, sources=None, filters=None,
+                        mjd_min: float | None = None, mjd_max: float | None = None,
+                        detections_only: bool = False,
+                        itersize: int = PHOT_STREAM_ITERSIZE):
+        """Yield the rows of get_photometry() one at a time from a server-side
+        cursor, fetching *itersize* rows per round trip, so memory stays flat
+        however many points an object has.
+
+        sources / filters restrict to those values (a NULL source matches
+        'Unknown', a NULL filter matches ''); detections_only drops points
+        without an error (upper limits).  TNS duplicates are skipped (see
+        _NOT_SUPERSEDED_FOR_SQL).  The pooled connection is held until
+        the generator is exhausted or closed."""
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            obj_id = _resolve_obj_id_with_prefix(cur, object_name)
+            cur.close()
+            if obj_id is None:
+                return
+            where = ['obj_id = %s', '(mag IS NULL OR mag >= 0)']
+            params = [obj_id]
+            if sources is not None:
+                where.append("COALESCE(source, 'Unknown') = ANY(%s)")
+                params.append(list(sources))
+            where.append(_NOT_SUPERSEDED_SQL if sources is None else _NOT_SUPERSEDED_FOR_SQL)
+            if sources is not None:
+                params.append(list(sources))
+            if filters is not None:
+                where.append("COALESCE(filter, '') = ANY(%s)")
+                params.append(list(filters))
+            if mjd_min is not None:
+                where.append('"MJD" >= %s')
+                params.append(mjd_min)
+            if mjd_max is not None:
+                where.append('"MJD" <= %s')
+                params.append(mjd_max)
+            if detections_only:
+                where.append('mag_err IS NOT NULL')
+            cur = conn.cursor(name='phot_stream', cursor_factory=extras.RealDictCursor)
+            cur.itersize = itersize
+            cur.execute(
+                'SELECT phot_id AS id, name AS object_name, "MJD" AS mjd, '
+                'mag AS magnitude, mag_err AS magnitude_error, filter, source AS telescope '
+                'FROM transient.photometry WHERE ' + ' AND '.join(where) + ' '
+                'ORDER BY "MJD" ASC',
+                params
+            )
+            try:
+                for row in cur:
+                    yield dict(row)
+            finally:
+                cur.close()
+
+    @staticmethod
+    def get_photometry_delta(object_name: str, since_seq: int | None = None,
+                             since_phot_id: int | None = None,
+                             since_mjd: float | None = None,
+                             sources=None) -> dict | None:
+        """Points of object_name added or changed after a cursor (migration 0014).
+
+        since_seq (the ``seq`` of an earlier call) returns inserted and updated
+        points plus the ids of removed ones; since_phot_id only new inserts;
+        since_mjd points later than that epoch.  Without a cursor the whole
+        light curve is returned.  Rows match get_photometry(); sources works
+        as in iter_photometry(), and TNS duplicates are skipped the same way.
+        Returns ``{'photometry', 'deleted', 'seq'}``
+        read from one snapshot, or None when the object does not exist."""
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            obj_id = _resolve_obj_id_with_prefix(cur, object_name)
+            if obj_id is None:
+                return None
+            conn.rollback()
+            cur = conn.cursor(cursor_factory=extras.RealDictCursor)
+            cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+
+            if sources is None:
+                visible_sql, params = _NOT_SUPERSEDED_SQL, []
+            else:
+                visible_sql, params = _NOT_SUPERSEDED_FOR_SQL, [list(sources)]
+            where = ['obj_id = %s', '(mag IS NULL OR mag >= 0)']
+            params.append(obj_id)
+            source_sql = "COALESCE(source, 'Unknown') = ANY(%s)"
+            if sources is not None:
+                where.append(source_sql)
+                params.append(list(sources))
+            if since_seq is not None:
+                where.append('change_seq > %s')
+                params.append(since_seq)
+            elif since_phot_id is not None:
+                where.append('phot_id > %s')
+                params.append(since_phot_id)
+            elif since_mjd is not None:
+                where.append('"MJD" > %s')
+                params.append(since_mjd)
+            cur.execute(
+                'SELECT phot_id AS id, name AS object_name, "MJD" AS mjd, '
+                'mag AS magnitude, mag_err AS magnitude_error, filter, source AS telescope, '
+                f'{visible_sql} AS _visible '
+                'FROM transient.photometry WHERE ' + ' AND '.join(where) + ' '
+                'ORDER BY "MJD" ASC',
+                params
+            )
+            # A point that became a TNS duplicate since the cursor is reported
+            # as removed.
+            rows, hidden = [], []
+            for r in cur.fetchall():
+                r = dict(r)
+                (rows if r.pop('_visible') else hidden).append(r)
+
+            deleted = []
+            if since_seq is not None:
+                t_where = ['obj_id = %s', 'change_seq > %s']
+                t_params = [obj_id, since_seq]
+                if sources is not None:
+                    t_where.append(source_sql)
+                    t_params.append(list(sources))
+                cur.execute(
+                    "SELECT phot_id FROM transient.photometry_tombstones WHERE "
+                    + ' AND '.join(t_where) + " ORDER BY change_seq",
+                    t_params
+                )
+                deleted = [r['phot_id'] for r in cur.fetchall()] + [r['id'] for r in hidden]
+
+            cur.execute(
+                "SELECT GREATEST("
+                "  (SELECT MAX(change_seq) FROM transient.photometry WHERE obj_id = %s),"
+                "  (SELECT MAX(change_seq) FROM transient.photometry_tombstones WHERE obj_id = %s),"
+                "  0) AS seq",
+                (obj_id, obj_id)
+            )
+            seq = cur.fetchone()['seq']
+        return {'photometry': rows, 'deleted': deleted, 'seq': seq}
+
     @staticmethod
     def delete_photometry_point(point_id: int) -> bool:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            cur.execute("DELETE FROM transient.photometry WHERE phot_id = %s", (point_id,))
-            deleted = cur.rowcount > 0
+            cur.execute("DELETE FROM transient.photometry WHERE phot_id = %s RETURNING obj_id",
+                        (point_id,))
+            row = cur.fetchone()
+            deleted = row is not None
+            if deleted:
+                # Points it superseded were released by ON DELETE SET NULL.
+                _mark_superseded(cur, [row[0]])
             conn.commit()
         return deleted
 
@@ -568,7 +1278,8 @@ class TNSObjectDB:
     def add_spectrum_data(object_name: str, wavelength_data, intensity_data,
                           phase=None, telescope=None, spectrum_id=None,
                           original_filename=None, observation_date=None):
-        """Store spectroscopy with source=telescope/instrument and MJD=observation epoch."""
+        """Store spectroscopy with source=telescope/instrument and MJD=observation epoch.
+        The whole spectrum is written as a single packed transient.spectra row."""
         source_tag, mjd = _resolve_spectrum_source_and_mjd(
             telescope=telescope,
             spectrum_id=spectrum_id,
@@ -577,53 +1288,51 @@ class TNSObjectDB:
             observation_date=observation_date,
         )
         spectrum_id = _build_spectrum_id(source_tag, mjd)
-        rows = [
-            (None, object_name, mjd, wl, inten, source_tag)
-            for wl, inten in zip(wavelength_data, intensity_data)
-        ]
+        wl, it = _pack_spectrum(wavelength_data, intensity_data)
         with get_db_connection() as conn:
             cur = conn.cursor()
             obj_id = _resolve_obj_id_with_prefix(cur, object_name)
             if obj_id is None:
                 return spectrum_id
-            entries = [(obj_id, object_name, mjd, wl, inten, source_tag) for _, name, mjd, wl, inten, src in rows]
-            extras.execute_batch(
-                cur,
-                "INSERT INTO transient.spectroscopy "
-                "(obj_id, name, \"MJD\", wavelength, intensity, source) "
-                "VALUES (%s,%s,%s,%s,%s,%s)",
-                entries,
-                page_size=1000
-            )
+            _upsert_spectrum(cur, obj_id, object_name, source_tag, mjd, wl, it)
             conn.commit()
         return spectrum_id
 
     @staticmethod
-    def get_spectroscopy(object_name: str) -> list[dict]:
+    def get_spectrum_arrays(object_name: str, spectrum_id: str | None = None) -> list[dict]:
+        """Return one record per spectrum: metadata keys as in get_spectrum_list
+        plus 'wavelength' / 'intensity' as float64 NumPy arrays sorted by wavelength."""
         with get_db_connection() as conn:
-            cur = conn.cursor(cursor_factory=extras.DictCursor)
+            cur = conn.cursor()
             obj_id = _resolve_obj_id_with_prefix(cur, object_name)
             if obj_id is None:
                 return []
-            cur.execute(
-                'SELECT spec_id AS id, name AS object_name, "MJD" AS observation_mjd, '
-                'wavelength, intensity, source AS source_name '
-                'FROM transient.spectroscopy '
-                'WHERE obj_id = %s ORDER BY source, wavelength',
-                (obj_id,)
+            source_name, observation_mjd = (
+                _parse_spectrum_id(spectrum_id) if spectrum_id else (None, None)
             )
-            rows = []
-            for row in cur.fetchall():
-                item = dict(row)
-                source_name = item.pop('source_name', '')
-                observation_mjd = item.get('observation_mjd')
-                item['telescope'] = source_name or 'Unknown'
-                item['phase'] = _phase_from_stored_value(observation_mjd)
-                item['spectrum_id'] = _build_spectrum_id(source_name, observation_mjd)
-                item['spectrum_label'] = _build_spectrum_label(source_name, observation_mjd)
-                item['observation_date_label'] = _format_spectrum_observation_label(observation_mjd)
+            return _fetch_spectrum_records(cur, obj_id, source_name, observation_mjd)
+
+    @staticmethod
+    def get_spectrum_arrays_by_id(spectrum_id: str) -> dict | None:
+        """Look up a single spectrum by its id alone (source@@MJD)."""
+        source_name, observation_mjd = _parse_spectrum_id(spectrum_id)
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            records = _fetch_spectrum_records(cur, None, source_name, observation_mjd)
+        return records[0] if records else None
+
+    @staticmethod
+    def get_spectroscopy(object_name: str) -> list[dict]:
+        """Per-sample view kept for older callers; prefer get_spectrum_arrays."""
+        rows = []
+        for rec in TNSObjectDB.get_spectrum_arrays(object_name):
+            meta = {k: v for k, v in rec.items() if k not in ('wavelength', 'intensity')}
+            for wl, inten in zip(rec['wavelength'].tolist(), rec['intensity'].tolist()):
+                item = dict(meta)
+                item['wavelength'] = wl
+                item['intensity'] = None if inten != inten else inten
                 rows.append(item)
-            return rows
+        return rows
 
     @staticmethod
     def get_spectrum_list(object_name: str) -> list[dict]:
@@ -634,43 +1343,41 @@ class TNSObjectDB:
                 return []
             cur.execute(
                 'SELECT source AS source_name, "MJD" AS observation_mjd, '
-                'MIN(wavelength) AS min_wavelength, MAX(wavelength) AS max_wavelength, '
-                'COUNT(*) AS point_count, MIN(spec_id) AS observation_row_id '
-                'FROM transient.spectroscopy '
+                'min_wavelength, max_wavelength, n_points AS point_count, '
+                'spectra_id AS observation_row_id '
+                'FROM transient.spectra '
                 'WHERE obj_id = %s '
+                'UNION ALL '
+                'SELECT source, "MJD", MIN(wavelength), MAX(wavelength), '
+                'COUNT(*), MIN(spec_id) '
+                'FROM transient.spectroscopy l '
+                'WHERE obj_id = %s AND NOT EXISTS ('
+                '  SELECT 1 FROM transient.spectra s '
+                '  WHERE s.obj_id = l.obj_id AND s.source = l.source AND s."MJD" = l."MJD") '
                 'GROUP BY source, "MJD" '
-                'ORDER BY "MJD" DESC NULLS LAST, MIN(spec_id) DESC',
-                (obj_id,)
+                'ORDER BY observation_mjd DESC NULLS LAST, observation_row_id DESC',
+                (obj_id, obj_id)
             )
-            rows = []
-            for row in cur.fetchall():
-                item = dict(row)
-                source_name = item.pop('source_name', '')
-                observation_mjd = item.get('observation_mjd')
-                item['telescope'] = source_name or 'Unknown'
-                item['phase'] = _phase_from_stored_value(observation_mjd)
-                item['spectrum_id'] = _build_spectrum_id(source_name, observation_mjd)
-                item['spectrum_label'] = _build_spectrum_label(source_name, observation_mjd)
-                item['observation_date_label'] = _format_spectrum_observation_label(observation_mjd)
-                rows.append(item)
-            return rows
+            return [_spectrum_meta(dict(row)) for row in cur.fetchall()]
 
     @staticmethod
     def delete_spectrum(spectrum_id: str) -> bool:
         with get_db_connection() as conn:
             cur = conn.cursor()
             source_name, observation_mjd = _parse_spectrum_id(spectrum_id)
-            if observation_mjd is None:
-                cur.execute(
-                    "DELETE FROM transient.spectroscopy WHERE source = %s",
-                    (source_name,)
-                )
-            else:
-                cur.execute(
-                    'DELETE FROM transient.spectroscopy WHERE source = %s AND ABS("MJD" - %s) < 1e-6',
-                    (source_name, observation_mjd)
-                )
-            deleted = cur.rowcount > 0
+            deleted = False
+            for table in ('transient.spectra', 'transient.spectroscopy'):
+                if observation_mjd is None:
+                    cur.execute(
+                        f"DELETE FROM {table} WHERE source = %s",
+                        (source_name,)
+                    )
+                else:
+                    cur.execute(
+                        f'DELETE FROM {table} WHERE source = %s AND ABS("MJD" - %s) < 1e-6',
+                        (source_name, observation_mjd)
+                    )
+                deleted = deleted or cur.rowcount > 0
             conn.commit()
         return deleted
 
@@ -770,7 +1477,6 @@ class TNSObjectDB:
         - is_fallback=True 代表 audit 表無近期資料，改用最近修改物件替代。"""
         with get_db_connection() as conn:
             cur = conn.cursor(cursor_factory=extras.DictCursor)
-            _ensure_tns_update_audit_table(cur)
 
             # 先從 audit table 撈 2 天內的記錄
             # classified（type 或 name_prefix 有變動）排最前
@@ -895,37 +1601,10 @@ class TNSObjectDB:
 
     @staticmethod
     def log_object_view(object_name: str, user_email: str | None = None):
+        """Record a page view.  Buffered: the rows are written by the
+        background flusher (see enqueue_object_view), not on this request."""
         m = _re.match(r'^(?:AT|SN)(\d.+)$', object_name)
-        canonical = m.group(1) if m else object_name
-        try:
-            with get_db_connection() as conn:
-                cur = conn.cursor()
-                obj_id = _resolve_obj_id(cur, canonical)
-                if obj_id is None:
-                    return
-                # usr_id lookup
-                usr_id = None
-                if user_email:
-                    cur.execute("SELECT usr_id FROM auth.users WHERE email=%s", (user_email,))
-                    r = cur.fetchone()
-                    usr_id = r[0] if r else None
-                # Detail row
-                cur.execute(
-                    "INSERT INTO transient.object_views_detail (obj_id, name, usr_id) "
-                    "VALUES (%s,%s,%s)",
-                    (obj_id, canonical, usr_id)
-                )
-                # Aggregated counter
-                cur.execute(
-                    "INSERT INTO transient.object_views (obj_id, name, counts, last_view) "
-                    "VALUES (%s,%s,1,now()) "
-                    "ON CONFLICT (obj_id) DO UPDATE "
-                    "SET counts = transient.object_views.counts + 1, last_view = now()",
-                    (obj_id, canonical)
-                )
-                conn.commit()
-        except Exception as e:
-            logger.error("log_object_view %s: %s", canonical, e)
+        enqueue_object_view(m.group(1) if m else object_name, user_email)
 
     @staticmethod
     def get_top_viewed_objects(days: int = 30, limit: int = 5,
@@ -946,9 +1625,9 @@ class TNSObjectDB:
             else:
                 cur.execute(
                     "WITH recent AS ("
-                    "  SELECT obj_id, COUNT(*) AS view_count "
-                    "  FROM transient.object_views_detail "
-                    "  WHERE view_time >= now() - (%s || ' days')::interval "
+                    "  SELECT obj_id, SUM(views) AS view_count "
+                    "  FROM transient.object_views_daily "
+                    "  WHERE day > (now() AT TIME ZONE 'UTC')::date - %s "
                     "  GROUP BY obj_id ORDER BY view_count DESC LIMIT %s"
                     ") "
                     "SELECT r.view_count, d.name AS object_name, "
@@ -972,22 +1651,86 @@ tns_object_db = TNSObjectDB()
 # Object query functions (Marshal / API)
 # ---------------------------------------------------------------------------
 
+# Free-text search.  transient.objects carries two generated columns (see
+# migration 0004_objects_search): search_text holds '|'-delimited, lower-cased,
+# whitespace-free aliases (prefix+name, name, internal and other names) and
+# discoverer_text the lower-cased groups and reporters.  Both have pg_trgm
+# GIN indexes, so '%term%' patterns are index scans; the '|' delimiters let
+# prefix and exact-alias patterns be expressed against the same column.
+
+SEARCH_MODES = ('contains', 'prefix')
+
+# Optional survey prefix (SN, AT, TDE ...) followed by a TNS designation:
+# a 19xx/20xx year and one to four letters.  Bare digits ("0321", "2503")
+# or a year alone are not designations; they also occur inside internal
+# and other names (EP250321a, ZTF25...) and go to the trigram match.
+_TNS_DESIGNATION_RE = _re.compile(r'^([a-z]{1,4})?((?:19|20)\d{2}[a-z]{1,4})$')
+
+
+def _normalize_search_term(term: str) -> str:
+    """Python mirror of transient.search_norm()."""
+    return _re.sub(r'[,;|]+', '|', _re.sub(r'\s+', '', (term or '').lower()))
+
+
+def _like_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _search_clause(search_term: str, search_mode: str = 'contains') -> tuple[str, list]:
+    """SQL predicate and params for the marshal search box.
+
+    A full or partial TNS designation ("2026ab", "SN 2026abc") takes the
+    prefix fast path on lower(name); it does not look at internal/other
+    names, so only year+letters terms qualify (see _TNS_DESIGNATION_RE).
+    Everything else is a trigram-indexed match on search_text: anywhere in
+    an alias for 'contains', at the start of an alias for 'prefix'.
+    """
+    term = _normalize_search_term(search_term)
+    if not term:
+        return '', []
+
+    m = _TNS_DESIGNATION_RE.match(term)
+    if m:
+        prefix, designation = m.groups()
+        clause = "lower(o.name) LIKE %s"
+        params = [_like_escape(designation) + '%']
+        if prefix:
+            clause += " AND lower(COALESCE(o.name_prefix, '')) = %s"
+            params.append(prefix)
+        return f"({clause})", params
+
+    escaped = _like_escape(term)
+    if search_mode == 'prefix':
+        return "o.search_text LIKE %s", [f'%|{escaped}%']
+    return "o.search_text LIKE %s", [f'%{escaped}%']
+
+
+def _search_rank(search_term: str) -> tuple[str, list]:
+    """Ranking expression for sort_by='relevance': exact alias first, then
+    alias prefix, then any substring hit."""
+    escaped = _like_escape(_normalize_search_term(search_term))
+    return (
+        "CASE WHEN o.search_text LIKE %s THEN 0 "
+        "WHEN o.search_text LIKE %s THEN 1 ELSE 2 END",
+        [f'%|{escaped}|%', f'%|{escaped}%'],
+    )
+
+
 def _build_where(params, search_term='', object_type='', tag=None,
                  date_from=None, date_to=None,
                  app_mag_min=None, app_mag_max=None,
                  redshift_min=None, redshift_max=None, discoverer=None,
                  brightest_mag_min=None, brightest_mag_max=None,
-                 brightest_abs_mag_min=None, brightest_abs_mag_max=None):
+                 brightest_abs_mag_min=None, brightest_abs_mag_max=None,
+                 search_mode='contains'):
     """Build WHERE clause and params list for transient.objects queries."""
     clauses = ['1=1']
 
     if search_term:
-        pat = f'%{search_term}%'
-        clauses.append(
-            "(o.name ILIKE %s OR o.name_prefix || o.name ILIKE %s "
-            " OR o.internal_name ILIKE %s OR o.other_name ILIKE %s)"
-        )
-        params.extend([pat, pat, pat, pat])
+        clause, search_params = _search_clause(search_term, search_mode)
+        if clause:
+            clauses.append(clause)
+            params.extend(search_params)
 
     if object_type:
         types = [t.strip() for t in object_type.split(',') if t.strip()]
@@ -1040,13 +1783,9 @@ def _build_where(params, search_term='', object_type='', tag=None,
         clauses.append("o.redshift >= %s"); params.append(redshift_min)
     if redshift_max is not None:
         clauses.append("o.redshift <= %s"); params.append(redshift_max)
-    if discoverer:
-        dpat = f'%{discoverer}%'
-        clauses.append(
-            "(o.source_group ILIKE %s OR o.report_group ILIKE %s "
-            "OR array_to_string(o.reporters,',') ILIKE %s)"
-        )
-        params.extend([dpat, dpat, dpat])
+    if discoverer and discoverer.strip():
+        clauses.append("o.discoverer_text LIKE %s")
+        params.append(f'%{_like_escape(discoverer.strip().lower())}%')
     if brightest_mag_min is not None:
         clauses.append("o.brightest_mag >= %s"); params.append(brightest_mag_min)
     if brightest_mag_max is not None:
@@ -1065,10 +1804,12 @@ def get_objects_count(object_type=None, search_term='', tag=None,
                       redshift_min=None, redshift_max=None,
                       discoverer=None,
                       brightest_mag_min=None, brightest_mag_max=None,
-                      brightest_abs_mag_min=None, brightest_abs_mag_max=None) -> int:
+                      brightest_abs_mag_min=None, brightest_abs_mag_max=None,
+                      search_mode='contains') -> int:
     params = []
     where = _build_where(
         params, search_term=search_term, object_type=object_type or '',
+        search_mode=search_mode,
         tag=tag, date_from=date_from, date_to=date_to,
         app_mag_min=app_mag_min, app_mag_max=app_mag_max,
         redshift_min=redshift_min, redshift_max=redshift_max,
@@ -1083,98 +1824,207 @@ def get_objects_count(object_type=None, search_term='', tag=None,
         return cur.fetchone()[0]
 
 
-def get_tag_statistics() -> dict:
+def _read_stats_counters(cur) -> dict | None:
+    """Overview counts from transient.stats_counters, or None when the table
+    is missing or not yet populated (callers then fall back to scanning)."""
+    try:
+        cur.execute("SAVEPOINT read_stats_counters")
+        cur.execute("SELECT name, value FROM transient.stats_counters")
+        rows = cur.fetchall()
+        cur.execute("RELEASE SAVEPOINT read_stats_counters")
+    except psycopg2.Error as e:
+        cur.execute("ROLLBACK TO SAVEPOINT read_stats_counters")
+        logger.warning("stats_counters unavailable: %s", e)
+        return None
+    if not rows:
+        return None
+    c = {name: value for name, value in rows}
+    return {
+        'total_count':     c.get('total', 0),
+        'at_count':        c.get('at', 0),
+        'typed_count':     c.get('typed', 0),
+        'with_redshift':   c.get('with_redshift', 0),
+        'inbox_count':     c.get('status:Inbox', 0),
+        'followup_count':  c.get('status:Follow-up', 0),
+        'finished_count':  c.get('status:Finish', 0),
+        'snoozed_count':   c.get('status:Snoozed', 0),
+        'flag_count':      c.get('flag', 0),
+        'with_photometry': c.get('with_photometry', 0),
+    }
+
+
+def _scan_overview_counts(cur) -> dict:
+    cur.execute(
+        """
+        SELECT
+            COUNT(*) AS total_count,
+            COUNT(*) FILTER (WHERE name_prefix = 'AT') AS at_count,
+            COUNT(*) FILTER (WHERE type IS NOT NULL AND type != '') AS typed_count,
+            COUNT(*) FILTER (WHERE redshift IS NOT NULL) AS with_redshift,
+            COUNT(*) FILTER (WHERE status = 'Inbox') AS inbox_count,
+            COUNT(*) FILTER (WHERE status = 'Follow-up') AS followup_count,
+            COUNT(*) FILTER (WHERE status = 'Finish') AS finished_count,
+            COUNT(*) FILTER (WHERE status = 'Snoozed') AS snoozed_count,
+            COUNT(*) FILTER (WHERE tag @> ARRAY['flag']) AS flag_count
+        FROM transient.objects
+        """
+    )
+    counts = {k: v or 0 for k, v in zip(
+        ('total_count', 'at_count', 'typed_count', 'with_redshift', 'inbox_count',
+         'followup_count', 'finished_count', 'snoozed_count', 'flag_count'),
+        cur.fetchone(),
+    )}
+    cur.execute("SELECT COUNT(*) FROM transient.photometry_summary")
+    counts['with_photometry'] = cur.fetchone()[0] or 0
+    return counts
+
+
+def _overview_counts(cache_ttl: int = 30) -> dict:
+    """Whole-catalogue counts.  Normally a read of the trigger-maintained
+    transient.stats_counters rows; the full scan (cached per process) only
+    runs until the counters have been built."""
     with get_db_connection() as conn:
         cur = conn.cursor()
-        stats = {}
-        for label, status in [('object', 'Inbox'), ('followup', 'Follow-up'),
-                               ('finished', 'Finish'), ('snoozed', 'Snoozed')]:
-            cur.execute(
-                "SELECT COUNT(*) FROM transient.objects WHERE status = %s", (status,)
-            )
-            stats[label] = cur.fetchone()[0]
-    return stats
+        counts = _read_stats_counters(cur)
+        if counts is not None:
+            return counts
+
+        now = _time.monotonic()
+        cached = _marshal_stats_cache.get('value')
+        if cached is not None and now < _marshal_stats_cache['expires_at']:
+            return dict(cached)
+        counts = _scan_overview_counts(cur)
+    _marshal_stats_cache['value'] = dict(counts)
+    _marshal_stats_cache['expires_at'] = now + max(cache_ttl, 0)
+    return counts
 
 
-def get_tns_statistics() -> dict:
+def rebuild_stats_counters() -> dict:
+    """Recompute transient.stats_counters from the base tables (drift repair;
+    the triggers keep them current in between)."""
     with get_db_connection() as conn:
         cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT
-                COUNT(*)                                                          AS total,
-                (SELECT COUNT(DISTINCT obj_id) FROM transient.photometry)         AS with_photometry,
-                COUNT(*) FILTER (WHERE type IS NOT NULL AND type != '')           AS classified,
-                COUNT(*) FILTER (WHERE redshift IS NOT NULL)                      AS with_redshift,
-                COUNT(*) FILTER (WHERE status = 'Follow-up')                      AS follow,
-                COUNT(*) FILTER (WHERE status = 'Finish')                         AS finished,
-                COUNT(*) FILTER (WHERE status = 'Snoozed')                        AS snoozed
-            FROM transient.objects
-            """
-        )
-        row = cur.fetchone()
+        cur.execute("SET LOCAL statement_timeout = 0")
+        cur.execute("SELECT transient.rebuild_stats_counters()")
+        conn.commit()
+        return _read_stats_counters(cur) or {}
+
+
+def get_tag_statistics() -> dict:
+    c = _overview_counts()
     return {
-        'total':            row[0] or 0,
-        'with_photometry':  row[1] or 0,
-        'classified':       row[2] or 0,
-        'with_redshift':    row[3] or 0,
-        'follow':           row[4] or 0,
-        'finished':         row[5] or 0,
-        'snoozed':          row[6] or 0,
+        'object':   c['inbox_count'],
+        'followup': c['followup_count'],
+        'finished': c['finished_count'],
+        'snoozed':  c['snoozed_count'],
+        'flag':     c['flag_count'],
+    }
+
+
+def get_tns_statistics() -> dict:
+    c = _overview_counts()
+    return {
+        'total':            c['total_count'],
+        'with_photometry':  c['with_photometry'],
+        'classified':       c['typed_count'],
+        'with_redshift':    c['with_redshift'],
+        'follow':           c['followup_count'],
+        'finished':         c['finished_count'],
+        'snoozed':          c['snoozed_count'],
     }
 
 
 def get_marshal_overview_stats(cache_ttl: int = 30) -> dict:
-    now = _time.monotonic()
-    cached = _marshal_stats_cache.get('value')
-    if cached is not None and now < _marshal_stats_cache['expires_at']:
-        return dict(cached)
+    c = _overview_counts(cache_ttl)
+    return {
+        'total_count': c['total_count'],
+        'at_count': c['at_count'],
+        'classified_count': c['total_count'] - c['at_count'],
+        'inbox_count': c['inbox_count'],
+        'followup_count': c['followup_count'],
+        'finished_count': c['finished_count'],
+        'snoozed_count': c['snoozed_count'],
+        'flag_count': c['flag_count'],
+        'tns_stats': {
+            'total': c['total_count'],
+            'with_photometry': c['with_photometry'],
+            'classified': c['typed_count'],
+            'with_redshift': c['with_redshift'],
+            'follow': c['followup_count'],
+            'finished': c['finished_count'],
+            'snoozed': c['snoozed_count'],
+        },
+    }
 
-    with get_db_connection() as conn:
-        cur = conn.cursor(cursor_factory=extras.DictCursor)
-        cur.execute(
-            """
-            SELECT
-                COUNT(*) AS total_count,
-                COUNT(*) FILTER (WHERE name_prefix = 'AT') AS at_count,
-                COUNT(*) FILTER (WHERE type IS NOT NULL AND type != '') AS typed_count,
-                COUNT(*) FILTER (WHERE redshift IS NOT NULL) AS with_redshift,
-                COUNT(*) FILTER (WHERE status = 'Inbox') AS inbox_count,
-                COUNT(*) FILTER (WHERE status = 'Follow-up') AS followup_count,
-                COUNT(*) FILTER (WHERE status = 'Finish') AS finished_count,
-                COUNT(*) FILTER (WHERE status = 'Snoozed') AS snoozed_count,
-                COUNT(*) FILTER (WHERE tag @> ARRAY['flag']) AS flag_count
-            FROM transient.objects
-            """
-        )
-        object_stats = dict(cur.fetchone())
-
-        cur.execute("SELECT COUNT(DISTINCT obj_id) AS with_photometry FROM transient.photometry")
-        with_photometry = cur.fetchone()[0]
-
-        stats = {
-            'total_count': object_stats['total_count'] or 0,
-            'at_count': object_stats['at_count'] or 0,
-            'classified_count': (object_stats['total_count'] or 0) - (object_stats['at_count'] or 0),
-            'inbox_count': object_stats['inbox_count'] or 0,
-            'followup_count': object_stats['followup_count'] or 0,
-            'finished_count': object_stats['finished_count'] or 0,
-            'snoozed_count': object_stats['snoozed_count'] or 0,
-            'flag_count': object_stats['flag_count'] or 0,
-            'tns_stats': {
-                'total': object_stats['total_count'] or 0,
-                'with_photometry': with_photometry or 0,
-                'classified': object_stats['typed_count'] or 0,
-                'with_redshift': object_stats['with_redshift'] or 0,
-                'follow': object_stats['followup_count'] or 0,
-                'finished': object_stats['finished_count'] or 0,
-                'snoozed': object_stats['snoozed_count'] or 0,
-            },
-        }
 
-    _marshal_stats_cache['value'] = dict(stats)
-    _marshal_stats_cache['expires_at'] = now + max(cache_ttl, 0)
-    return dict(stats)
+# Sort column mapping (old name → new transient.objects column).  Every
+# expression here has a matching (expr, obj_id) btree index, see migration
+# 0003_objects_seek_indexes; keep the two in sync.
+_SORT_MAP = {
+    'discoverydate':        'o.discovery_date',
+    'lastmodified':         'o.last_modified_date',
+    'discoverymag':         'o.discovery_mag',
+    'name':                 'o.name',
+    'time_received':        'o.received_date',
+    'last_photometry_date': 'COALESCE(o.last_phot_date, o.last_modified_date)',
+    'brightest_mag':        'o.brightest_mag',
+    'brightest_abs_mag':    'o.brightest_abs_mag',
+    'redshift':             'o.redshift',
+}
+
+
+def _sort_spec(sort_by, sort_order) -> tuple[str, str, str]:
+    """Normalise sort arguments to (sort_by, sort expression, direction)."""
+    if sort_by not in _SORT_MAP:
+        sort_by = 'discoverydate'
+    direction = 'ASC' if (sort_order or '').lower() == 'asc' else 'DESC'
+    return sort_by, _SORT_MAP[sort_by], direction
+
+
+def _encode_token(data: dict) -> str:
+    raw = json.dumps(data, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_token(token: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        data = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError('Invalid pagination token') from exc
+    if not isinstance(data, dict):
+        raise ValueError('Invalid pagination token')
+    return data
+
+
+def _encode_seek_token(sort_by: str, direction: str, value, obj_id: int) -> str:
+    """Opaque ``after`` token: the last row's sort key and obj_id, tagged with
+    the sort it belongs to."""
+    return _encode_token({'s': sort_by, 'o': direction, 'v': value, 'id': obj_id})
+
+
+def _decode_seek_token(token: str, sort_by: str, direction: str) -> dict:
+    data = _decode_token(token)
+    try:
+        obj_id = int(data['id'])
+        value = data['v']
+    except (ValueError, TypeError, KeyError) as exc:
+        raise ValueError('Invalid pagination token') from exc
+    if data.get('s') != sort_by or data.get('o') != direction:
+        raise ValueError('Pagination token does not match the requested sort')
+    if value is not None and not isinstance(value, (int, float, str)):
+        raise ValueError('Invalid pagination token')
+    return {'v': value, 'id': obj_id}
+
+
+def _decode_offset_token(token: str, sort_by: str) -> int:
+    data = _decode_token(token)
+    if data.get('s') != sort_by:
+        raise ValueError('Pagination token does not match the requested sort')
+    try:
+        return max(int(data['off']), 0)
+    except (ValueError, TypeError, KeyError) as exc:
+        raise ValueError('Invalid pagination token') from exc
 
 
 def search_tns_objects(search_term='', object_type='', limit=100, offset=0,
@@ -1186,10 +2036,12 @@ def search_tns_objects(search_term='', object_type='', limit=100, offset=0,
                        discoverer=None, tag=None,
                        brightest_mag_min=None, brightest_mag_max=None,
                        brightest_abs_mag_min=None,
-                       brightest_abs_mag_max=None) -> list[dict]:
+                       brightest_abs_mag_max=None,
+                       search_mode='contains') -> list[dict]:
     params = []
     where = _build_where(
         params, search_term=search_term, object_type=object_type,
+        search_mode=search_mode,
         tag=tag, date_from=date_from, date_to=date_to,
         app_mag_min=app_mag_min if app_mag_min is not None else mag_min,
         app_mag_max=app_mag_max if app_mag_max is not None else mag_max,
@@ -1200,28 +2052,17 @@ def search_tns_objects(search_term='', object_type='', limit=100, offset=0,
         brightest_abs_mag_max=brightest_abs_mag_max,
     )
 
-    # Sort column mapping (old name → new transient.objects column)
-    sort_map = {
-        'discoverydate':        'o.discovery_date',
-        'lastmodified':         'o.last_modified_date',
-        'discoverymag':         'o.discovery_mag',
-        'name':                 'o.name',
-        'time_received':        'o.received_date',
-        'last_photometry_date': 'o.last_phot_date',
-        'brightest_mag':        'o.brightest_mag',
-        'brightest_abs_mag':    'o.brightest_abs_mag',
-        'redshift':             'o.redshift',
-    }
-    sort_col = sort_map.get(sort_by, 'o.discovery_date')
-    direction = 'ASC' if sort_order.lower() == 'asc' else 'DESC'
-
-    if sort_by == 'last_photometry_date':
+    if sort_by == 'relevance' and _normalize_search_term(search_term):
+        rank_expr, rank_params = _search_rank(search_term)
         order_clause = (
-            f"ORDER BY COALESCE(o.last_phot_date, o.last_modified_date) "
-            f"{direction} NULLS LAST"
+            f"ORDER BY {rank_expr}, o.discovery_date DESC NULLS LAST, o.obj_id DESC"
         )
+        params.extend(rank_params)
     else:
-        order_clause = f"ORDER BY {sort_col} {direction} NULLS LAST"
+        sort_by, sort_expr, direction = _sort_spec(sort_by, sort_order)
+        order_clause = (
+            f"ORDER BY {sort_expr} {direction} NULLS LAST, o.obj_id {direction}"
+        )
 
     params.extend([limit, offset])
     query = (
@@ -1237,14 +2078,243 @@ def search_tns_objects(search_term='', object_type='', limit=100, offset=0,
         return [dict(r) for r in cur.fetchall()]
 
 
+def search_tns_objects_after(search_term='', object_type='', limit=100, after=None,
+                             sort_by='discoverydate', sort_order='desc',
+                             date_from=None, date_to=None,
+                             app_mag_min=None, app_mag_max=None,
+                             redshift_min=None, redshift_max=None,
+                             discoverer=None, tag=None,
+                             brightest_mag_min=None, brightest_mag_max=None,
+                             brightest_abs_mag_min=None,
+                             brightest_abs_mag_max=None,
+                             search_mode='contains') -> tuple[list[dict], str | None]:
+    """Keyset-paginated variant of search_tns_objects.
+
+    Returns (rows, next_after); pass next_after back as ``after`` to get the
+    following page, None means the listing is exhausted.  Rows come out in
+    the same order as the OFFSET path (sort key, NULLS LAST, obj_id), but
+    each page seeks straight to its first row through the (sort key, obj_id)
+    indexes instead of scanning past every earlier page.
+
+    sort_by='relevance' (with a search term) pages by offset instead: the
+    ranked result set is already narrowed by the search predicate, and the
+    rank is not an indexable key.
+
+    Raises ValueError for a malformed token or one issued for another sort.
+    """
+    filters = dict(
+        search_term=search_term, object_type=object_type, tag=tag,
+        date_from=date_from, date_to=date_to,
+        app_mag_min=app_mag_min, app_mag_max=app_mag_max,
+        redshift_min=redshift_min, redshift_max=redshift_max,
+        discoverer=discoverer,
+        brightest_mag_min=brightest_mag_min, brightest_mag_max=brightest_mag_max,
+        brightest_abs_mag_min=brightest_abs_mag_min,
+        brightest_abs_mag_max=brightest_abs_mag_max,
+        search_mode=search_mode,
+    )
+    if sort_by == 'relevance' and _normalize_search_term(search_term):
+        offset = _decode_offset_token(after, 'relevance') if after else 0
+        rows = search_tns_objects(limit=limit + 1, offset=offset,
+                                  sort_by='relevance', **filters)
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = _encode_token({'s': 'relevance', 'off': offset + limit})
+        return rows, next_after
+
+    sort_by, sort_expr, direction = _sort_spec(sort_by, sort_order)
+    cursor = _decode_seek_token(after, sort_by, direction) if after else None
+
+    params = []
+    where = _build_where(params, **filters)
+    cmp = '<' if direction == 'DESC' else '>'
+    select = (
+        f"SELECT {OBJECT_COMPAT_COLS}, {sort_expr} AS _sort_key "
+        f"FROM transient.objects o WHERE {where} "
+    )
+
+    # Non-NULL keys first, then the NULL tail ordered by obj_id alone.  Two
+    # range scans keep both halves on the index: a single ORDER BY ... DESC
+    # NULLS LAST would not match the (key ASC, obj_id ASC) btree either way.
+    rows = []
+    with get_db_connection() as conn:
+        cur = conn.cursor(cursor_factory=extras.DictCursor)
+        if cursor is None or cursor['v'] is not None:
+            seek_params = list(params)
+            seek = ''
+            if cursor is not None:
+                seek = f"AND ({sort_expr}, o.obj_id) {cmp} (%s, %s) "
+                seek_params.extend([cursor['v'], cursor['id']])
+            seek_params.append(limit + 1)
+            cur.execute(
+                select
+                + f"AND {sort_expr} IS NOT NULL {seek}"
+                + f"ORDER BY {sort_expr} {direction}, o.obj_id {direction} LIMIT %s",
+                seek_params,
+            )
+            rows = [dict(r) for r in cur.fetchall()]
+        if len(rows) <= limit:
+            tail_params = list(params)
+            seek = ''
+            if cursor is not None and cursor['v'] is None:
+                seek = f"AND o.obj_id {cmp} %s "
+                tail_params.append(cursor['id'])
+            tail_params.append(limit + 1 - len(rows))
+            cur.execute(
+                select
+                + f"AND {sort_expr} IS NULL {seek}"
+                + f"ORDER BY o.obj_id {direction} LIMIT %s",
+                tail_params,
+            )
+            rows.extend(dict(r) for r in cur.fetchall())
+
+    next_after = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_after = _encode_seek_token(sort_by, direction, last['_sort_key'], last['obj_id'])
+    for row in rows:
+        row.pop('_sort_key', None)
+    return rows, next_after
+
+
+def _listing_cache_key(limit, offset, sort_by, sort_order, filters: dict) -> tuple:
+    norm = []
+    for k in sorted(filters):
+        v = filters[k]
+        if isinstance(v, str):
+            v = v.strip()
+            if k == 'search_term':
+                v = _normalize_search_term(v)
+            elif k == 'discoverer':
+                v = v.lower()
+        norm.append((k, v if v not in ('', None) else None))
+    return (limit, offset, sort_by, sort_order, tuple(norm))
+
+
+def invalidate_listing_cache():
+    with _listing_cache_lock:
+        _listing_cache.clear()
+    with _facet_cache_lock:
+        _facet_cache.clear()
+
+
+def search_objects_page(limit=50, offset=0, sort_by='discoverydate', sort_order='desc',
+                        cache_ttl: float = 5, **filters) -> dict:
+    """Page rows, total and per-status counts for one marshal filter, in a
+    single statement.
+
+    The filter is evaluated once into a narrow (obj_id, status, sort key)
+    set; counts and the sorted page are both taken from it, and only the
+    page rows are joined back for the display columns.  Replaces the
+    search_tns_objects + get_objects_count + get_filtered_stats triple.
+
+    filters are the _build_where keywords.  Returns ``{'objects', 'total',
+    'stats', 'next_after'}``; next_after is the ``after`` token that
+    continues this page in search_tns_objects_after() (None at the end).
+    """
+    relevance = sort_by == 'relevance' and _normalize_search_term(filters.get('search_term'))
+    if relevance:
+        direction = 'ASC'
+    else:
+        sort_by, sort_expr, direction = _sort_spec(sort_by, sort_order)
+
+    key = _listing_cache_key(limit, offset, sort_by, direction, filters)
+    now = _time.monotonic()
+    if cache_ttl > 0:
+        with _listing_cache_lock:
+            hit = _listing_cache.get(key)
+            if hit is not None and now < hit[0]:
+                _listing_cache.move_to_end(key)
+                return hit[1]
+
+    params = []
+    if relevance:
+        rank_expr, rank_params = _search_rank(filters['search_term'])
+        key_cols = f"{rank_expr} AS _k, o.discovery_date AS _d"
+        params.extend(rank_params)
+        order = "{a}._k ASC, {a}._d DESC NULLS LAST, {a}.obj_id DESC"
+    else:
+        key_cols = f"{sort_expr} AS _k"
+        order = f"{{a}}._k {direction} NULLS LAST, {{a}}.obj_id {direction}"
+    where = _build_where(params, **filters)
+    params.extend([limit + 1, offset])
+
+    query = f"""
+        WITH f AS MATERIALIZED (
+            SELECT o.obj_id, o.status, {key_cols}
+            FROM transient.objects o
+            WHERE {where}
+        ), c AS (
+            SELECT COUNT(*)                                     AS _total,
+                   COUNT(*) FILTER (WHERE status = 'Inbox')     AS _object,
+                   COUNT(*) FILTER (WHERE status = 'Follow-up') AS _followup,
+                   COUNT(*) FILTER (WHERE status = 'Finish')    AS _finished,
+                   COUNT(*) FILTER (WHERE status = 'Snoozed')   AS _snoozed
+            FROM f
+        ), p AS (
+            SELECT * FROM f ORDER BY {order.format(a='f')} LIMIT %s OFFSET %s
+        )
+        SELECT c._total, c._object, c._followup, c._finished, c._snoozed,
+               p._k AS _sort_key, {OBJECT_COMPAT_COLS}
+        FROM c
+        LEFT JOIN p ON TRUE
+        LEFT JOIN transient.objects o ON o.obj_id = p.obj_id
+        ORDER BY {order.format(a='p')}
+    """
+    with get_db_connection() as conn:
+        cur = conn.cursor(cursor_factory=extras.DictCursor)
+        cur.execute(query, params)
+        records = [dict(r) for r in cur.fetchall()]
+
+    first = records[0] if records else {}
+    stats = {
+        'total':    first.get('_total') or 0,
+        'object':   first.get('_object') or 0,
+        'followup': first.get('_followup') or 0,
+        'finished': first.get('_finished') or 0,
+        'snoozed':  first.get('_snoozed') or 0,
+    }
+    rows = []
+    for r in records:
+        if r.get('obj_id') is None:
+            continue        # empty page: the lone counts row
+        for col in ('_total', '_object', '_followup', '_finished', '_snoozed'):
+            r.pop(col, None)
+        rows.append(r)
+
+    next_after = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if relevance:
+            next_after = _encode_token({'s': 'relevance', 'off': offset + limit})
+        else:
+            last = rows[-1]
+            next_after = _encode_seek_token(sort_by, direction, last['_sort_key'], last['obj_id'])
+    for r in rows:
+        r.pop('_sort_key', None)
+
+    value = {'objects': rows, 'total': stats['total'], 'stats': stats,
+             'next_after': next_after}
+    if cache_ttl > 0:
+        with _listing_cache_lock:
+            _listing_cache[key] = (now + cache_ttl, value)
+            _listing_cache.move_to_end(key)
+            while len(_listing_cache) > _LISTING_CACHE_MAX:
+                _listing_cache.popitem(last=False)
+    return value
+
+
 def get_filtered_stats(search_term='', object_type='', tag=None,
                        date_from=None, date_to=None,
                        app_mag_min=None, app_mag_max=None,
                        redshift_min=None, redshift_max=None,
-                       discoverer=None) -> dict:
+                       discoverer=None, search_mode='contains') -> dict:
     base_params = []
     where = _build_where(
         base_params, search_term=search_term, object_type=object_type,
+        search_mode=search_mode,
         tag=tag, date_from=date_from, date_to=date_to,
         app_mag_min=app_mag_min, app_mag_max=app_mag_max,
         redshift_min=redshift_min, redshift_max=redshift_max,
@@ -1274,6 +2344,141 @@ def get_filtered_stats(search_term='', object_type='', tag=None,
     }
 
 
+# ---------------------------------------------------------------------------
+# Facet counts
+# ---------------------------------------------------------------------------
+# Per-status, tag, group, classification and discovery-year counts for one
+# marshal filter, computed in a single statement.  Each facet is counted
+# against the filter minus its own constraint (status ignores ``tag``,
+# classification ignores ``object_type``, discovery_year ignores the date
+# range), so the alternatives stay visible while drilling down.
+
+FACETS = ('status', 'tag', 'group', 'classification', 'discovery_year')
+
+_STATUS_TAGS = ('object', 'followup', 'finished', 'snoozed')
+
+# _build_where keywords that are a facet's own constraint.
+_FACET_OWN_FILTERS = {
+    'status':         ('tag',),
+    'classification': ('object_type',),
+    'discovery_year': ('date_from', 'date_to'),
+}
+
+# GROUPING(status, cls, yr) of each grouping set.
+_FACET_GROUPING = {3: 'status', 5: 'classification', 6: 'discovery_year', 7: 'total'}
+
+
+def _facet_own_keys(facet: str, filters: dict) -> tuple:
+    keys = _FACET_OWN_FILTERS.get(facet, ())
+    if facet == 'status' and filters.get('tag') not in _STATUS_TAGS:
+        return ()       # 'flag' is a cross-match filter, not a status
+    return keys
+
+
+def _facet_cache_key(facet: str, filters: dict) -> tuple:
+    own = _facet_own_keys(facet, filters)
+    deps = {k: v for k, v in filters.items() if k not in own}
+    norm = _listing_cache_key(0, 0, '', '', deps)[-1]
+    return (facet, hashlib.sha1(repr(norm).encode('utf-8')).hexdigest())
+
+
+def _compute_facets(filters: dict) -> dict:
+    params = []
+    own = {}
+    for facet in _FACET_OWN_FILTERS:
+        kw = {k: filters[k] for k in _facet_own_keys(facet, filters)
+              if filters.get(k) not in (None, '')}
+        own[facet] = _build_where(params, **kw) if kw else 'TRUE'
+    excluded = {k for f in _FACET_OWN_FILTERS for k in _facet_own_keys(f, filters)}
+    where = _build_where(params, **{k: v for k, v in filters.items() if k not in excluded})
+
+    query = f"""
+        WITH f AS MATERIALIZED (
+            SELECT o.status,
+                   COALESCE(NULLIF(o.type, ''), 'Unknown') AS cls,
+                   EXTRACT(YEAR FROM DATE '1858-11-17' + FLOOR(o.discovery_date)::int)::int AS yr,
+                   o.tag, o.groups,
+                   ({own['status']})         AS _st,
+                   ({own['classification']}) AS _cl,
+                   ({own['discovery_year']}) AS _yr
+            FROM transient.objects o
+            WHERE {where}
+        ), s AS (
+            SELECT GROUPING(status, cls, yr) AS g, status, cls, yr,
+                   COUNT(*) FILTER (WHERE _cl AND _yr)         AS n_status,
+                   COUNT(*) FILTER (WHERE _st AND _yr)         AS n_cls,
+                   COUNT(*) FILTER (WHERE _st AND _cl)         AS n_yr,
+                   COUNT(*) FILTER (WHERE _st AND _cl AND _yr) AS n_all
+            FROM f
+            GROUP BY GROUPING SETS ((status), (cls), (yr), ())
+        )
+        SELECT g, CASE g WHEN 3 THEN status WHEN 5 THEN cls WHEN 6 THEN yr::text END,
+               CASE g WHEN 3 THEN n_status WHEN 5 THEN n_cls WHEN 6 THEN n_yr ELSE n_all END
+        FROM s
+        UNION ALL
+        SELECT -1, t.v, COUNT(*)
+        FROM f CROSS JOIN LATERAL (SELECT DISTINCT trim(x) AS v FROM unnest(f.tag) x) t
+        WHERE _st AND _cl AND _yr AND t.v <> ''
+        GROUP BY t.v
+        UNION ALL
+        SELECT -2, gr.v::text, COUNT(*)
+        FROM f CROSS JOIN LATERAL (SELECT DISTINCT x AS v FROM unnest(f.groups) x) gr
+        WHERE _st AND _cl AND _yr
+        GROUP BY gr.v
+    """
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(query, params)
+        rows = cur.fetchall()
+
+    out = {f: {} for f in FACETS}
+    out['total'] = 0
+    for g, value, n in rows:
+        facet = {-1: 'tag', -2: 'group'}.get(g) or _FACET_GROUPING.get(g)
+        if facet == 'total':
+            out['total'] = n or 0
+        elif facet and value is not None and n:
+            if facet in ('group', 'discovery_year'):
+                value = int(value)
+            out[facet][value] = n
+    return out
+
+
+def get_facet_counts(facets=None, cache_ttl: float = 30, **filters) -> dict:
+    """Facet counts for the _build_where filters.
+
+    Returns ``{'total': n, <facet>: {value: count}, ...}`` for the requested
+    facets (default: all of FACETS).  Facets are cached separately, keyed by
+    a hash of the filters they depend on, so changing one facet's selection
+    reuses its own counts; object writes clear the cache through
+    invalidate_listing_cache().
+    """
+    wanted = [f for f in (facets or FACETS) if f in FACETS] + ['total']
+    keys = {f: _facet_cache_key(f, filters) for f in wanted}
+    now = _time.monotonic()
+    out = {}
+    if cache_ttl > 0:
+        with _facet_cache_lock:
+            for f, key in keys.items():
+                hit = _facet_cache.get(key)
+                if hit is not None and now < hit[0]:
+                    _facet_cache.move_to_end(key)
+                    out[f] = hit[1]
+    if len(out) == len(keys):
+        return out
+
+    computed = _compute_facets(filters)
+    if cache_ttl > 0:
+        with _facet_cache_lock:
+            for f, counts in computed.items():
+                key = _facet_cache_key(f, filters)
+                _facet_cache[key] = (now + cache_ttl, counts)
+                _facet_cache.move_to_end(key)
+            while len(_facet_cache) > _FACET_CACHE_MAX:
+                _facet_cache.popitem(last=False)
+    return {f: computed[f] for f in wanted}
+
+
 def get_distinct_classifications() -> list[str]:
     with get_db_connection() as conn:
         cur = conn.cursor()
@@ -1318,6 +2523,8 @@ def update_object_status(object_name: str, status: str) -> bool:
             )
             updated = cur.rowcount > 0
             conn.commit()
+        if updated:
+            invalidate_listing_cache()
         return updated
     except Exception as e:
         logger.error("update_object_status: %s", e)
@@ -1329,6 +2536,199 @@ def update_object_activity(objid, activity_type=None):
     return True
 
 
+# Bulk object mutations.  One request applies an operation list to many
+# objects: names are resolved in one pass, the rows are locked in obj_id
+# order, each operation is one set-based UPDATE, and a single
+# transient.object_bulk_audit row (migration 0015) records the request.
+
+BULK_MUTATION_MAX = 5000
+
+_TAG_RE = _re.compile(r'^[A-Za-z0-9\s\-_]+$')
+
+# op -> (argument key, UPDATE SET / WHERE template).  %(v)s is the status,
+# tag list or group-id list; rows that would not change are skipped.
+_BULK_OPS = {
+    'set_status': ('status',
+                   "SET status = %(v)s "
+                   "WHERE o.obj_id = ANY(%(ids)s) AND o.status IS DISTINCT FROM %(v)s"),
+    'add_tags': ('tags',
+                 "SET tag = o.tag || ARRAY(SELECT t FROM unnest(%(v)s::text[]) t "
+                 "                         WHERE NOT t = ANY(o.tag)) "
+                 "WHERE o.obj_id = ANY(%(ids)s) AND NOT o.tag @> %(v)s::text[]"),
+    'remove_tags': ('tags',
+                    "SET tag = ARRAY(SELECT t FROM unnest(o.tag) t "
+                    "                WHERE NOT t = ANY(%(v)s::text[])) "
+                    "WHERE o.obj_id = ANY(%(ids)s) AND o.tag && %(v)s::text[]"),
+    'set_tags': ('tags',
+                 "SET tag = %(v)s::text[] "
+                 "WHERE o.obj_id = ANY(%(ids)s) AND o.tag IS DISTINCT FROM %(v)s::text[]"),
+    'add_groups': ('groups',
+                   "SET permission = 'groups', "
+                   "    groups = o.groups || ARRAY(SELECT g FROM unnest(%(v)s::int[]) g "
+                   "                               WHERE NOT g = ANY(o.groups)) "
+                   "WHERE o.obj_id = ANY(%(ids)s) "
+                   "  AND (NOT o.groups @> %(v)s::int[] OR o.permission <> 'groups')"),
+    'remove_groups': ('groups',
+                      "SET groups = ARRAY(SELECT g FROM unnest(o.groups) g "
+                      "                   WHERE NOT g = ANY(%(v)s::int[])) "
+                      "WHERE o.obj_id = ANY(%(ids)s) AND o.groups && %(v)s::int[]"),
+}
+
+
+def _validate_bulk_ops(cur, operations) -> list[dict]:
+    """Normalise the operation list; raises ValueError on anything invalid.
+    Group names are turned into group ids here."""
+    if not isinstance(operations, list) or not operations:
+        raise ValueError('operations must be a non-empty list')
+    group_names = set()
+    ops = []
+    for i, op in enumerate(operations):
+        if not isinstance(op, dict) or op.get('op') not in _BULK_OPS:
+            raise ValueError(f'operation {i}: unknown op {op.get("op") if isinstance(op, dict) else op!r}')
+        key = _BULK_OPS[op['op']][0]
+        value = op.get(key)
+        if key == 'status':
+            value = _STATUS_MAP.get(value)
+            if value is None:
+                raise ValueError(f'operation {i}: invalid status {op.get(key)!r}')
+        else:
+            if isinstance(value, str):
+                value = value.split(',')
+            if not isinstance(value, list):
+                raise ValueError(f'operation {i}: {key} must be a list')
+            value = list(dict.fromkeys(str(v).strip() for v in value if str(v).strip()))
+            if not value and op['op'] != 'set_tags':
+                raise ValueError(f'operation {i}: {key} is empty')
+            if key == 'tags' and not all(_TAG_RE.match(t) for t in value):
+                raise ValueError(f'operation {i}: tags contain invalid characters')
+            if key == 'groups':
+                group_names.update(value)
+        ops.append({'op': op['op'], key: value})
+
+    if group_names:
+        cur.execute("SELECT name, group_id FROM auth.groups WHERE name = ANY(%s)",
+                    (sorted(group_names),))
+        gids = dict(cur.fetchall())
+        unknown = sorted(group_names - gids.keys())
+        if unknown:
+            raise ValueError(f'unknown groups: {", ".join(unknown)}')
+        for op in ops:
+            if 'groups' in op:
+                op['group_ids'] = sorted(gids[g] for g in op['groups'])
+    return ops
+
+
+def apply_bulk_object_mutations(object_names, operations, actor: str) -> dict:
+    """Apply *operations* to every object in *object_names* in one transaction.
+
+    operations: [{'op': 'set_status', 'status': 'snoozed'},
+                 {'op': 'add_tags' | 'remove_tags' | 'set_tags', 'tags': [...]},
+                 {'op': 'add_groups' | 'remove_groups', 'groups': [group names]}]
+    in application order; statuses take the same values as
+    update_object_status().  Raises ValueError for an invalid request (nothing
+    is written).  Returns ``{'matched', 'not_found', 'changed', 'audit_id'}``
+    where changed maps "<index>:<op>" to the number of rows it modified."""
+    if not isinstance(object_names, list) or not all(isinstance(n, str) for n in object_names):
+        raise ValueError('object_names must be a list')
+    names = list(dict.fromkeys(n.strip() for n in object_names if n.strip()))
+    if not names:
+        raise ValueError('object_names is empty')
+    if len(names) > BULK_MUTATION_MAX:
+        raise ValueError(f'at most {BULK_MUTATION_MAX} objects per request')
+
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        ops = _validate_bulk_ops(cur, operations)
+        resolved = resolve_many(names, cur=cur)
+        not_found = [n for n in names if n not in resolved]
+        cur.execute(
+            "SELECT obj_id FROM transient.objects WHERE obj_id = ANY(%s) "
+            "ORDER BY obj_id FOR NO KEY UPDATE",
+            (sorted(set(resolved.values())),)
+        )
+        obj_ids = [r[0] for r in cur.fetchall()]
+
+        changed = {}
+        if obj_ids:
+            for i, op in enumerate(ops):
+                key, clause = _BULK_OPS[op['op']]
+                value = op['group_ids'] if key == 'groups' else op[key]
+                cur.execute(f"UPDATE transient.objects o {clause}",
+                            {'v': value, 'ids': obj_ids})
+                changed[f"{i}:{op['op']}"] = cur.rowcount
+
+        cur.execute(
+            "INSERT INTO transient.object_bulk_audit (actor, operations, obj_ids, changed) "
+            "VALUES (%s, %s, %s, %s) RETURNING audit_id",
+            (actor or '', extras.Json([{k: v for k, v in op.items() if k != 'group_ids'}
+                                       for op in ops]),
+             obj_ids, extras.Json(changed))
+        )
+        audit_id = cur.fetchone()[0]
+        conn.commit()
+
+    if any(changed.values()):
+        invalidate_listing_cache()
+    logger.info("apply_bulk_object_mutations: actor=%s objects=%d changed=%s",
+                actor, len(obj_ids), changed)
+    return {'matched': len(obj_ids), 'not_found': not_found,
+            'changed': changed, 'audit_id': audit_id}
+
+
+# Rule-driven status transitions.  Each row of transient.status_rules
+# (migration 0009) is applied as one UPDATE ... RETURNING, so housekeeping
+# costs one statement per rule however many objects it touches.
+_STATUS_RULE_SQL = """
+    WITH r AS (
+        SELECT * FROM transient.status_rules WHERE rule_name = %(rule)s AND enabled
+    ), cand AS (
+        SELECT o.obj_id, o.status AS prev_status
+        FROM transient.objects o, r
+        WHERE o.status = ANY(r.from_status)
+          AND o.status <> r.to_status
+          AND (r.idle_days IS NULL OR CASE r.idle_basis
+                WHEN 'last_phot' THEN o.last_phot_date IS NULL
+                                      OR o.last_phot_date < %(as_of)s - r.idle_days
+                ELSE COALESCE(o.last_phot_date, o.last_modified_date) < %(as_of)s - r.idle_days
+              END)
+        ORDER BY o.obj_id
+        FOR UPDATE OF o
+    )
+    UPDATE transient.objects o SET status = r.to_status
+    FROM cand, r
+    WHERE o.obj_id = cand.obj_id
+    RETURNING o.obj_id, o.name, cand.prev_status, r.to_status
+"""
+
+
+def apply_status_rules(rule_set: str, as_of_mjd: float | None = None) -> dict[str, list[dict]]:
+    """Apply every enabled rule of *rule_set* in priority order, in one
+    transaction.  Ages are measured against *as_of_mjd* (default: now).
+
+    Returns {rule_name: [{'obj_id', 'name', 'prev_status', 'status'}, ...]}
+    with one entry per object the rule moved, for logging and notifications.
+    """
+    as_of = _current_utc_mjd() if as_of_mjd is None else float(as_of_mjd)
+    changed: dict[str, list[dict]] = {}
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT rule_name FROM transient.status_rules "
+            "WHERE rule_set = %s AND enabled ORDER BY priority, rule_name",
+            (rule_set,)
+        )
+        for (rule,) in cur.fetchall():
+            cur.execute(_STATUS_RULE_SQL, {'rule': rule, 'as_of': as_of})
+            changed[rule] = [
+                {'obj_id': r[0], 'name': r[1], 'prev_status': r[2], 'status': r[3]}
+                for r in cur.fetchall()
+            ]
+        conn.commit()
+    if any(changed.values()):
+        invalidate_listing_cache()
+    return changed
+
+
 def get_auto_snooze_stats() -> dict:
     with get_db_connection() as conn:
         cur = conn.cursor()
@@ -1343,31 +2743,59 @@ def get_auto_snooze_stats() -> dict:
 # Cross-match functions
 # ---------------------------------------------------------------------------
 
+def refresh_detect_daily_counts(cur, dates) -> None:
+    """Recompute transient.detect_daily_counts for the given match dates in
+    the caller's transaction.  Call after inserting or deleting
+    cross_matches rows; days left without matches are removed."""
+    dates = sorted({d for d in dates if d is not None})
+    if not dates:
+        return
+    cur.execute(
+        "WITH agg AS ("
+        "  SELECT d.day, COUNT(DISTINCT c.obj_id) AS n, "
+        "         COALESCE(BOOL_OR(c.catalog LIKE 'Lens_%%'), FALSE) AS lens "
+        "  FROM unnest(%s::date[]) AS d(day) "
+        "  LEFT JOIN transient.cross_matches c ON c.match_date = d.day "
+        "  GROUP BY d.day"
+        "), gone AS ("
+        "  DELETE FROM transient.detect_daily_counts dc USING agg "
+        "  WHERE dc.match_date = agg.day AND agg.n = 0"
+        ") "
+        "INSERT INTO transient.detect_daily_counts AS dc "
+        "    (match_date, unique_targets, has_lens, updated_at) "
+        "SELECT day, n, lens, now() FROM agg WHERE n > 0 "
+        "ON CONFLICT (match_date) DO UPDATE "
+        "SET unique_targets = EXCLUDED.unique_targets, "
+        "    has_lens = EXCLUDED.has_lens, updated_at = now()",
+        (dates,)
+    )
+
+
+def _detect_daily_counts(cur) -> list[dict]:
+    """Calendar rows from the summary table, newest first, with the days
+    between the first and last DETECT day that had no matches filled in."""
+    cur.execute("""
+        SELECT g.day::date AS date,
+               COALESCE(dc.unique_targets, 0) AS unique_targets,
+               COALESCE(dc.has_lens, FALSE) AS has_lens
+        FROM (SELECT MIN(match_date) AS lo, MAX(match_date) AS hi
+              FROM transient.detect_daily_counts) b
+        CROSS JOIN LATERAL generate_series(b.lo, b.hi, '1 day'::interval) AS g(day)
+        LEFT JOIN transient.detect_daily_counts dc ON dc.match_date = g.day::date
+        ORDER BY 1 DESC
+    """)
+    return [
+        {'date': r[0].strftime('%Y-%m-%d'),
+         'count': r[1],
+         'has_lens': r[2]}
+        for r in cur.fetchall()
+    ]
+
+
 def get_daily_match_counts() -> list[dict]:
     try:
         with get_db_connection() as conn:
-            cur = conn.cursor(cursor_factory=extras.RealDictCursor)
-            cur.execute("""
-                WITH dates AS (
-                    SELECT generate_series(
-                        (SELECT MIN(updated_date::date) FROM transient.cross_matches),
-                        (SELECT MAX(updated_date::date) FROM transient.cross_matches),
-                        '1 day'::interval
-                    )::date AS date
-                )
-                SELECT d.date,
-                       COUNT(DISTINCT c.obj_id) AS unique_targets,
-                       COALESCE(BOOL_OR(c.catalog LIKE 'Lens_%'), FALSE) AS has_lens
-                FROM dates d
-                LEFT JOIN transient.cross_matches c ON d.date = c.updated_date::date
-                GROUP BY d.date ORDER BY d.date DESC
-            """)
-            return [
-                {'date': r['date'].strftime('%Y-%m-%d'),
-                 'count': r['unique_targets'],
-                 'has_lens': r['has_lens']}
-                for r in cur.fetchall()
-            ]
+            return _detect_daily_counts(conn.cursor())
     except Exception as e:
         logger.error("get_daily_match_counts: %s", e)
         return []
@@ -1378,8 +2806,8 @@ def get_available_dates() -> list[str]:
         with get_db_connection() as conn:
             cur = conn.cursor()
             cur.execute(
-                "SELECT DISTINCT updated_date::date AS d "
-                "FROM transient.cross_matches ORDER BY d DESC"
+                "SELECT match_date FROM transient.detect_daily_counts "
+                "ORDER BY match_date DESC"
             )
             return [r[0].strftime('%Y-%m-%d') for r in cur.fetchall()]
     except Exception as e:
@@ -1391,7 +2819,6 @@ def get_cross_match_results(limit: int = 1000, date: str | None = None) -> list:
     try:
         with get_db_connection() as conn:
             cur = conn.cursor(cursor_factory=extras.RealDictCursor)
-            _ensure_cross_matches_flag_column(cur, conn)
             # Map new column names back to old names expected by routes
             query = (
                 "SELECT match_id AS id, name AS target_name, catalog AS catalog_name, "
@@ -1402,7 +2829,7 @@ def get_cross_match_results(limit: int = 1000, date: str | None = None) -> list:
             )
             params = []
             if date:
-                query += " WHERE updated_date::date = %s"
+                query += " WHERE match_date = %s"
                 params.append(date)
             query += " ORDER BY updated_date DESC"
             if limit and not date:
@@ -1422,21 +2849,23 @@ def get_photometry_batch(names: list) -> dict:
     try:
         with get_db_connection() as conn:
             cur = conn.cursor(cursor_factory=extras.DictCursor)
+            ids = resolve_many(names, cur)
+            if not ids:
+                return {}
             cur.execute(
-                'SELECT o.name, p.phot_id AS id, p."MJD" AS mjd, '
-                'p.mag AS magnitude, p.mag_err AS magnitude_error, p.filter, p.source AS telescope '
+                'SELECT p.obj_id, p.phot_id AS id, p."MJD" AS mjd, '
+                'p.mag AS magnitude, p.mag_err AS magnitude_error, p.filter, p.source AS telescope, '
+                'p.superseded_by '
                 'FROM transient.photometry p '
-                'JOIN transient.objects o ON o.obj_id = p.obj_id '
-                'WHERE o.name = ANY(%s) AND (p.mag IS NULL OR p.mag >= 0) '
-                'ORDER BY o.name, p."MJD" ASC',
-                (list(names),)
+                'WHERE p.obj_id = ANY(%s) AND (p.mag IS NULL OR p.mag >= 0) '
+                'ORDER BY p.obj_id, p."MJD" ASC',
+                (sorted(set(ids.values())),)
             )
-            result: dict = {}
+            points: dict = {}
             for row in cur.fetchall():
                 d = dict(row)
-                n = d.pop('name')
-                result.setdefault(n, []).append(d)
-            return result
+                points.setdefault(d.pop('obj_id'), []).append(d)
+            return {n: points[i] for n, i in ids.items() if i in points}
     except Exception as e:
         logger.error("get_photometry_batch: %s", e)
         return {}
@@ -1467,22 +2896,28 @@ def get_object_details_batch(names: list) -> dict:
 
 
 def get_latest_photometry_for_names(names: list) -> dict:
-    """Return latest valid photometry point per object. Returns {name: {magnitude, filter, mjd}}."""
+    """Return latest valid photometry point per object. Returns {name: {magnitude, filter, mjd}}.
+    Read from transient.photometry_summary (one row per object)."""
     if not names:
         return {}
     try:
         with get_db_connection() as conn:
             cur = conn.cursor(cursor_factory=extras.DictCursor)
+            ids = resolve_many(names, cur)
+            if not ids:
+                return {}
             cur.execute(
-                'SELECT DISTINCT ON (o.name) '
-                '    o.name, p.mag AS magnitude, p.filter, p."MJD" AS mjd '
-                'FROM transient.photometry p '
-                'JOIN transient.objects o ON o.obj_id = p.obj_id '
-                'WHERE o.name = ANY(%s) AND p.mag IS NOT NULL AND p.mag >= 0 '
-                'ORDER BY o.name, p."MJD" DESC',
-                (list(names),)
+                'SELECT s.obj_id, s.latest_mag AS magnitude, s.latest_filter AS filter, '
+                '       s.latest_mjd AS mjd '
+                'FROM transient.photometry_summary s '
+                'WHERE s.obj_id = ANY(%s) AND s.latest_mag IS NOT NULL',
+                (sorted(set(ids.values())),)
             )
-            return {row['name']: dict(row) for row in cur.fetchall()}
+            latest = {}
+            for row in cur.fetchall():
+                d = dict(row)
+                latest[d.pop('obj_id')] = d
+            return {n: dict(latest[i], name=n) for n, i in ids.items() if i in latest}
     except Exception as e:
         logger.error("get_latest_photometry_for_names: %s", e)
         return {}
@@ -1492,57 +2927,18 @@ def get_latest_photometry_for_names(names: list) -> dict:
 # DETECT — Combined single-connection helpers  (Marshal-style)
 # ---------------------------------------------------------------------------
 
-_detect_metadata_cache: dict = {'expires_at': 0.0, 'value': None}
-
-
-def get_detect_metadata(cache_ttl: int = 120) -> dict:
+def get_detect_metadata() -> dict:
     """Return available_dates + daily_counts in a single DB connection.
 
-    Results are cached for *cache_ttl* seconds (default 120 s) to avoid
-    redundant queries every home-page or archives request.
+    Both come from transient.detect_daily_counts (one row per DETECT day),
+    so this is cheap enough to run on every home-page or archives request.
     Returns {'available_dates': [...], 'daily_counts': [...]}.
     """
-    now = _time.monotonic()
-    cached = _detect_metadata_cache.get('value')
-    if cached is not None and now < _detect_metadata_cache['expires_at']:
-        return dict(cached)
-
     try:
         with get_db_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT DISTINCT updated_date::date AS d "
-                "FROM transient.cross_matches ORDER BY d DESC"
-            )
-            available_dates = [r[0].strftime('%Y-%m-%d') for r in cur.fetchall()]
-
-            cur = conn.cursor(cursor_factory=extras.RealDictCursor)
-            cur.execute("""
-                WITH dates AS (
-                    SELECT generate_series(
-                        (SELECT MIN(updated_date::date) FROM transient.cross_matches),
-                        (SELECT MAX(updated_date::date) FROM transient.cross_matches),
-                        '1 day'::interval
-                    )::date AS date
-                )
-                SELECT d.date,
-                       COUNT(DISTINCT c.obj_id) AS unique_targets,
-                       COALESCE(BOOL_OR(c.catalog LIKE 'Lens_%'), FALSE) AS has_lens
-                FROM dates d
-                LEFT JOIN transient.cross_matches c ON d.date = c.updated_date::date
-                GROUP BY d.date ORDER BY d.date DESC
-            """)
-            daily_counts = [
-                {'date': r['date'].strftime('%Y-%m-%d'),
-                 'count': r['unique_targets'],
-                 'has_lens': r['has_lens']}
-                for r in cur.fetchall()
-            ]
-
-        result = {'available_dates': available_dates, 'daily_counts': daily_counts}
-        _detect_metadata_cache['value'] = result
-        _detect_metadata_cache['expires_at'] = now + cache_ttl
-        return dict(result)
+            daily_counts = _detect_daily_counts(conn.cursor())
+        available_dates = [d['date'] for d in daily_counts if d['count']]
+        return {'available_dates': available_dates, 'daily_counts': daily_counts}
     except Exception as e:
         logger.error('get_detect_metadata: %s', e)
         return {'available_dates': [], 'daily_counts': []}
@@ -1557,15 +2953,12 @@ def get_detect_page_data(date: str) -> dict:
     """
     try:
         with get_db_connection() as conn:
-            cur = conn.cursor()
-            _ensure_cross_matches_flag_column(cur, conn)
-
             cur = conn.cursor(cursor_factory=extras.RealDictCursor)
             cur.execute(
                 "SELECT match_id AS id, name AS target_name, catalog AS catalog_name, "
                 "separation AS separation_arcsec, is_host, updated_date AS created_at, "
                 "status, flag, redshift AS z, match_data, match_ra, match_dec "
-                "FROM transient.cross_matches WHERE updated_date::date = %s "
+                "FROM transient.cross_matches WHERE match_date = %s "
                 "ORDER BY updated_date DESC",
                 (date,)
             )
@@ -1592,12 +2985,11 @@ def get_detect_page_data(date: str) -> dict:
 
                 cur = conn.cursor(cursor_factory=extras.DictCursor)
                 cur.execute(
-                    'SELECT DISTINCT ON (o.name) '
-                    '    o.name, p.mag AS magnitude, p.filter, p."MJD" AS mjd '
-                    'FROM transient.photometry p '
-                    'JOIN transient.objects o ON o.obj_id = p.obj_id '
-                    'WHERE o.name = ANY(%s) AND p.mag IS NOT NULL AND p.mag >= 0 '
-                    'ORDER BY o.name, p."MJD" DESC',
+                    'SELECT o.name, s.latest_mag AS magnitude, s.latest_filter AS filter, '
+                    '       s.latest_mjd AS mjd '
+                    'FROM transient.photometry_summary s '
+                    'JOIN transient.objects o ON o.obj_id = s.obj_id '
+                    'WHERE o.name = ANY(%s) AND s.latest_mag IS NOT NULL',
                     (all_names,)
                 )
                 latest_phot = {row['name']: dict(row) for row in cur.fetchall()}
@@ -1632,7 +3024,8 @@ def get_detect_lc_data(target_name: str) -> dict:
 
             cur.execute(
                 'SELECT p.phot_id AS id, p."MJD" AS mjd, '
-                'p.mag AS magnitude, p.mag_err AS magnitude_error, p.filter, p.source AS telescope '
+                'p.mag AS magnitude, p.mag_err AS magnitude_error, p.filter, p.source AS telescope, '
+                'p.superseded_by '
                 'FROM transient.photometry p '
                 'JOIN transient.objects o ON o.obj_id = p.obj_id '
                 'WHERE o.name = %s AND (p.mag IS NULL OR p.mag >= 0) '
@@ -1690,7 +3083,6 @@ def update_cross_match_flag(result_id: int, flag_value: bool) -> bool:
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            _ensure_cross_matches_flag_column(cur, conn)
             cur.execute(
                 "UPDATE transient.cross_matches SET flag = %s WHERE match_id = %s",
                 (flag_value, result_id)
@@ -1706,7 +3098,6 @@ def get_flagged_objects() -> list[list]:
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            _ensure_cross_matches_flag_column(cur, conn)
             cur.execute(
                 "SELECT DISTINCT o.name_prefix, o.name, o.ra, o.dec, "
                 "CASE WHEN o.discovery_date IS NOT NULL THEN "
@@ -1727,7 +3118,6 @@ def save_flag_objects(flag_list: list):
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            _ensure_cross_matches_flag_column(cur, conn)
             count = 0
             for item in flag_list:
                 if len(item) < 2:
@@ -1783,6 +3173,7 @@ def save_cross_match_results(results_list: list):
             )
             name_map = {r[0]: r[1] for r in cur.fetchall()}
 
+            touched = set()
             for r in results_list:
                 obj_id = name_map.get(r['target_name'])
                 if obj_id is None:
@@ -1792,13 +3183,15 @@ def save_cross_match_results(results_list: list):
                 cur.execute(
                     "INSERT INTO transient.cross_matches "
                     "(obj_id, name, catalog, separation, redshift, is_host, updated_date) "
-                    "VALUES (%s,%s,%s,%s,%s,%s,now())",
+                    "VALUES (%s,%s,%s,%s,%s,%s,now()) RETURNING match_date",
                     (obj_id, r['target_name'],
                      r.get('catalog_name', ''),
                      r.get('separation_arcsec'),
                      z,
                      bool(r.get('is_host', False)))
                 )
+                touched.add(cur.fetchone()[0])
+            refresh_detect_daily_counts(cur, touched)
             conn.commit()
     except Exception as e:
         logger.error("save_cross_match_results: %s", e)
@@ -1808,7 +3201,6 @@ def get_object_flag_status(object_name: str) -> bool:
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            _ensure_cross_matches_flag_column(cur, conn)
             cur.execute(
                 "SELECT EXISTS("
                 "  SELECT 1 FROM transient.cross_matches c "
@@ -1827,7 +3219,6 @@ def update_object_flag_by_name(object_name: str, flag_value: bool) -> bool:
     try:
         with get_db_connection() as conn:
             cur = conn.cursor()
-            _ensure_cross_matches_flag_column(cur, conn)
             cur.execute(
                 "UPDATE transient.cross_matches SET flag = %s "
                 "WHERE obj_id = (SELECT obj_id FROM transient.objects WHERE name = %s LIMIT 1)",
@@ -2043,98 +3434,282 @@ def update_tns_redshift(target_name: str, redshift_str: str) -> bool:
                 (z, target_name, target_name)
             )
             conn.commit()
-        # Trigger abs mag recalc
-        try:
-            update_object_abs_mag(target_name)
-        except Exception:
-            pass
+        # The objects_abs_mag_dirty trigger queues the abs mag recompute.
         return True
     except Exception as e:
         logger.error("update_tns_redshift %s: %s", target_name, e)
         return False
 
 
-def update_object_abs_mag(target_name: str) -> bool:
-    logger.debug("update_object_abs_mag called for %s", target_name)
+# brightest_mag / brightest_abs_mag are derived columns.  Triggers queue
+# affected objects in transient.abs_mag_dirty (see migration 0007) and
+# recompute_dirty_abs_mags() refreshes them in batches, so object pages only
+# ever read the stored values.
+_ABS_MAG_BATCH = 2000
+
+
+def _load_ext_m_calculator():
     try:
+        from .. import ext_M_calculator
+    except ImportError:
+        import modules.ext_M_calculator as ext_M_calculator
+    return ext_M_calculator
+
+
+def _recompute_abs_mags(cur, obj_ids: list, ext_M_calculator) -> int:
+    """Recompute brightest_mag (and brightest_abs_mag where a positive
+    redshift is known) for obj_ids; returns the number of objects changed.
+    Objects without usable photometry keep their current values."""
+    cur.execute(
+        "SELECT DISTINCT ON (p.obj_id) p.obj_id, p.mag, p.filter, "
+        "       o.redshift, o.ra, o.dec, o.discovery_filter "
+        "FROM transient.photometry p "
+        "JOIN transient.objects o ON o.obj_id = p.obj_id "
+        "WHERE p.obj_id = ANY(%s) AND p.mag IS NOT NULL AND p.superseded_by IS NULL "
+        "  AND p.mag_err IS NOT NULL AND p.mag_err > 0 AND p.mag_err <= 0.3 "
+        "ORDER BY p.obj_id, p.mag ASC",
+        (list(obj_ids),)
+    )
+    rows = cur.fetchall()
+    if not rows:
+        return 0
+    ids = [r[0] for r in rows]
+    mags = np.array([r[1] for r in rows], dtype=float)
+    abs_mags = np.full(len(rows), np.nan)
+    z = np.array([r[3] if r[3] is not None else np.nan for r in rows], dtype=float)
+    has_z = z > 0
+    if has_z.any():
+        sel = np.flatnonzero(has_z)
+        filters = [rows[i][2] or rows[i][6] or 'r' for i in sel]
         try:
-            from .. import ext_M_calculator
-        except ImportError:
-            import modules.ext_M_calculator as ext_M_calculator
+            ext = ext_M_calculator.get_extinction_batch(
+                [rows[i][4] for i in sel], [rows[i][5] for i in sel], filters)
+        except Exception as e:
+            logger.warning("abs mag extinction lookup failed, using 0: %s", e)
+            ext = np.zeros(sel.size)
+        abs_mags[sel] = ext_M_calculator.apm_to_abm_batch(mags[sel], z[sel], ext)
+
+    values = [
+        (obj_id, float(m), None if math.isnan(a) else float(a))
+        for obj_id, m, a in zip(ids, mags, abs_mags)
+    ]
+    extras.execute_values(
+        cur,
+        "UPDATE transient.objects o "
+        "SET brightest_mag = v.m, "
+        "    brightest_abs_mag = COALESCE(v.am, o.brightest_abs_mag) "
+        "FROM (VALUES %s) AS v(obj_id, m, am) "
+        "WHERE o.obj_id = v.obj_id "
+        "  AND (o.brightest_mag IS DISTINCT FROM v.m "
+        "       OR (v.am IS NOT NULL AND o.brightest_abs_mag IS DISTINCT FROM v.am))",
+        values,
+        template="(%s::bigint, %s::double precision, %s::double precision)",
+        page_size=len(values),
+    )
+    return cur.rowcount
+
+
+def recompute_dirty_abs_mags(batch_size: int = _ABS_MAG_BATCH) -> int:
+    """Drain transient.abs_mag_dirty.  Each batch commits on its own; a mark
+    re-set while its batch was computing survives (marked_at no longer
+    matches) and is picked up by the next batch or run."""
+    try:
+        ext_M_calculator = _load_ext_m_calculator()
+    except ImportError:
+        logger.error("Could not import ext_M_calculator")
+        return 0
+    total = 0
+    while True:
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT obj_id, marked_at FROM transient.abs_mag_dirty "
+                "ORDER BY marked_at LIMIT %s",
+                (batch_size,)
+            )
+            marks = cur.fetchall()
+            if not marks:
+                break
+            total += _recompute_abs_mags(cur, [m[0] for m in marks], ext_M_calculator)
+            extras.execute_values(
+                cur,
+                "DELETE FROM transient.abs_mag_dirty d "
+                "USING (VALUES %s) AS v(obj_id, marked_at) "
+                "WHERE d.obj_id = v.obj_id AND d.marked_at = v.marked_at",
+                marks,
+                template="(%s::bigint, %s::timestamptz)",
+                page_size=1000,
+            )
+            conn.commit()
+        if len(marks) < batch_size:
+            break
+    if total:
+        logger.info("recompute_dirty_abs_mags: updated %d objects", total)
+    return total
+
+
+def update_object_abs_mag(target_name: str) -> bool:
+    """Recompute one object's brightest/absolute magnitude immediately.
+    Request paths should not call this; it is for scripts and admin tools."""
+    try:
+        ext_M_calculator = _load_ext_m_calculator()
     except ImportError:
         logger.error("Could not import ext_M_calculator")
         return False
+    try:
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            obj_id = _resolve_obj_id_with_prefix(cur, target_name)
+            if obj_id is None:
+                return False
+            _recompute_abs_mags(cur, [obj_id], ext_M_calculator)
+            cur.execute("DELETE FROM transient.abs_mag_dirty WHERE obj_id = %s", (obj_id,))
+            conn.commit()
+        return True
+    except Exception as e:
+        logger.error("update_object_abs_mag %s: %s", target_name, e)
+    return False
+
 
+# ---------------------------------------------------------------------------
+# Object cards  (precomputed detail-page document, migration 0013)
+# ---------------------------------------------------------------------------
+# transient.object_cards holds one JSONB document per object with everything
+# the detail page renders server-side (the sections load over AJAX).
+# Triggers on objects queue rows whose card columns changed in
+# transient.object_card_dirty; rebuild_dirty_object_cards() drains the queue
+# every minute.
+
+_CARD_VERSION = 2
+_CARD_BATCH = 500
+
+
+def _load_astronomy_calculator():
     try:
+        from .. import astronomy_calculator
+    except ImportError:
+        import modules.astronomy_calculator as astronomy_calculator
+    return astronomy_calculator
+
+
+def _json_safe(value):
+    """Card values as JSONB-storable types: NaN/Inf → None, dates → str.
+    Datetimes use the format the detail route renders."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def _build_object_cards(cur, obj_ids: list) -> dict:
+    """Return {obj_id: card} for obj_ids that still exist (RealDictCursor)."""
+    cur.execute(
+        f"SELECT {OBJECT_DETAIL_COLS} FROM transient.objects o WHERE o.obj_id = ANY(%s)",
+        (list(obj_ids),)
+    )
+    cards = {r['objid']: {'v': _CARD_VERSION, 'object': dict(r)} for r in cur.fetchall()}
+    if not cards:
+        return {}
+    calc = None
+    for obj_id, card in cards.items():
+        obj = card['object']
+        z = obj.get('redshift')
+        if z is not None and z > 0:
+            try:
+                calc = calc or _load_astronomy_calculator()
+                obj['distance_mpc'] = calc.calculate_redshift_distance(float(z)).get('distance_mpc')
+            except Exception as e:
+                logger.warning("object card %s: distance: %s", obj_id, e)
+    return cards
+
+
+def _store_object_cards(cur, cards: dict):
+    if not cards:
+        return
+    extras.execute_values(
+        cur,
+        "INSERT INTO transient.object_cards (obj_id, card) VALUES %s "
+        "ON CONFLICT (obj_id) DO UPDATE SET card = EXCLUDED.card, built_at = now()",
+        [(obj_id, extras.Json(_json_safe(card))) for obj_id, card in sorted(cards.items())],
+        page_size=len(cards),
+    )
+
+
+def rebuild_dirty_object_cards(batch_size: int = _CARD_BATCH) -> int:
+    """Drain transient.object_card_dirty, rebuilding each marked card.  Marks
+    re-set during a batch survive (marked_at compare) for the next pass."""
+    total = 0
+    while True:
         with get_db_connection() as conn:
-            cur = conn.cursor(cursor_factory=extras.DictCursor)
+            cur = conn.cursor(cursor_factory=extras.RealDictCursor)
             cur.execute(
-                "SELECT obj_id, name, name_prefix, redshift, ra, dec, discovery_filter "
-                "FROM transient.objects "
-                "WHERE name = %s OR name ILIKE %s "
-                "OR (COALESCE(name_prefix,'') || name) ILIKE %s LIMIT 1",
-                (target_name, target_name, target_name)
+                "SELECT obj_id, marked_at FROM transient.object_card_dirty "
+                "ORDER BY marked_at LIMIT %s",
+                (batch_size,)
             )
-            obj = cur.fetchone()
-            if not obj:
-                return False
-            obj = dict(obj)
-            obj_id = obj['obj_id']
-
-            # Brightest mag from photometry
+            marks = [(r['obj_id'], r['marked_at']) for r in cur.fetchall()]
+            if not marks:
+                break
+            cards = _build_object_cards(cur, [m[0] for m in marks])
+            _store_object_cards(cur, cards)
+            extras.execute_values(
+                cur,
+                "DELETE FROM transient.object_card_dirty d "
+                "USING (VALUES %s) AS v(obj_id, marked_at) "
+                "WHERE d.obj_id = v.obj_id AND d.marked_at = v.marked_at",
+                marks,
+                template="(%s::bigint, %s::timestamptz)",
+                page_size=1000,
+            )
+            conn.commit()
+            total += len(cards)
+        if len(marks) < batch_size:
+            break
+    if total:
+        logger.info("rebuild_dirty_object_cards: rebuilt %d cards", total)
+    return total
+
+
+def get_object_card(object_name: str) -> dict | None:
+    """Return the precomputed card for object_name, or None when the name does
+    not resolve or the card is missing or awaiting a rebuild.  A missing card
+    is queued, so the caller's live fallback is only needed once; a pending
+    rebuild means the stored card may predate the latest write."""
+    try:
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            obj_id = _resolve_obj_id_with_prefix(cur, object_name)
+            if obj_id is None:
+                return None
             cur.execute(
-                "SELECT mag AS magnitude, filter, mag_err AS magnitude_error "
-                "FROM transient.photometry "
-                "WHERE obj_id = %s AND mag IS NOT NULL "
-                "AND mag_err IS NOT NULL AND mag_err > 0 AND mag_err <= 0.3",
+                "SELECT c.card, d.obj_id IS NOT NULL "
+                "FROM (SELECT %s::bigint AS obj_id) x "
+                "LEFT JOIN transient.object_cards c ON c.obj_id = x.obj_id "
+                "LEFT JOIN transient.object_card_dirty d ON d.obj_id = x.obj_id",
                 (obj_id,)
             )
-            rows = cur.fetchall()
-            min_mag = float('inf')
-            brightest_filter = None
-            for row in rows:
-                try:
-                    val = float(row['magnitude'])
-                    if val < min_mag:
-                        min_mag = val
-                        brightest_filter = row['filter']
-                except Exception:
-                    continue
-
-            if min_mag == float('inf'):
-                return False
-            brightest_mag = min_mag
-
+            card, pending = cur.fetchone()
+            if pending:
+                return None
+            if card and card.get('v') == _CARD_VERSION:
+                return card
             cur.execute(
-                "UPDATE transient.objects SET brightest_mag = %s WHERE obj_id = %s",
-                (brightest_mag, obj_id)
+                "INSERT INTO transient.object_card_dirty (obj_id) VALUES (%s) "
+                "ON CONFLICT (obj_id) DO NOTHING",
+                (obj_id,)
             )
             conn.commit()
-
-            z = obj.get('redshift')
-            if z is None or float(z) <= 0:
-                return False
-            z = float(z)
-
-            filter_name = brightest_filter or obj.get('discovery_filter') or 'r'
-            try:
-                extinction = ext_M_calculator.get_extinction(obj['ra'], obj['dec'], filter_name)
-                if not isinstance(extinction, (int, float)):
-                    extinction = 0
-            except Exception:
-                extinction = 0
-
-            abs_mag = ext_M_calculator.apm_to_abm(brightest_mag, z, extinction)
-            if isinstance(abs_mag, (int, float)):
-                cur.execute(
-                    "UPDATE transient.objects SET brightest_abs_mag = %s WHERE obj_id = %s",
-                    (abs_mag, obj_id)
-                )
-                conn.commit()
-                return True
+            return None
     except Exception as e:
-        logger.error("update_object_abs_mag %s: %s", target_name, e)
-    return False
+        logger.error("get_object_card(%s): %s", object_name, e)
+        return None
 
 
 # ---------------------------------------------------------------------------
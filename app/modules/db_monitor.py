@@ -136,6 +136,16 @@ def check_and_alert():
         pg_info.get("active", "?"), pg_info.get("idle", "?"),
         pg_info.get("idle_in_tx", "?"),
     )
+    try:
+        from modules.database.transient import get_view_log_stats
+        views = get_view_log_stats()
+        logger.info(
+            "db_monitor: view buffer queued=%d/%d written=%d dropped=%d failed=%d",
+            views["queued"], views["queue_max"], views["written"],
+            views["dropped"], views["failed"],
+        )
+    except Exception as exc:
+        logger.debug("db_monitor: view buffer stats unavailable: %s", exc)
 
     # Determine alert level
     if pct >= CRIT_PCT:
@@ -9,9 +9,11 @@ from psycopg2.extras import RealDictCursor
 try:
     from modules.database import get_db_connection
     from modules.database.catalog import cone_search_desi, cone_search_lens
+    from modules.database.transient import refresh_detect_daily_counts
 except ImportError:
     from database import get_db_connection
     from database.catalog import cone_search_desi, cone_search_lens
+    from database.transient import refresh_detect_daily_counts
 
 logger = logging.getLogger(__name__)
 
@@ -270,23 +272,11 @@ def save_detect_results(target_name, results):
                 # Cleanup legacy sentinel rows from old implementation.
                 cur.execute(
                     "DELETE FROM transient.cross_matches "
-                    "WHERE obj_id = %s AND catalog = 'DETECT_STATUS_RUN'",
+                    "WHERE obj_id = %s AND catalog = 'DETECT_STATUS_RUN' "
+                    "RETURNING match_date",
                     (obj_id,)
                 )
-
-                # Ensure extra columns exist
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS match_data JSONB"
-                )
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS match_ra DOUBLE PRECISION"
-                )
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS match_dec DOUBLE PRECISION"
-                )
+                touched = {r[0] for r in cur.fetchall()}
 
                 # Deduplicate: same catalog + separation within 0.5 arcsec
                 seen_keys = set()
@@ -312,7 +302,7 @@ def save_detect_results(target_name, results):
                         "INSERT INTO transient.cross_matches "
                         "(obj_id, name, catalog, separation, redshift, is_host,"
                         " match_data, match_ra, match_dec, updated_date) "
-                        "VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,now())",
+                        "VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,now()) RETURNING match_date",
                         (
                             obj_id,
                             target_name,
@@ -325,7 +315,10 @@ def save_detect_results(target_name, results):
                             float(m_dec) if m_dec is not None else None,
                         )
                     )
+                    touched.add(cur.fetchone()[0])
 
+                # Keep the DETECT calendar summary in step with this write.
+                refresh_detect_daily_counts(cur, touched)
                 conn.commit()
     except Exception as e:
         print(f"Error saving detect results: {e}")
@@ -335,22 +328,6 @@ def get_detect_results_for_target(target_name):
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS flag BOOLEAN DEFAULT FALSE"
-                )
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS match_data JSONB"
-                )
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS match_ra DOUBLE PRECISION"
-                )
-                cur.execute(
-                    "ALTER TABLE transient.cross_matches "
-                    "ADD COLUMN IF NOT EXISTS match_dec DOUBLE PRECISION"
-                )
                 cur.execute(
                     "SELECT c.match_id AS id, c.catalog AS catalog_name, "
                     "c.separation AS separation_arcsec, c.updated_date AS created_at, "
@@ -3,6 +3,8 @@ from dustmaps.sfd import SFDQuery
 import math
 from datetime import datetime
 
+import numpy as np
+
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from astropy.cosmology import FlatLambdaCDM
@@ -32,9 +34,7 @@ def setup_filter_mapping():
     }
     return filter_mapping
 
-def sf11_extinction(ebv, filter_name):
-    """Schlafly & Finkbeiner (2011)"""
-    extinction_ratios = {
+_SF11_RATIOS = {
     'U': 4.107, 'B': 3.641, 'V': 2.682, 'R': 2.119, 'I': 1.516,
     'J': 0.709, 'H': 0.449, 'K': 0.302,
     'u': 4.239,  # SDSS u-band (SF11)
@@ -44,7 +44,13 @@ def sf11_extinction(ebv, filter_name):
     'z': 1.263,  # SDSS z-band (SF11)
     'Y': 1.087, 
     'W1': 0.184, 'W2': 0.113,
-    }
+}
+_SF11_BANDS = tuple(_SF11_RATIOS)
+
+
+def sf11_extinction(ebv, filter_name):
+    """Schlafly & Finkbeiner (2011)"""
+    extinction_ratios = _SF11_RATIOS
 
     if filter_name == 'BVR_avg':
         b_ext = ebv * extinction_ratios['B']
@@ -75,6 +81,42 @@ def get_extinction(ra, dec, filter_name):
     return extinction
 
 
+_sfd = None
+
+
+def _sfd_query():
+    # Loading the SFD maps is the expensive part; share one instance.
+    global _sfd
+    if _sfd is None:
+        _sfd = SFDQuery()
+    return _sfd
+
+
+def get_extinction_batch(ras, decs, filter_names):
+    """Vectorised get_extinction: one SFD lookup for all coordinates.
+    Unsupported filters fall back to V, as in sf11_extinction."""
+    coord = SkyCoord(ra=np.asarray(ras, dtype=float) * u.deg,
+                     dec=np.asarray(decs, dtype=float) * u.deg, frame='icrs')
+    ebv = np.atleast_1d(_sfd_query()(coord))
+    filter_mapping = setup_filter_mapping()
+    ratios = {}
+    for f in set(filter_names):
+        mapped = filter_mapping.get(f, f)
+        ratios[f] = sf11_extinction(1.0, mapped if mapped in ('BVR_avg', 'gr_avg', *_SF11_BANDS) else 'V')
+    return ebv * np.array([ratios[f] for f in filter_names])
+
+
+def apm_to_abm_batch(apparent_mags, redshifts, extinctions=0):
+    """Vectorised apm_to_abm for redshifts > 0; returns a float array
+    rounded like the scalar version."""
+    m = np.asarray(apparent_mags, dtype=float)
+    z = np.asarray(redshifts, dtype=float)
+    distance_pc = cosmo.luminosity_distance(z).to(u.pc).value
+    distance_modulus = 5 * np.log10(distance_pc) - 5
+    k_correction = 2.5 * np.log10(1 + z)
+    return np.round(m - distance_modulus - k_correction - np.asarray(extinctions, dtype=float), 3)
+
+
 def z_to_lmd(redshift, redshift_error=None):
     try:
         if not isinstance(redshift, (int, float)) or redshift < 0:
@@ -0,0 +1,105 @@
+"""Level-of-detail downsampling for spectra and light curves.
+
+A browser plot a few hundred pixels wide cannot show more than a handful of
+samples per pixel, so shipping every sample of a 40k-pixel spectrum (or a
+dozen of them in the stacked view) is wasted bytes and render time.  This
+module picks a shape-preserving subset with M4 binning: the x-range is split
+into one bin per target pixel and each bin keeps its first, last, minimum and
+maximum sample.  Peaks, troughs and line edges therefore survive exactly;
+only samples that would be drawn on top of each other are dropped.
+
+Selections are index arrays, so they are invariant under the linear
+transforms the plot builders apply (rest-frame scaling, normalisation,
+stacking offsets) and can be cached per (object, spectrum_id, width, window).
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Below this many samples per target pixel the data is sent as-is.
+LOD_MIN_SAMPLES_PER_PIXEL = 4
+LOD_MIN_WIDTH = 100
+LOD_MAX_WIDTH = 8000
+
+_CACHE_MAX_ENTRIES = 512
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def window_bounds(x: np.ndarray, lo: float | None, hi: float | None) -> tuple[int, int]:
+    """Return [start, stop) covering x in [lo, hi] plus one sample either side,
+    so a zoomed line runs to the plot edges.  x must be sorted ascending."""
+    start = 0 if lo is None else max(int(np.searchsorted(x, lo, side='left')) - 1, 0)
+    stop = x.size if hi is None else min(int(np.searchsorted(x, hi, side='right')) + 1, x.size)
+    return start, max(stop, start)
+
+
+def m4_indices(x: np.ndarray, y: np.ndarray, n_bins: int) -> np.ndarray:
+    """Indices (sorted) of the first/last/min/max sample of each of n_bins
+    equal-width x bins.  x must be sorted ascending; NaN y never wins min/max
+    but NaN samples at bin edges are kept so gaps stay visible."""
+    n = x.size
+    if n == 0 or n <= n_bins * LOD_MIN_SAMPLES_PER_PIXEL:
+        return np.arange(n)
+
+    x0, x1 = float(x[0]), float(x[-1])
+    span = (x1 - x0) or 1.0
+    bins = np.minimum(((x - x0) / span * n_bins).astype(np.int64), n_bins - 1)
+
+    # Bin boundaries: positions where the bin id changes.
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+
+    # Min/max per bin: order samples by (bin, y) once; NaNs sort last in each
+    # bin, so the last finite sample is the max.
+    y_key = np.where(np.isnan(y), np.inf, y)
+    order = np.lexsort((y_key, bins))
+    finite = ~np.isnan(y[order])
+    finite_counts = np.add.reduceat(finite.astype(np.int64), starts)
+    mins = order[starts]
+    maxs = order[starts + np.maximum(finite_counts, 1) - 1]
+
+    keep = np.concatenate((starts, ends, mins, maxs))
+    return np.unique(keep)
+
+
+def lod_indices(key, x: np.ndarray, y: np.ndarray, width: int | None,
+                window: tuple[float | None, float | None] | None = None) -> np.ndarray | None:
+    """Return the sample indices to draw for a trace, or None for "all of them".
+
+    key identifies the underlying data (e.g. (object_name, spectrum_id)); the
+    sample count is folded into the cache key so a re-upload never serves a
+    stale selection even before invalidate() runs."""
+    if not width and not window:
+        return None
+    lo, hi = window if window else (None, None)
+    cache_key = (key, int(x.size), width, lo, hi)
+    with _cache_lock:
+        hit = _cache.get(cache_key)
+        if hit is not None:
+            _cache.move_to_end(cache_key)
+            return hit
+
+    start, stop = window_bounds(x, lo, hi)
+    if width:
+        idx = m4_indices(x[start:stop], y[start:stop], int(width)) + start
+    else:
+        idx = np.arange(start, stop)
+
+    with _cache_lock:
+        _cache[cache_key] = idx
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return idx
+
+
+def invalidate(object_name: str | None = None):
+    """Drop cached selections for one object (or everything)."""
+    with _cache_lock:
+        if object_name is None:
+            _cache.clear()
+            return
+        for k in [k for k in _cache if isinstance(k[0], tuple) and k[0][:1] == (object_name,)]:
+            del _cache[k]
@@ -144,8 +144,18 @@ def fetch_missing_photometry():
             len(objects),
         )
 
+        # One lookup for the whole list: names that already have photometry.
         conn = get_tns_db_connection()
         cursor = conn.cursor()
+        cursor.execute(
+            "SELECT o.name FROM transient.photometry_summary s "
+            "JOIN transient.objects o ON s.obj_id=o.obj_id "
+            "WHERE o.name = ANY(%s) AND s.n_points > 0",
+            ([(obj.get('name') or '').strip() for obj in objects],)
+        )
+        have_phot = {r[0] for r in cursor.fetchall()}
+        cursor.close()
+        conn.close()
 
         for obj in objects:
             name = obj.get('name', '').strip()
@@ -154,13 +164,7 @@ def fetch_missing_photometry():
             if (obj.get('name_prefix') or '').strip().upper() == 'FRB':
                 continue
             checked += 1
-            cursor.execute(
-                "SELECT COUNT(*) FROM transient.photometry p "
-                "JOIN transient.objects o ON p.obj_id=o.obj_id "
-                "WHERE o.name = %s", (name,)
-            )
-            count = cursor.fetchone()[0]
-            if count > 0:
+            if name in have_phot:
                 continue
 
             triggered += 1
@@ -185,9 +189,6 @@ def fetch_missing_photometry():
                     fail_count,
                 )
 
-        cursor.close()
-        conn.close()
-
         logger.info(
             "event=phot_fetch_missing_done run_id=%s checked=%s triggered=%s success=%s failed=%s",
             run_id,
@@ -284,15 +285,11 @@ def update_target_mags():
                 new_full_name = current_prefix + bare_name
                 name_changed = (new_full_name != full_name)
 
-            # Latest non-upper-limit magnitude from photometry
+            # Latest detection, from the per-object photometry summary
             tns_cursor.execute(
-                                """SELECT p.mag FROM transient.photometry p
-                   JOIN transient.objects o ON p.obj_id=o.obj_id
-                   WHERE o.name = %s
-                                         AND p.mag IS NOT NULL
-                                         AND CAST(p.mag AS TEXT) NOT LIKE '>%%'
-                   ORDER BY p."MJD" DESC
-                   LIMIT 1""",
+                """SELECT s.latest_mag FROM transient.photometry_summary s
+                   JOIN transient.objects o ON s.obj_id=o.obj_id
+                   WHERE o.name = %s AND s.latest_mag IS NOT NULL""",
                 (bare_name,)
             )
             phot_row = tns_cursor.fetchone()
@@ -383,117 +380,46 @@ def update_target_mags():
 # Daily follow-up retirement check
 # ---------------------------------------------------------------------------
 
-_FOLLOWUP_RETIRE_DAYS = 2   # retire if last photometry point is older than this
-
-
 def retire_stale_followups():
     """Daily job: move Follow-up objects to Finish when they are no longer active.
 
-    Two conditions independently trigger retirement:
-      1. Status is Snoozed  — already effectively inactive; mark Finish.
-      2. Last photometry point is > _FOLLOWUP_RETIRE_DAYS days old (or missing)
-         — nothing new to observe.
-
-    Objects in status 'Follow-up' that just received fresh photometry keep
-    their status unchanged.
+    Applies the 'retire_followups' rule set of transient.status_rules, one
+    set-based UPDATE per rule.  The seeded rules retire:
+      1. Snoozed objects  — already effectively inactive; mark Finish.
+      2. Follow-up objects whose last photometry point is more than
+         idle_days (2) old, or missing — nothing new to observe.
     """
-    from datetime import timezone
-
     run_id = datetime.utcnow().strftime('%Y%m%d%H%M%S')
     logger.info("event=retire_stale_followups_start run_id=%s", run_id)
 
-    retired_snoozed = []
-    retired_stale   = []
-    skipped         = []
-    errors          = []
-
     try:
-        from modules.database import get_db_connection
-
-        with get_db_connection() as conn:
-            cur = conn.cursor()
-
-            # Fetch all Follow-up objects with their last_phot_date and status
-            cur.execute(
-                """SELECT name, status, last_phot_date
-                   FROM transient.objects
-                   WHERE status IN ('Follow-up', 'Snoozed')"""
-            )
-            rows = cur.fetchall()
-
-        now_utc = datetime.now(timezone.utc)
-
-        for name, status, last_phot_date in rows:
-            try:
-                retire_reason = None
-
-                if status == 'Snoozed':
-                    # Rule 1: Follow-up that got snoozed → retire
-                    retire_reason = 'snoozed'
-
-                elif status == 'Follow-up':
-                    if last_phot_date is None:
-                        # No photometry at all → retire
-                        retire_reason = 'no_photometry'
-                    else:
-                        # Normalise: DB may return a date or a datetime
-                        if hasattr(last_phot_date, 'tzinfo') and last_phot_date.tzinfo is None:
-                            last_phot_date = last_phot_date.replace(tzinfo=timezone.utc)
-                        elif not hasattr(last_phot_date, 'tzinfo'):
-                            # plain date → midnight UTC
-                            from datetime import date as _date
-                            last_phot_date = datetime(
-                                last_phot_date.year, last_phot_date.month, last_phot_date.day,
-                                tzinfo=timezone.utc
-                            )
-                        age_days = (now_utc - last_phot_date).total_seconds() / 86400
-                        if age_days > _FOLLOWUP_RETIRE_DAYS:
-                            retire_reason = f'stale_{age_days:.1f}d'
-
-                if retire_reason is None:
-                    skipped.append(name)
-                    continue
-
-                # Update to Finish
-                from modules.database.transient import update_object_status
-                ok = update_object_status(name, 'finished')
-                if ok:
-                    logger.info(
-                        "event=retire_followup run_id=%s object=%s reason=%s prev_status=%s",
-                        run_id, name, retire_reason, status,
-                    )
-                    if status == 'Snoozed':
-                        retired_snoozed.append(name)
-                    else:
-                        retired_stale.append(name)
-                else:
-                    logger.warning(
-                        "event=retire_followup_failed run_id=%s object=%s", run_id, name
-                    )
-                    errors.append(name)
-
-            except Exception as e:
-                logger.error(
-                    "event=retire_followup_object_error run_id=%s object=%s error=%s",
-                    run_id, name, e,
-                )
-                errors.append(name)
-
+        from modules.database.transient import apply_status_rules
+        changed = apply_status_rules('retire_followups')
     except Exception as e:
         logger.error("event=retire_stale_followups_error run_id=%s error=%s", run_id, e)
         return {"error": str(e)}
 
+    retired_snoozed = []
+    retired_stale   = []
+    for rule, rows in changed.items():
+        for r in rows:
+            logger.info(
+                "event=retire_followup run_id=%s object=%s rule=%s prev_status=%s",
+                run_id, r['name'], rule, r['prev_status'],
+            )
+            if r['prev_status'] == 'Snoozed':
+                retired_snoozed.append(r['name'])
+            else:
+                retired_stale.append(r['name'])
+
     logger.info(
-        "event=retire_stale_followups_done run_id=%s retired_snoozed=%s retired_stale=%s skipped=%s errors=%s",
+        "event=retire_stale_followups_done run_id=%s retired_snoozed=%s retired_stale=%s",
         run_id,
         len(retired_snoozed),
         len(retired_stale),
-        len(skipped),
-        len(errors),
     )
     return {
         "retired_snoozed": retired_snoozed,
         "retired_stale":   retired_stale,
-        "skipped":         len(skipped),
-        "errors":          errors,
+        "by_rule":         {rule: len(rows) for rule, rows in changed.items()},
     }
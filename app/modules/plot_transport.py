@@ -0,0 +1,122 @@
+"""Binary columnar transport for plotly figures.
+
+Plot routes normally ship a figure as JSON text (or an HTML div), which for
+large spectra and survey light curves is dominated by number formatting.  A
+*plot frame* keeps the figure structure (layout, trace styling) as a small
+JSON header and moves every numeric per-point array into raw little-endian
+typed buffers that the browser wraps in Float32Array / Float64Array views
+without parsing.
+
+Frame layout (all integers little-endian)::
+
+    b'KPF1' | uint32 header_len | header JSON (UTF-8) | pad to 8 | buffers...
+
+The header is ``{"meta": {...}, "figure": {...}, "columns": [...]}``.  Every
+array that was moved out of the figure is replaced by ``{"$col": i}`` and
+``columns[i]`` gives ``dtype`` ('f4' / 'f8'), ``offset`` (relative to the
+first buffer, i.e. the 8-aligned end of the header), ``length`` and, for 2-D
+arrays such as customdata, ``shape``.  Buffers start on 8-byte boundaries so
+typed-array views can be created in place.
+
+The client-side decoder is ``decodePlotFrame`` in marshal/static/js/object_detail.js.
+"""
+
+import json
+import struct
+
+import numpy as np
+from plotly.utils import PlotlyJSONEncoder
+
+FRAME_MAGIC = b'KPF1'
+FRAME_MIMETYPE = 'application/vnd.kinder.plotframe'
+
+# ``format=`` values accepted by the plot routes.  Both names select the same
+# typed-array frame; 'arrow' is kept as the client-facing name for the
+# columnar mode (pyarrow is not a dependency, so no Arrow IPC is emitted).
+BINARY_FORMATS = ('arrow', 'f32')
+
+_TRACE_ARRAY_KEYS = ('x', 'y', 'customdata')
+_ERROR_KEYS = ('error_x', 'error_y')
+_ERROR_ARRAY_KEYS = ('array', 'arrayminus')
+
+
+def wants_binary(fmt: str | None) -> bool:
+    return (fmt or '').strip().lower() in BINARY_FORMATS
+
+
+def _numeric_array(values) -> np.ndarray | None:
+    """Return values as a float64 array, or None if they are not purely numeric
+    (strings, dates, ragged lists).  None entries become NaN."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'fiub':
+        return values.astype(np.float64, copy=False)
+    try:
+        arr = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim not in (1, 2) or arr.size == 0:
+        return None
+    return arr
+
+
+class _FrameBuilder:
+    def __init__(self):
+        self.columns = []
+        self.buffers = []
+        self.offset = 0
+
+    def add(self, arr: np.ndarray, dtype: str) -> dict:
+        buf = np.ascontiguousarray(arr, dtype=np.dtype(dtype).newbyteorder('<')).tobytes()
+        col = {'dtype': dtype, 'offset': self.offset, 'length': int(arr.size)}
+        if arr.ndim == 2:
+            col['shape'] = [int(arr.shape[0]), int(arr.shape[1])]
+        self.columns.append(col)
+        pad = (-len(buf)) % 8
+        self.buffers.append(buf + b'\0' * pad)
+        self.offset += len(buf) + pad
+        return {'$col': len(self.columns) - 1}
+
+
+def encode_frame(figure, meta: dict | None = None,
+                 x_dtype: str = 'f4', y_dtype: str = 'f4') -> bytes:
+    """Serialise a plotly Figure (or its dict form) into a plot frame.
+
+    x_dtype / y_dtype choose the wire precision of the trace x and y columns:
+    float32 is ample for wavelength/flux and magnitudes, while MJD needs 'f8'
+    to keep sub-minute resolution.  Error bars and customdata use y_dtype."""
+    fig = figure.to_plotly_json() if hasattr(figure, 'to_plotly_json') else dict(figure)
+    builder = _FrameBuilder()
+    traces = []
+    for trace in fig.get('data', []):
+        trace = dict(trace)
+        for key in _TRACE_ARRAY_KEYS:
+            if key not in trace or trace[key] is None:
+                continue
+            arr = _numeric_array(trace[key])
+            if arr is not None:
+                trace[key] = builder.add(arr, x_dtype if key == 'x' else y_dtype)
+        for key in _ERROR_KEYS:
+            err = trace.get(key)
+            if not isinstance(err, dict):
+                continue
+            err = dict(err)
+            for sub in _ERROR_ARRAY_KEYS:
+                if err.get(sub) is None:
+                    continue
+                arr = _numeric_array(err[sub])
+                if arr is not None:
+                    err[sub] = builder.add(arr, y_dtype)
+            trace[key] = err
+        traces.append(trace)
+
+    header = json.dumps(
+        {
+            'meta': meta or {},
+            'figure': {'data': traces, 'layout': fig.get('layout', {})},
+            'columns': builder.columns,
+        },
+        cls=PlotlyJSONEncoder,
+        separators=(',', ':'),
+    ).encode('utf-8')
+    head = FRAME_MAGIC + struct.pack('<I', len(header)) + header
+    head += b'\0' * ((-len(head)) % 8)
+    return head + b''.join(builder.buffers)
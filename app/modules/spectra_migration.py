@@ -0,0 +1,41 @@
+"""One-shot migration of legacy per-sample spectroscopy rows into the packed
+transient.spectra table (one row per spectrum).
+
+Reads keep working before, during and after the migration: the spectrum read
+path falls back to transient.spectroscopy for anything not yet moved.
+
+Usage:
+    python -m modules.spectra_migration            # migrate everything
+    python -m modules.spectra_migration 500        # first 500 objects only
+"""
+
+import logging
+import sys
+
+try:
+    from modules.database.transient import migrate_legacy_spectroscopy
+except ImportError:
+    from database.transient import migrate_legacy_spectroscopy
+
+logger = logging.getLogger(__name__)
+
+
+def run(obj_limit: int | None = None) -> int:
+    migrated = migrate_legacy_spectroscopy(obj_limit=obj_limit)
+    logger.info("spectra_migration: %d spectra packed into transient.spectra", migrated)
+    return migrated
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+    limit = None
+    if len(sys.argv) > 1:
+        try:
+            limit = int(sys.argv[1])
+        except ValueError:
+            print(f"Invalid object limit: {sys.argv[1]}")
+            sys.exit(1)
+    print(f"Migrated {run(limit)} spectra.")
@@ -2328,6 +2328,7 @@ def api_public_object(object_name):
                     full_name, 'phot', phot,
                     user_email=user_email, user_groups=user_groups, is_admin=is_admin,
                 )
+                phot = TNSObjectDB.drop_superseded(phot)
                 out['photometry']       = phot
                 out['photometry_count'] = len(phot)
             except Exception as pe:
@@ -714,6 +714,8 @@ def all_sources():
                        UNION
                        SELECT DISTINCT source FROM transient.spectroscopy
                        WHERE source IS NOT NULL
+                       UNION
+                       SELECT DISTINCT source FROM transient.spectra
                        ORDER BY source'''
                 )
                 sources = [row[0] for row in cursor.fetchall()]
@@ -862,6 +864,11 @@ _SCHEDULED_JOBS = {
     'daily_target_mag_update':      ('Update Target Mags',        'Daily 05:00 UTC',  'cron',     {'hour': 5,  'minute': 0}),
     'daily_retire_stale_followups': ('Retire Stale Follow-ups',   'Daily 05:30 UTC',  'cron',     {'hour': 5,  'minute': 30}),
     'daily_host_redshift_sync':     ('Host Redshift Sync',        'Daily 06:00 UTC',  'cron',     {'hour': 6,  'minute': 0}),
+    'daily_stats_counters_rebuild': ('Rebuild Stats Counters',    'Daily 06:30 UTC',  'cron',     {'hour': 6,  'minute': 30}),
+    'daily_view_partitions':        ('View Log Partitions',       'Daily 06:45 UTC',  'cron',     {'hour': 6,  'minute': 45}),
+    'view_rollup':                  ('Object View Rollup',        'Every 60 min',     'interval', {'minutes': 60}),
+    'abs_mag_recompute':            ('Recompute Abs Mags',        'Every 5 min',      'interval', {'minutes': 5}),
+    'object_card_rebuild':          ('Rebuild Object Cards',      'Every 1 min',      'interval', {'minutes': 1}),
     'db_monitor':                   ('DB Health Monitor',         'Every 10 min',     'interval', {'minutes': 10}),
     'db_recycle':                   ('DB Connection Recycle',     'Every 30 min',     'interval', {'minutes': 30}),
     'detect_page_prewarm':          ('Detect Page Prewarm',       'Every 30 min',     'interval', {'minutes': 30}),
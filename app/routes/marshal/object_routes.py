@@ -2,6 +2,8 @@
 Object routes for the Kinder web application.
 """
 import re
+import json
+import itertools
 import math
 import logging
 import urllib.parse
@@ -13,11 +15,10 @@ logger = logging.getLogger(__name__)
 
 from modules.database.transient import (
     search_tns_objects, update_object_status, update_object_activity,
-    TNSObjectDB, update_object_abs_mag,
-    _parse_spectrum_id, _build_spectrum_label, _format_spectrum_observation_label,
-    _phase_from_stored_value
+    TNSObjectDB, invalidate_resolver, get_object_card, refresh_detect_daily_counts,
 )
-from modules.database import get_db_connection, get_tns_db_connection, OBJECT_COMPAT_COLS
+from modules.database import get_db_connection, get_tns_db_connection, OBJECT_COMPAT_COLS, OBJECT_DETAIL_COLS
+from modules.database.parallel import run_parallel
 from modules.request_validation import get_int_arg, get_float_arg, ParamOutOfRangeError
 from modules.database.auth import (
     get_all_groups, get_object_permissions, grant_object_permission,
@@ -27,6 +28,8 @@ from modules.database.auth import (
 )
 from modules.database.catalog import get_ned_cache, upsert_ned_cache
 from modules.data_processing import DataVisualization
+from modules.plot_transport import encode_frame, wants_binary, FRAME_MIMETYPE
+from modules import lod
 from modules import ext_M_calculator
 
 
@@ -34,6 +37,57 @@ from flask import Blueprint
 objects_bp = Blueprint('marshal_bp', __name__)
 """Register object routes with the Flask app"""
 
+
+def _fetch_detail_row(cur, where: str, value: str) -> dict | None:
+    """One object row in the detail-page projection, or None."""
+    cur.execute(
+        f"SELECT {OBJECT_DETAIL_COLS} FROM transient.objects o WHERE {where}",
+        (value,)
+    )
+    result = cur.fetchone()
+    if not result:
+        return None
+    columns = [desc[0] for desc in cur.description]
+    return dict(zip(columns, result))
+
+
+def _fetch_alias_name(cur, object_name: str) -> str | None:
+    """Name of the newest object whose internal_name or a tag matches."""
+    cur.execute(
+        """
+        SELECT name
+        FROM transient.objects
+        WHERE internal_name ILIKE %s
+           OR EXISTS (
+               SELECT 1 FROM unnest(tag) t(v)
+               WHERE trim(t.v) ILIKE %s
+           )
+        ORDER BY discovery_date DESC NULLS LAST
+        LIMIT 1
+        """,
+        (f'%{object_name}%', object_name)
+    )
+    row = cur.fetchone()
+    return (row[0] or '').strip() if row else None
+
+
+def _run_detail_loads(loads: dict) -> dict:
+    """Run {key: fn(cur)} concurrently.  A task that failed or missed the
+    run_parallel deadline is retried on one connection without a deadline,
+    so a slow lookup is never mistaken for "no such object"; errors there
+    propagate to the caller."""
+    found = run_parallel({key: (lambda cur, fn=fn: (fn(cur),)) for key, fn in loads.items()})
+    out = {key: res[0] for key, res in found.items() if res is not None}
+    retry = [key for key in loads if key not in out]
+    if retry:
+        logger.warning("object detail: sequential retry for %s", retry)
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            for key in retry:
+                out[key] = loads[key](cur)
+    return out
+
+
 # ===============================================================================
 # OBJECT DETAILS
 # ===============================================================================
@@ -61,69 +115,38 @@ def object_detail_generic(object_name):
         # Log view
         user_email = user.get('email') if user else None
         TNSObjectDB.log_object_view(object_name, user_email)
-        
-        # Update absolute magnitude and brightest mag
-        update_object_abs_mag(object_name)
-        
-        # Try exact match first using direct SQL query
-        conn = get_tns_db_connection()
-        cursor = conn.cursor()
-        
-        # Exact match queries (try multiple variants)
-        tag_logic = """
-        CASE o.status
-            WHEN 'Finish'    THEN 'finished'
-            WHEN 'Follow-up' THEN 'followup'
-            WHEN 'Snoozed'   THEN 'snoozed'
-            ELSE 'object'
-        END as tag
-        """
-        
-        exact_queries = [
+
+        # Precomputed card: one indexed read.  Any other spelling (prefixed
+        # name, internal name, different case) redirects to the canonical URL.
+        card = get_object_card(object_name)
+        if card:
+            card_obj = card['object']
+            name_only = (card_obj.get('name') or '').strip()
+            if object_name != name_only:
+                return redirect(url_for('marshal_bp.object_detail_generic', object_name=name_only))
+            return render_template('object_detail.html',
+                                 current_path='/object',
+                                 object_data=dict(card_obj),
+                                 object_name=object_name,
+                                 visibility=visibility)
+
+        # No card yet (queued by get_object_card): resolve with direct SQL.
+        # The two exact lookups run concurrently; the alias scan and the
+        # prefix-stripped lookup only run when both miss.
+        import re as _re
+        prefix_stripped = _re.sub(
+            r'^(?:AT|SN|SLSN-I{1,2}|Ia|II)\s*(?=[0-9]{4})',
+            '', object_name, flags=_re.IGNORECASE
+        )
+        found = _run_detail_loads({
             # Full name match (case insensitive)
-            f"""SELECT o.obj_id AS objid, o.name_prefix, o.name, o.ra, o.dec AS declination,
-                      o.redshift, NULL::int AS typeid, o.type,
-                      NULL::int AS reporting_groupid, o.report_group AS reporting_group,
-                      NULL::int AS source_groupid, o.source_group,
-                      to_char(TIMESTAMP '1858-11-17' + o.discovery_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS discoverydate,
-                      o.discovery_mag AS discoverymag, o.discovery_filter AS discmagfilter,
-                      o.discovery_filter AS filter, array_to_string(o.reporters, ', ') AS reporters,
-                      to_char(TIMESTAMP '1858-11-17' + o.received_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS time_received,
-                      COALESCE(o.internal_name,'') AS internal_names, o.discovery_ADS AS discovery_ads_bibcode,
-                      o.class_ADS AS class_ads_bibcodes,
-                      to_char(TIMESTAMP '1858-11-17' + o.creation_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS creationdate,
-                      to_char(TIMESTAMP '1858-11-17' + o.last_modified_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS lastmodified,
-                      o.brightest_mag, o.brightest_abs_mag, array_to_string(o.tag, ', ') AS tags,
-                      {tag_logic}
-               FROM transient.objects o
-               WHERE (COALESCE(o.name_prefix, '') || COALESCE(o.name, '')) ILIKE %s""",
+            'full': lambda cur: _fetch_detail_row(
+                cur, "(COALESCE(o.name_prefix, '') || COALESCE(o.name, '')) ILIKE %s", object_name),
             # Name only match (case insensitive)
-            f"""SELECT o.obj_id AS objid, o.name_prefix, o.name, o.ra, o.dec AS declination,
-                      o.redshift, NULL::int AS typeid, o.type,
-                      NULL::int AS reporting_groupid, o.report_group AS reporting_group,
-                      NULL::int AS source_groupid, o.source_group,
-                      to_char(TIMESTAMP '1858-11-17' + o.discovery_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS discoverydate,
-                      o.discovery_mag AS discoverymag, o.discovery_filter AS discmagfilter,
-                      o.discovery_filter AS filter, array_to_string(o.reporters, ', ') AS reporters,
-                      to_char(TIMESTAMP '1858-11-17' + o.received_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS time_received,
-                      COALESCE(o.internal_name,'') AS internal_names, o.discovery_ADS AS discovery_ads_bibcode,
-                      o.class_ADS AS class_ads_bibcodes,
-                      to_char(TIMESTAMP '1858-11-17' + o.creation_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS creationdate,
-                      to_char(TIMESTAMP '1858-11-17' + o.last_modified_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS lastmodified,
-                      o.brightest_mag, o.brightest_abs_mag, array_to_string(o.tag, ', ') AS tags,
-                      {tag_logic}
-               FROM transient.objects o
-               WHERE o.name ILIKE %s"""
-        ]
-        
-        matching_obj = None
-        for i, query in enumerate(exact_queries):
-            cursor.execute(query, (object_name,))
-            result = cursor.fetchone()
-            if result:
-                columns = [desc[0] for desc in cursor.description]
-                matching_obj = dict(zip(columns, result))
-                break
+            'name': lambda cur: _fetch_detail_row(cur, "o.name ILIKE %s", object_name),
+        })
+
+        matching_obj = found['full'] or found['name']
 
         # If exact match found but URL includes prefix, redirect to name-only canonical URL
         # e.g. /object/AT2025abc → /object/2025abc
@@ -131,75 +154,24 @@ def object_detail_generic(object_name):
             prefix    = (matching_obj.get('name_prefix') or '').strip()
             name_only = (matching_obj.get('name') or '').strip()
             if prefix and object_name.lower() != name_only.lower():
-                conn.close()
                 return redirect(url_for('marshal_bp.object_detail_generic', object_name=name_only))
 
-        # If still no match, try internal_names (e.g. ZTF ID) and tags (e.g. EP name)
+        # Alias or prefix-stripped hit: redirect to name-only (no prefix) canonical URL
         if not matching_obj:
-            alias_query = """
-                SELECT name_prefix, name
-                FROM transient.objects
-                WHERE internal_name ILIKE %s
-                   OR EXISTS (
-                       SELECT 1 FROM unnest(tag) t(v)
-                       WHERE trim(t.v) ILIKE %s
-                   )
-                ORDER BY discovery_date DESC NULLS LAST
-                LIMIT 1
-            """
-            cursor.execute(alias_query, (f'%{object_name}%', object_name))
-            alias_result = cursor.fetchone()
-            if alias_result:
-                # Redirect to name-only (no prefix) canonical URL
-                canonical = (alias_result[1] or '').strip()
-                conn.close()
-                return redirect(url_for('marshal_bp.object_detail_generic', object_name=canonical))
-
-        # If still no match, strip AT/SN prefix and retry —
-        # handles the AT→SN classification scenario:
-        # e.g. /object/AT2025wny → object was classified, now name_prefix='SN' → find by name='2025wny'
-        if not matching_obj:
-            import re as _re
-            prefix_stripped = _re.sub(
-                r'^(?:AT|SN|SLSN-I{1,2}|Ia|II)\s*(?=[0-9]{4})',
-                '', object_name, flags=_re.IGNORECASE
-            )
+            fallbacks = {
+                # internal_names (e.g. ZTF ID) and tags (e.g. EP name)
+                'alias': lambda cur: _fetch_alias_name(cur, object_name),
+            }
+            # Strip AT/SN prefix — handles the AT→SN classification scenario:
+            # e.g. /object/AT2025wny → object was classified, now name_prefix='SN' → find by name='2025wny'
             if prefix_stripped and prefix_stripped.lower() != object_name.lower():
-                # Try name-only match with stripped value
-                cursor.execute(
-                    f"""SELECT o.obj_id AS objid, o.name_prefix, o.name, o.ra, o.dec AS declination,
-                              o.redshift, NULL::int AS typeid, o.type,
-                              NULL::int AS reporting_groupid, o.report_group AS reporting_group,
-                              NULL::int AS source_groupid, o.source_group,
-                              to_char(TIMESTAMP '1858-11-17' + o.discovery_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS discoverydate,
-                              o.discovery_mag AS discoverymag, o.discovery_filter AS discmagfilter,
-                              o.discovery_filter AS filter, array_to_string(o.reporters, ', ') AS reporters,
-                              to_char(TIMESTAMP '1858-11-17' + o.received_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS time_received,
-                              COALESCE(o.internal_name,'') AS internal_names, o.discovery_ADS AS discovery_ads_bibcode,
-                              o.class_ADS AS class_ads_bibcodes,
-                              to_char(TIMESTAMP '1858-11-17' + o.creation_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS creationdate,
-                              to_char(TIMESTAMP '1858-11-17' + o.last_modified_date * INTERVAL '1 day', 'YYYY-MM-DD HH24:MI:SS') AS lastmodified,
-                              o.brightest_mag, o.brightest_abs_mag, array_to_string(o.tag, ', ') AS tags,
-                              CASE o.status
-                                  WHEN 'Finish'    THEN 'finished'
-                                  WHEN 'Follow-up' THEN 'followup'
-                                  WHEN 'Snoozed'   THEN 'snoozed'
-                                  ELSE 'object'
-                              END as tag
-                         FROM transient.objects o
-                        WHERE o.name ILIKE %s""",
-                    (prefix_stripped,)
-                )
-                result = cursor.fetchone()
-                if result:
-                    columns = [desc[0] for desc in cursor.description]
-                    matching_obj = dict(zip(columns, result))
-                    # Redirect to canonical name-only URL
-                    canonical = (matching_obj.get('name') or prefix_stripped).strip()
-                    conn.close()
-                    return redirect(url_for('marshal_bp.object_detail_generic', object_name=canonical))
-
-        conn.close()
+                fallbacks['stripped'] = lambda cur: _fetch_detail_row(cur, "o.name ILIKE %s", prefix_stripped)
+            found = _run_detail_loads(fallbacks)
+            canonical = found['alias']
+            if not canonical and found.get('stripped'):
+                canonical = (found['stripped'].get('name') or prefix_stripped).strip()
+            if canonical:
+                return redirect(url_for('marshal_bp.object_detail_generic', object_name=canonical))
 
         # If no exact match, fall back to fuzzy search
         if not matching_obj:
@@ -220,7 +192,7 @@ def object_detail_generic(object_name):
             flash(f'Object {object_name} not found.', 'error')
             return redirect(url_for('marshal.marshal'))
         
-        # Values are already calculated by update_object_abs_mag and fetched from DB
+        # Values are kept current by the recompute_dirty_abs_mags job and fetched from DB
         # No need to recalculate here
 
         # Calculate distance if redshift is available
@@ -254,122 +226,9 @@ def object_detail_generic(object_name):
 
 @objects_bp.route('/object/<int:year><string:letters>')
 def object_detail_tns_format(year, letters):
-    try:
-        # Construct TNS-style name from year and letters
-        object_name = f"{year}{letters}"
-
-        # Build visibility context
-        user = session.get('user', {})
-        role = user.get('role', 'guest') if user else 'guest'
-        is_admin = user.get('is_admin', False) if user else False
-        is_logged_in = bool(user)
-        can_see_restricted = is_admin or role in ('user', 'admin')
-        visibility = {
-            'detect': can_see_restricted,
-            'spectroscopy': can_see_restricted,
-            'comments': can_see_restricted,
-            'tags': can_see_restricted,
-            'peak_abs_mag': can_see_restricted,
-            'phot_controls': is_logged_in,
-        }
-
-        # Log view
-        user_email = user.get('email') if user else None
-        TNSObjectDB.log_object_view(object_name, user_email)
-        
-        # Update absolute magnitude and brightest mag
-        update_object_abs_mag(object_name)
-        
-        # Try exact match first using direct SQL query
-        conn = get_tns_db_connection()
-        cursor = conn.cursor()
-        
-        tag_logic = """
-        CASE o.status
-            WHEN 'Finish'    THEN 'finished'
-            WHEN 'Follow-up' THEN 'followup'
-            WHEN 'Snoozed'   THEN 'snoozed'
-            ELSE 'object'
-        END as tag
-        """
-        
-        # Exact match query - match name exactly (case insensitive)
-        exact_query = f"""SELECT {OBJECT_COMPAT_COLS}
-               FROM transient.objects o
-               WHERE o.name ILIKE %s"""
-        
-        cursor.execute(exact_query, (object_name,))
-        result = cursor.fetchone()
-        matching_obj = None
-        
-        if result:
-            columns = [desc[0] for desc in cursor.description]
-            matching_obj = dict(zip(columns, result))
-        
-        conn.close()
-        
-        # If no exact match, fall back to fuzzy search
-        if not matching_obj:
-            results = search_tns_objects(search_term=object_name, limit=50)
-            
-            # Find exact match based on year + letters pattern
-            for obj in results:
-                full_name = (obj.get('name_prefix', '') + obj.get('name', '')).strip()
-                name_only = obj.get('name', '').strip()
-                
-                # Strategy 1: Direct match on name only
-                if name_only.lower() == object_name.lower():
-                    matching_obj = obj
-                    break
-                
-                # Strategy 2: Direct match on full name
-                if full_name.lower() == object_name.lower():
-                    matching_obj = obj
-                    break
-                
-                # Strategy 3: Extract year and letters from full name using regex
-                match = re.search(r'(\d{4})([a-zA-Z]+)$', name_only)
-                if match:
-                    extracted_name = f"{match.group(1)}{match.group(2)}"
-                    if extracted_name.lower() == object_name.lower():
-                        matching_obj = obj
-                        break
-        
-        if not matching_obj:
-            flash(f'Object {object_name} not found.', 'error')
-            return redirect(url_for('marshal.marshal'))
-        
-        # Values are already calculated by update_object_abs_mag and fetched from DB
-        # No need to recalculate here
-
-        # Calculate distance if redshift is available
-        if matching_obj and matching_obj.get('redshift') is not None:
-            try:
-                from modules.astronomy_calculator import calculate_redshift_distance
-                z = float(matching_obj['redshift'])
-                if z > 0:
-                    dist_result = calculate_redshift_distance(z)
-                    matching_obj['distance_mpc'] = dist_result.get('distance_mpc')
-            except Exception as e:
-                print(f"Error calculating distance: {e}")
-
-        # Convert datetime objects to strings for template compatibility
-        if matching_obj:
-            for key, value in matching_obj.items():
-                if isinstance(value, datetime):
-                    matching_obj[key] = value.strftime('%Y-%m-%d %H:%M:%S')
-        
-        return render_template('object_detail.html', 
-                             current_path='/object',
-                             object_data=matching_obj,
-                             object_name=object_name,
-                             visibility=visibility)
-        
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        flash('Error loading object data.', 'error')
-        return redirect(url_for('marshal.marshal'))
+    # Werkzeug prefers this rule over <path:object_name>, so TNS-style names
+    # land here; serve them through the generic handler (card, redirects).
+    return object_detail_generic(f"{year}{letters}")
 
 # ===============================================================================
 # OBJECT API ENDPOINTS
@@ -486,9 +345,6 @@ def get_object_api(object_name):
     try:
         object_name = urllib.parse.unquote(object_name)
         
-        # Update absolute magnitude and brightest mag before fetching
-        update_object_abs_mag(object_name)
-        
         # First try exact match
         conn = get_tns_db_connection()
         cursor = conn.cursor()
@@ -677,14 +533,28 @@ def api_delete_object(object_name):
             conn.close()
             return jsonify({'error': 'Object not found'}), 404
         
+        # The cascade would drop the cross-matches without updating the DETECT
+        # calendar summary, so remove them first and refresh their days.
+        cursor.execute("""
+            DELETE FROM transient.cross_matches
+            WHERE obj_id IN (
+                SELECT obj_id FROM transient.objects
+                WHERE (COALESCE(name_prefix, '') || COALESCE(name, '')) = %s
+                   OR name = %s)
+            RETURNING match_date
+        """, (object_name, object_name))
+        refresh_detect_daily_counts(cursor, {r[0] for r in cursor.fetchall()})
+
         # Delete from transient.objects (CASCADE will handle related rows if FK set up)
         cursor.execute("""
             DELETE FROM transient.objects
             WHERE (COALESCE(name_prefix, '') || COALESCE(name, '')) = %s
                OR name = %s
+            RETURNING obj_id
         """, (object_name, object_name))
         
         rows_affected = cursor.rowcount
+        invalidate_resolver(obj_ids=[r[0] for r in cursor.fetchall()])
         
         if rows_affected == 0:
             conn.close()
@@ -703,6 +573,11 @@ def api_delete_object(object_name):
                 "(SELECT obj_id FROM transient.objects WHERE name = %s)",
                 (obj_name,)
             )
+            cursor.execute(
+                "DELETE FROM transient.spectra WHERE obj_id IN "
+                "(SELECT obj_id FROM transient.objects WHERE name = %s)",
+                (obj_name,)
+            )
             cursor.execute(
                 "DELETE FROM transient.comments WHERE obj_id IN "
                 "(SELECT obj_id FROM transient.objects WHERE name = %s)",
@@ -772,6 +647,94 @@ def sanitize_for_json(data):
         return data
     return data
 
+def _plot_frame_response(fig, meta, x_dtype='f4'):
+    """Return a plotly figure as a binary plot frame (?format=arrow|f32)."""
+    return Response(encode_frame(fig, meta, x_dtype=x_dtype), mimetype=FRAME_MIMETYPE)
+
+def _photometry_json_response(object_name, user_email, user_groups, is_admin):
+    """Stream {'success', 'photometry', 'count'} — the body jsonify() would
+    build — row by row from TNSObjectDB.iter_photometry().  Source
+    permissions are resolved up front and pushed into the query.  The first
+    row is fetched here, so a lookup or query error raises in the caller's
+    try instead of truncating a 200 body."""
+    sources = None
+    if not is_admin:
+        sources = filter_by_source_permissions(
+            object_name, 'phot', TNSObjectDB.get_photometry_sources(object_name),
+            user_email=user_email, user_groups=user_groups, is_admin=is_admin
+        )
+    rows = TNSObjectDB.iter_photometry(object_name, sources=sources)
+    first = next(rows, None)
+    logger.info("[Photometry] fetched OK: object=%s user=%s", object_name, user_email or 'guest')
+
+    def generate():
+        n = 0
+        yield '{"success":true,"photometry":['
+        try:
+            for p in itertools.chain([first] if first is not None else [], rows):
+                yield (',' if n else '') + json.dumps(sanitize_for_json(p), separators=(',', ':'))
+                n += 1
+        except Exception as e:
+            logger.error("[Photometry] stream error: object=%s after=%d error=%s", object_name, n, e)
+            raise
+        finally:
+            rows.close()
+        yield f'],"count":{n}}}'
+
+    return Response(generate(), mimetype='application/json')
+
+
+def _photometry_download_response(object_name):
+    """Stream photometry as a .dat file, honouring the telescopes / filters /
+    mjd_min / mjd_max / include_nondet query parameters (applied in SQL)."""
+    telescopes_param = request.args.get('telescopes', '')
+    filters_param    = request.args.get('filters', '')
+    mjd_min          = get_float_arg('mjd_min')
+    mjd_max          = get_float_arg('mjd_max')
+    include_nondet   = request.args.get('include_nondet', 'true').lower() != 'false'
+
+    sel_telescopes = {t.strip() for t in telescopes_param.split(',') if t.strip()}
+    sel_filters    = {f.strip() for f in filters_param.split(',') if f.strip()}
+
+    rows = TNSObjectDB.iter_photometry(
+        object_name,
+        sources=sel_telescopes or None,
+        filters=sel_filters or None,
+        mjd_min=mjd_min, mjd_max=mjd_max,
+        detections_only=not include_nondet,
+    )
+    # Fetch the first row before the 200 goes out (see _photometry_json_response).
+    first = next(rows, None)
+
+    def generate():
+        yield f"# {object_name} photometry\n# MJD magnitude error filter telescope\n"
+        lines = []
+        for p in itertools.chain([first] if first is not None else [], rows):
+            mjd = p.get('mjd', '')
+            mag = p.get('magnitude')
+            err = p.get('magnitude_error')
+            flt = p.get('filter') or ''
+            tel = p.get('telescope') or 'Unknown'
+            if err is None:
+                mag_str = f">{mag:.6f}" if mag is not None else ">nan"
+                err_str = "nan"
+            else:
+                mag_str = f"{mag:.6f}" if mag is not None else "nan"
+                err_str = f"{err:.6f}"
+            lines.append(f"{mjd:.6f}  {mag_str}  {err_str}  {flt}  {tel}\n")
+            if len(lines) >= 1000:
+                yield ''.join(lines)
+                lines.clear()
+        if lines:
+            yield ''.join(lines)
+        rows.close()
+
+    return Response(
+        generate(),
+        mimetype='text/plain',
+        headers={'Content-Disposition': f'attachment; filename="{object_name}_phot.dat"'}
+    )
+
 @objects_bp.route('/api/object/<int:year><alpha:letters>/photometry')
 def get_object_photometry(year, letters):
     object_name = f"{year}{letters}"
@@ -783,15 +746,7 @@ def get_object_photometry(year, letters):
     logger.info("[Photometry] fetch request: object=%s user=%s", object_name, user_email or 'guest')
     try:
         TNSObjectDB.sync_last_photometry_date(object_name)
-        photometry = TNSObjectDB.get_photometry(object_name)
-        photometry = sanitize_for_json(photometry)
-        photometry = filter_by_source_permissions(
-            object_name, 'phot', photometry,
-            user_email=user_email, user_groups=user_groups, is_admin=is_admin
-        )
-        logger.info("[Photometry] fetched OK: object=%s points=%d user=%s",
-                    object_name, len(photometry), user_email or 'guest')
-        return jsonify({'success': True, 'photometry': photometry, 'count': len(photometry)})
+        return _photometry_json_response(object_name, user_email, user_groups, is_admin)
     except Exception as e:
         logger.error("[Photometry] fetch error: object=%s error=%s", object_name, str(e))
         return jsonify({'error': str(e)}), 500
@@ -839,37 +794,14 @@ def get_spectrum_data(year, letters, spectrum_id):
     object_name = f"{year}{letters}"
     
     try:
-        source_name, observation_mjd = _parse_spectrum_id(spectrum_id)
-        conn = get_tns_db_connection()
-        cursor = conn.cursor()
-
-        if observation_mjd is None:
-            cursor.execute('''
-                SELECT s.wavelength, s.intensity
-                FROM transient.spectroscopy s
-                JOIN transient.objects o ON s.obj_id = o.obj_id
-                WHERE o.name ILIKE %s AND s.source = %s
-                ORDER BY s.wavelength ASC
-            ''', (object_name, source_name))
-        else:
-            cursor.execute('''
-                SELECT s.wavelength, s.intensity
-                FROM transient.spectroscopy s
-                JOIN transient.objects o ON s.obj_id = o.obj_id
-                WHERE o.name ILIKE %s AND s.source = %s AND ABS(s."MJD" - %s) < 1e-6
-                ORDER BY s.wavelength ASC
-            ''', (object_name, source_name, observation_mjd))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        wavelengths = [row[0] for row in results]
-        intensities = [row[1] for row in results]
+        records = TNSObjectDB.get_spectrum_arrays(object_name, spectrum_id)
+        wavelengths = records[0]['wavelength'].tolist() if records else []
+        intensities = records[0]['intensity'].tolist() if records else []
         
         return jsonify({
             'success': True,
             'wavelength': wavelengths,
-            'intensity': intensities,
+            'intensity': sanitize_for_json(intensities),
             'spectrum_id': spectrum_id
         })
     except Exception as e:
@@ -925,6 +857,7 @@ def upload_spectroscopy_generic(object_name):
     data = request.get_json()
     
     try:
+        lod.invalidate(object_name)
         spectrum_id = TNSObjectDB.add_spectrum_data(
             object_name=object_name,
             wavelength_data=data.get('wavelength', []),
@@ -972,6 +905,7 @@ def delete_spectrum(spectrum_id):
     
     try:
         if TNSObjectDB.delete_spectrum(spectrum_id):
+            lod.invalidate()
             return jsonify({
                 'success': True,
                 'message': 'Spectrum deleted successfully'
@@ -988,62 +922,7 @@ def download_photometry(year, letters):
     if 'user' not in session:
         return jsonify({'error': 'Access denied'}), 403
 
-    object_name = f"{year}{letters}"
-
-    telescopes_param = request.args.get('telescopes', '')
-    filters_param    = request.args.get('filters', '')
-    mjd_min          = get_float_arg('mjd_min')
-    mjd_max          = get_float_arg('mjd_max')
-    include_nondet   = request.args.get('include_nondet', 'true').lower() != 'false'
-
-    sel_telescopes = {t.strip() for t in telescopes_param.split(',') if t.strip()}
-    sel_filters    = {f.strip() for f in filters_param.split(',') if f.strip()}
-
-    try:
-        phot = TNSObjectDB.get_photometry(object_name)
-
-        rows = []
-        for p in phot:
-            if sel_telescopes and (p.get('telescope') or '') not in sel_telescopes:
-                continue
-            if sel_filters and (p.get('filter') or '') not in sel_filters:
-                continue
-            if mjd_min is not None and p.get('mjd', 0) < mjd_min:
-                continue
-            if mjd_max is not None and p.get('mjd', 0) > mjd_max:
-                continue
-            is_upper = p.get('magnitude_error') is None
-            if not include_nondet and is_upper:
-                continue
-            rows.append(p)
-
-        lines = [
-            f"# {object_name} photometry",
-            "# MJD magnitude error filter telescope",
-        ]
-        for p in rows:
-            mjd  = p.get('mjd', '')
-            mag  = p.get('magnitude')
-            err  = p.get('magnitude_error')
-            flt  = p.get('filter') or ''
-            tel  = p.get('telescope') or 'Unknown'
-            is_upper = err is None
-            if is_upper:
-                mag_str = f">{mag:.6f}" if mag is not None else ">nan"
-                err_str = "nan"
-            else:
-                mag_str = f"{mag:.6f}" if mag is not None else "nan"
-                err_str = f"{err:.6f}"
-            lines.append(f"{mjd:.6f}  {mag_str}  {err_str}  {flt}  {tel}")
-
-        content = '\n'.join(lines) + '\n'
-        return Response(
-            content,
-            mimetype='text/plain',
-            headers={'Content-Disposition': f'attachment; filename="{object_name}_phot.dat"'}
-        )
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _photometry_download_response(f"{year}{letters}")
 
 
 @objects_bp.route('/api/spectrum/<path:spectrum_id>/download')
@@ -1053,37 +932,15 @@ def download_spectrum_file(spectrum_id):
         return jsonify({'error': 'Access denied'}), 403
 
     try:
-        source_name, observation_mjd = _parse_spectrum_id(spectrum_id)
-        conn = get_tns_db_connection()
-        cursor = conn.cursor()
-        if observation_mjd is None:
-            cursor.execute('''
-                SELECT o.name AS object_name, s.wavelength, s.intensity, s.source AS telescope, s."MJD" AS observation_mjd
-                FROM transient.spectroscopy s
-                JOIN transient.objects o ON s.obj_id = o.obj_id
-                WHERE s.source = %s
-                ORDER BY s.wavelength ASC
-            ''', (source_name,))
-        else:
-            cursor.execute('''
-                SELECT o.name AS object_name, s.wavelength, s.intensity, s.source AS telescope, s."MJD" AS observation_mjd
-                FROM transient.spectroscopy s
-                JOIN transient.objects o ON s.obj_id = o.obj_id
-                WHERE s.source = %s AND ABS(s."MJD" - %s) < 1e-6
-                ORDER BY s.wavelength ASC
-            ''', (source_name, observation_mjd))
-        rows = cursor.fetchall()
-        conn.close()
-
-        if not rows:
+        record = TNSObjectDB.get_spectrum_arrays_by_id(spectrum_id)
+        if not record:
             return jsonify({'error': 'Spectrum not found'}), 404
 
-        obj = rows[0][0]
-        tel = rows[0][3] or 'Unknown'
-        obs_mjd = rows[0][4]
-        phase = _phase_from_stored_value(obs_mjd)
-        spectrum_label = _build_spectrum_label(tel, obs_mjd)
-        observation_label = _format_spectrum_observation_label(obs_mjd)
+        obj = record.get('object_name')
+        tel = record.get('telescope') or 'Unknown'
+        phase = record.get('phase')
+        spectrum_label = record.get('spectrum_label')
+        observation_label = record.get('observation_date_label')
 
         lines = [
             f"# {obj} spectrum  id={spectrum_id}",
@@ -1095,7 +952,7 @@ def download_spectrum_file(spectrum_id):
         elif observation_label:
             lines.append(f"# Observation date: {observation_label}")
         lines.append("# wavelength intensity")
-        for _, wl, intens, _, _ in rows:
+        for wl, intens in zip(record['wavelength'].tolist(), record['intensity'].tolist()):
             lines.append(f"{wl:.4f}  {intens:.8g}")
 
         content = '\n'.join(lines) + '\n'
@@ -1156,6 +1013,12 @@ def get_object_photometry_plot(year, letters):
 
     logger.info("[Photometry/plot] request: object=%s user=%s", object_name, user_email or 'guest')
 
+    binary = wants_binary(request.args.get('format'))
+    width = get_int_arg('width', min_val=lod.LOD_MIN_WIDTH, max_val=lod.LOD_MAX_WIDTH)
+    mjd_min = get_float_arg('mjd_min')
+    mjd_max = get_float_arg('mjd_max')
+    mjd_window = (mjd_min, mjd_max) if (mjd_min is not None or mjd_max is not None) else None
+
     if user and not check_object_access(object_name, user_email):
         return jsonify({'success': True, 'plot_html': None, 'message': 'Access denied.'})
 
@@ -1196,7 +1059,10 @@ def get_object_photometry_plot(year, letters):
             dec=dec,
             apply_extinction=apply_extinction,
             apply_k_corr=apply_k_corr,
-            as_json=True
+            as_json=not binary,
+            as_figure=binary,
+            width=width,
+            mjd_window=mjd_window
         )
 
         # Compute distance modulus for KN model overlay
@@ -1214,13 +1080,16 @@ def get_object_photometry_plot(year, letters):
             except Exception:
                 _dist_mod2 = 0.0
 
-        return jsonify({
+        meta = {
             'success': True,
-            'plot_json': plot_json,
             'data_count': len(photometry_data),
             'distance_modulus': round(_dist_mod2, 4),
             'redshift': redshift,
-        })
+        }
+        if binary and plot_json is not None:
+            return _plot_frame_response(plot_json, meta, x_dtype='f8')
+        meta['plot_json'] = plot_json
+        return jsonify(meta)
     except Exception as e:
         logger.error("[Photometry/plot] error: object=%s error=%s", object_name, str(e))
         return jsonify({'error': str(e)}), 500
@@ -1241,13 +1110,18 @@ def get_object_spectrum_plot(year, letters):
     rest_frame  = request.args.get('rest_frame', 'false').lower() in ('1', 'true')
     normalise   = request.args.get('normalise',  'false').lower() in ('1', 'true')
     stack       = request.args.get('stack',      'false').lower() in ('1', 'true')
+    binary      = wants_binary(request.args.get('format'))
+    width       = get_int_arg('width', min_val=lod.LOD_MIN_WIDTH, max_val=lod.LOD_MAX_WIDTH)
+    wmin        = get_float_arg('wmin', min_val=0)
+    wmax        = get_float_arg('wmax', min_val=0)
+    window      = (wmin, wmax) if (wmin is not None or wmax is not None) else None
     
     try:
         redshift = None
         results = search_tns_objects(search_term=object_name, limit=1)
         if results:
             redshift = results[0].get('redshift')
-        spectrum_data = TNSObjectDB.get_spectroscopy(object_name)
+        spectrum_data = TNSObjectDB.get_spectrum_arrays(object_name, spectrum_id)
         
         if not spectrum_data:
             return jsonify({
@@ -1259,16 +1133,24 @@ def get_object_spectrum_plot(year, letters):
         if spectrum_id:
             plot_html = DataVisualization.create_spectrum_plot_from_db(
                 spectrum_data, spectrum_id,
-                rest_frame=rest_frame, redshift=redshift, normalise=normalise)
+                rest_frame=rest_frame, redshift=redshift, normalise=normalise,
+                as_figure=binary, width=width, window=window, object_name=object_name)
         else:
             plot_html = DataVisualization.create_spectrum_list_plot_from_db(
                 spectrum_data,
-                rest_frame=rest_frame, redshift=redshift, normalise=normalise, stack=stack)
+                rest_frame=rest_frame, redshift=redshift, normalise=normalise, stack=stack,
+                as_figure=binary, width=width, window=window, object_name=object_name)
+        
+        if binary and plot_html is not None:
+            return _plot_frame_response(plot_html, {
+                'success': True,
+                'data_count': sum(len(r['wavelength']) for r in spectrum_data),
+            })
         
         return jsonify({
             'success': True,
             'plot_html': plot_html,
-            'data_count': len(spectrum_data)
+            'data_count': sum(len(r['wavelength']) for r in spectrum_data)
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1283,20 +1165,50 @@ def get_object_photometry_generic(object_name):
     logger.info("[Photometry] fetch request: object=%s user=%s", object_name, user_email or 'guest')
     try:
         TNSObjectDB.sync_last_photometry_date(object_name)
-        photometry = TNSObjectDB.get_photometry(object_name)
-        photometry = sanitize_for_json(photometry)
-        photometry = filter_by_source_permissions(
-            object_name, 'phot', photometry,
-            user_email=user_email, user_groups=user_groups, is_admin=is_admin
-        )
-        logger.info("[Photometry] fetched OK: object=%s points=%d user=%s",
-                    object_name, len(photometry), user_email or 'guest')
-        return jsonify({'success': True, 'photometry': photometry, 'count': len(photometry)})
+        return _photometry_json_response(object_name, user_email, user_groups, is_admin)
     except Exception as e:
         logger.error("[Photometry] fetch error: object=%s error=%s", object_name, str(e))
         return jsonify({'error': str(e)}), 500
 
 
+@objects_bp.route('/api/object/<object_name>/photometry/delta')
+def get_object_photometry_delta(object_name):
+    """Light-curve changes after a cursor: since_seq (the ``seq`` returned by
+    the previous call; also reports deleted point ids), since_phot_id or
+    since_mjd.  Without a cursor the full light curve and its seq."""
+    object_name = urllib.parse.unquote(object_name)
+    user = session.get('user', {})
+    user_email = user.get('email') if user else None
+    user_groups = user.get('groups', []) if user else []
+    is_admin = user.get('is_admin', False) if user else False
+    since_seq     = get_int_arg('since_seq', min_val=0, max_val=2**63 - 1)
+    since_phot_id = get_int_arg('since_phot_id', min_val=0, max_val=2**63 - 1)
+    since_mjd     = get_float_arg('since_mjd')
+    try:
+        sources = None
+        if not is_admin:
+            sources = filter_by_source_permissions(
+                object_name, 'phot', TNSObjectDB.get_photometry_sources(object_name),
+                user_email=user_email, user_groups=user_groups, is_admin=is_admin
+            )
+        delta = TNSObjectDB.get_photometry_delta(
+            object_name, since_seq=since_seq, since_phot_id=since_phot_id,
+            since_mjd=since_mjd, sources=sources
+        )
+        if delta is None:
+            return jsonify({'success': False, 'error': 'Object not found'}), 404
+        return jsonify({
+            'success': True,
+            'photometry': [sanitize_for_json(p) for p in delta['photometry']],
+            'deleted': delta['deleted'],
+            'seq': delta['seq'],
+            'count': len(delta['photometry']),
+        })
+    except Exception as e:
+        logger.error("[Photometry] delta error: object=%s error=%s", object_name, str(e))
+        return jsonify({'error': str(e)}), 500
+
+
 @objects_bp.route('/api/object/<object_name>/photometry', methods=['POST'])
 def upload_photometry_generic(object_name):
     if 'user' not in session or not session['user'].get('is_admin'):
@@ -1337,56 +1249,7 @@ def upload_photometry_batch_generic(object_name):
 def download_photometry_generic(object_name):
     if 'user' not in session:
         return jsonify({'error': 'Access denied'}), 403
-    object_name = urllib.parse.unquote(object_name)
-
-    telescopes_param = request.args.get('telescopes', '')
-    filters_param    = request.args.get('filters', '')
-    mjd_min          = get_float_arg('mjd_min')
-    mjd_max          = get_float_arg('mjd_max')
-    include_nondet   = request.args.get('include_nondet', 'true').lower() != 'false'
-
-    sel_telescopes = {t.strip() for t in telescopes_param.split(',') if t.strip()}
-    sel_filters    = {f.strip() for f in filters_param.split(',') if f.strip()}
-
-    try:
-        phot = TNSObjectDB.get_photometry(object_name)
-        rows = []
-        for p in phot:
-            if sel_telescopes and (p.get('telescope') or '') not in sel_telescopes:
-                continue
-            if sel_filters and (p.get('filter') or '') not in sel_filters:
-                continue
-            if mjd_min is not None and p.get('mjd', 0) < mjd_min:
-                continue
-            if mjd_max is not None and p.get('mjd', 0) > mjd_max:
-                continue
-            if not include_nondet and p.get('magnitude_error') is None:
-                continue
-            rows.append(p)
-
-        lines = [f"# {object_name} photometry", "# MJD magnitude error filter telescope"]
-        for p in rows:
-            mjd = p.get('mjd', '')
-            mag = p.get('magnitude')
-            err = p.get('magnitude_error')
-            flt = p.get('filter') or ''
-            tel = p.get('telescope') or 'Unknown'
-            if err is None:
-                mag_str = f">{mag:.6f}" if mag is not None else ">nan"
-                err_str = "nan"
-            else:
-                mag_str = f"{mag:.6f}" if mag is not None else "nan"
-                err_str = f"{err:.6f}"
-            lines.append(f"{mjd:.6f}  {mag_str}  {err_str}  {flt}  {tel}")
-
-        content = '\n'.join(lines) + '\n'
-        return Response(
-            content,
-            mimetype='text/plain',
-            headers={'Content-Disposition': f'attachment; filename="{object_name}_phot.dat"'}
-        )
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return _photometry_download_response(urllib.parse.unquote(object_name))
 
 
 @objects_bp.route('/api/object/<object_name>/photometry/plot')
@@ -1400,6 +1263,12 @@ def get_object_photometry_plot_generic(object_name):
 
     logger.info("[Photometry/plot] request: object=%s user=%s", object_name, user_email or 'guest')
 
+    binary = wants_binary(request.args.get('format'))
+    width = get_int_arg('width', min_val=lod.LOD_MIN_WIDTH, max_val=lod.LOD_MAX_WIDTH)
+    mjd_min = get_float_arg('mjd_min')
+    mjd_max = get_float_arg('mjd_max')
+    mjd_window = (mjd_min, mjd_max) if (mjd_min is not None or mjd_max is not None) else None
+
     try:
         if user and not check_object_access(object_name, user_email):
             return jsonify({'success': True, 'plot_html': None, 'message': 'Access denied.'})
@@ -1444,7 +1313,10 @@ def get_object_photometry_plot_generic(object_name):
             dec=dec,
             apply_extinction=apply_extinction,
             apply_k_corr=apply_k_corr,
-            as_json=True
+            as_json=not binary,
+            as_figure=binary,
+            width=width,
+            mjd_window=mjd_window
         )
 
         # Compute distance modulus for KN model overlay
@@ -1463,13 +1335,16 @@ def get_object_photometry_plot_generic(object_name):
             except Exception:
                 _dist_mod = 0.0
 
-        return jsonify({
+        meta = {
             'success': True,
-            'plot_json': plot_json,
             'data_count': len(photometry_data),
             'distance_modulus': round(_dist_mod, 4),
             'redshift': redshift,
-        })
+        }
+        if binary and plot_json is not None:
+            return _plot_frame_response(plot_json, meta, x_dtype='f8')
+        meta['plot_json'] = plot_json
+        return jsonify(meta)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -1540,6 +1415,11 @@ def get_object_spectrum_plot_generic(object_name):
     rest_frame  = request.args.get('rest_frame', 'false').lower() in ('1', 'true')
     normalise   = request.args.get('normalise',  'false').lower() in ('1', 'true')
     stack       = request.args.get('stack',      'false').lower() in ('1', 'true')
+    binary      = wants_binary(request.args.get('format'))
+    width       = get_int_arg('width', min_val=lod.LOD_MIN_WIDTH, max_val=lod.LOD_MAX_WIDTH)
+    wmin        = get_float_arg('wmin', min_val=0)
+    wmax        = get_float_arg('wmax', min_val=0)
+    window      = (wmin, wmax) if (wmin is not None or wmax is not None) else None
     
     try:
         results = search_tns_objects(search_term=object_name, limit=1)
@@ -1551,7 +1431,7 @@ def get_object_spectrum_plot_generic(object_name):
             }), 404
         
         redshift = results[0].get('redshift')
-        spectrum_data = TNSObjectDB.get_spectroscopy(object_name)
+        spectrum_data = TNSObjectDB.get_spectrum_arrays(object_name, spectrum_id)
         
         if not spectrum_data:
             return jsonify({
@@ -1563,16 +1443,24 @@ def get_object_spectrum_plot_generic(object_name):
         if spectrum_id:
             plot_html = DataVisualization.create_spectrum_plot_from_db(
                 spectrum_data, spectrum_id,
-                rest_frame=rest_frame, redshift=redshift, normalise=normalise)
+                rest_frame=rest_frame, redshift=redshift, normalise=normalise,
+                as_figure=binary, width=width, window=window, object_name=object_name)
         else:
             plot_html = DataVisualization.create_spectrum_list_plot_from_db(
                 spectrum_data,
-                rest_frame=rest_frame, redshift=redshift, normalise=normalise, stack=stack)
+                rest_frame=rest_frame, redshift=redshift, normalise=normalise, stack=stack,
+                as_figure=binary, width=width, window=window, object_name=object_name)
+        
+        if binary and plot_html is not None:
+            return _plot_frame_response(plot_html, {
+                'success': True,
+                'data_count': sum(len(r['wavelength']) for r in spectrum_data),
+            })
         
         return jsonify({
             'success': True,
             'plot_html': plot_html,
-            'data_count': len(spectrum_data)
+            'data_count': sum(len(r['wavelength']) for r in spectrum_data)
         })
     except Exception as e:
         return jsonify({
@@ -1727,11 +1615,16 @@ def get_object_sources(object_name):
         )
         phot_sources = [r[0] for r in cursor.fetchall()]
         cursor.execute(
-            "SELECT DISTINCT COALESCE(s.source, 'Unknown') as src "
+            "SELECT COALESCE(s.source, 'Unknown') as src "
+            "FROM transient.spectra s "
+            "JOIN transient.objects o ON s.obj_id = o.obj_id "
+            "WHERE o.name ILIKE %s "
+            "UNION "
+            "SELECT COALESCE(s.source, 'Unknown') "
             "FROM transient.spectroscopy s "
             "JOIN transient.objects o ON s.obj_id = o.obj_id "
             "WHERE o.name ILIKE %s ORDER BY src",
-            (object_name,)
+            (object_name, object_name)
         )
         spec_sources = [r[0] for r in cursor.fetchall()]
         conn.close()
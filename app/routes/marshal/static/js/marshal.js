@@ -12,6 +12,12 @@ let isLoading = false;
 let currentFilters = {};
 let useApiMode = false;
 let currentStatusFilter = '';
+// Keyset pagination state for API mode: opaque token for the next batch
+// (null once the listing is exhausted) and the scroll sentinel observer.
+let nextAfter = null;
+let scrollObserver = null;
+let isLoadingMore = false;
+const INFINITE_SCROLL_BATCH_MAX = 500;
 
 const ICONS = {
     chevronUp: '<svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="18 15 12 9 6 15"></polyline></svg>',
@@ -65,6 +71,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     updatePagination();
     switchView('cards');
+    setupInfiniteScroll();
     
     const filterInputs = document.querySelectorAll('.filter-group select, .filter-group input');
     filterInputs.forEach(input => {
@@ -330,6 +337,7 @@ function loadObjects(resetPage = false) {
     if (resetPage) currentPage = 1;
     
     isLoading = true;
+    nextAfter = null;
     showLoading(true);
     
     const loadingTimeout = setTimeout(() => {
@@ -341,8 +349,8 @@ function loadObjects(resetPage = false) {
     }, 15000);
     
     const params = new URLSearchParams({
-        page: currentPage,
-        per_page: pageSize,
+        after: '',
+        per_page: keysetBatchSize(),
         sort_by: mapSortField(sortBy),
         sort_order: sortOrder,
         search: currentFilters.search || '',
@@ -369,30 +377,13 @@ function loadObjects(resetPage = false) {
         .then(data => {
             clearTimeout(loadingTimeout);
             
-            const objects = data.objects || [];
-            const mappedObjects = objects.map(obj => ({
-                name: (obj.name_prefix || '') + obj.name,
-                type: obj.type || 'AT',
-                classification: obj.type || 'AT',
-                discovery_date: obj.discoverydate || '',
-                tag: obj.tag || 'object',
-                magnitude: obj.discoverymag || '',
-                redshift: obj.redshift || '',
-                ra: obj.ra || '',
-                dec: obj.declination || '',
-                source: obj.source_group || '',
-                last_update: obj.time_received || obj.lastmodified || '',
-                lastmodified: obj.lastmodified || '',
-                last_photometry: obj.last_photometry_date || '',
-                brightest_mag: obj.brightest_mag || '',
-                brightest_abs_mag: obj.brightest_abs_mag || '',
-                internal_names: obj.internal_names || ''
-            }));
+            const mappedObjects = (data.objects || []).map(mapApiObject);
             
             currentObjects = mappedObjects;
             filteredObjects = mappedObjects;
             totalObjects = data.total || 0;
-            totalPages = data.total_pages || Math.ceil((data.total || 0) / pageSize) || 1;
+            totalPages = 1;
+            nextAfter = data.next_after || null;
             
             // CRITICAL FIX: Never update counters from filtered API response
             // Always use a separate stats API call to ensure counters reflect total database state
@@ -429,6 +420,7 @@ function loadObjects(resetPage = false) {
             } else {
                 currentObjects = [];
                 filteredObjects = [];
+                nextAfter = null;
                 refreshCurrentView();
                 updatePagination();
             }
@@ -436,9 +428,128 @@ function loadObjects(resetPage = false) {
         .finally(() => {
             isLoading = false;
             showLoading(false);
+            checkInfiniteScrollSentinel();
         });
 }
 
+function mapApiObject(obj) {
+    return {
+        name: (obj.name_prefix || '') + obj.name,
+        type: obj.type || 'AT',
+        classification: obj.type || 'AT',
+        discovery_date: obj.discoverydate || '',
+        tag: obj.tag || 'object',
+        magnitude: obj.discoverymag || '',
+        redshift: obj.redshift || '',
+        ra: obj.ra || '',
+        dec: obj.declination || '',
+        source: obj.source_group || '',
+        last_update: obj.time_received || obj.lastmodified || '',
+        lastmodified: obj.lastmodified || '',
+        last_photometry: obj.last_photometry_date || '',
+        brightest_mag: obj.brightest_mag || '',
+        brightest_abs_mag: obj.brightest_abs_mag || '',
+        internal_names: obj.internal_names || ''
+    };
+}
+
+function keysetBatchSize() {
+    const size = parseInt(pageSize);
+    return Number.isFinite(size) ? Math.min(size, INFINITE_SCROLL_BATCH_MAX) : INFINITE_SCROLL_BATCH_MAX;
+}
+
+// Append the next keyset batch to the current list.  The request repeats the
+// current filters and sort; the server seeks past the last row it returned,
+// so batch N costs the same as batch 1.
+function loadMoreObjects() {
+    if (isLoading || isLoadingMore || !useApiMode || !nextAfter) return;
+    
+    isLoadingMore = true;
+    const sentinel = document.getElementById('infiniteScrollSentinel');
+    if (sentinel) sentinel.classList.add('loading');
+    
+    const params = new URLSearchParams({
+        after: nextAfter,
+        per_page: keysetBatchSize(),
+        sort_by: mapSortField(sortBy),
+        sort_order: sortOrder,
+        search: currentFilters.search || '',
+        classification: currentFilters.classification || '',
+        tag: currentFilters.tag || '',
+        date_from: currentFilters.date_from || '',
+        date_to: currentFilters.date_to || '',
+        app_mag_min: currentFilters.app_mag_min || '',
+        app_mag_max: currentFilters.app_mag_max || '',
+        redshift_min: currentFilters.redshift_min || '',
+        redshift_max: currentFilters.redshift_max || '',
+        discoverer: currentFilters.discoverer || ''
+    });
+    const requestedAfter = nextAfter;
+    
+    fetch(`/api/objects?${params.toString()}`)
+        .then(response => {
+            if (!response.ok) throw new Error(`Server error: ${response.status}`);
+            return response.json();
+        })
+        .then(data => {
+            // A filter/sort change reloaded the list while this was in flight.
+            if (requestedAfter !== nextAfter) return;
+            
+            const mappedObjects = (data.objects || []).map(mapApiObject);
+            currentObjects = currentObjects.concat(mappedObjects);
+            filteredObjects = currentObjects;
+            nextAfter = data.next_after || null;
+            
+            appendToCurrentView(mappedObjects);
+            updatePagination();
+        })
+        .catch(error => {
+            if (requestedAfter !== nextAfter) return;
+            console.error('API error:', error);
+            showNotification(`Loading error: ${error.message}`, 'error');
+            nextAfter = null;
+            updatePagination();
+        })
+        .finally(() => {
+            isLoadingMore = false;
+            if (sentinel) sentinel.classList.remove('loading');
+            checkInfiniteScrollSentinel();
+        });
+}
+
+function setupInfiniteScroll() {
+    if (scrollObserver || !('IntersectionObserver' in window)) return;
+    
+    let sentinel = document.getElementById('infiniteScrollSentinel');
+    if (!sentinel) {
+        sentinel = document.createElement('div');
+        sentinel.id = 'infiniteScrollSentinel';
+        sentinel.className = 'infinite-scroll-sentinel';
+        const anchor = document.querySelector('.bottom-pagination');
+        if (anchor && anchor.parentNode) {
+            anchor.parentNode.insertBefore(sentinel, anchor);
+        } else {
+            return;
+        }
+    }
+    
+    scrollObserver = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) loadMoreObjects();
+    }, { rootMargin: '600px 0px' });
+    scrollObserver.observe(sentinel);
+}
+
+// The observer only fires on transitions; if a short batch leaves the
+// sentinel on screen, keep pulling until it scrolls out of view.
+function checkInfiniteScrollSentinel() {
+    const sentinel = document.getElementById('infiniteScrollSentinel');
+    if (!sentinel || !nextAfter || !useApiMode) return;
+    const rect = sentinel.getBoundingClientRect();
+    if (rect.top < window.innerHeight + 600) {
+        setTimeout(loadMoreObjects, 0);
+    }
+}
+
 function hasActiveFilters() {
     return Object.values(currentFilters).some(val => val !== '') || currentStatusFilter !== '';
 }
@@ -454,7 +565,8 @@ function mapSortField(frontendField) {
         'last_update': 'lastmodified',
         'last_photometry': 'last_photometry_date',
         'brightest_mag': 'brightest_mag',
-        'brightest_abs_mag': 'brightest_abs_mag'
+        'brightest_abs_mag': 'brightest_abs_mag',
+        'relevance': 'relevance'
     };
     
     return fieldMap[frontendField] || 'discoverydate';
@@ -514,15 +626,15 @@ function switchView(viewType) {
     updatePagination();
 }
 
-function generateTableView() {
+function generateTableView(appendObjects = null) {
     const tableBody = document.getElementById('tableBody');
-    tableBody.innerHTML = '';
+    if (!appendObjects) tableBody.innerHTML = '';
     
-    const objectsToShow = useApiMode ? filteredObjects : (() => {
+    const objectsToShow = appendObjects || (useApiMode ? filteredObjects : (() => {
         const startIndex = (currentPage - 1) * pageSize;
         const endIndex = pageSize === 'all' ? filteredObjects.length : startIndex + parseInt(pageSize);
         return filteredObjects.slice(startIndex, endIndex);
-    })();
+    })());
     
     objectsToShow.forEach(obj => {
         const row = document.createElement('tr');
@@ -575,15 +687,15 @@ function generateTableView() {
     });
 }
 
-function generateCompactView() {
+function generateCompactView(appendObjects = null) {
     const compactContainer = document.getElementById('compactView');
-    compactContainer.innerHTML = '';
+    if (!appendObjects) compactContainer.innerHTML = '';
     
-    const objectsToShow = useApiMode ? filteredObjects : (() => {
+    const objectsToShow = appendObjects || (useApiMode ? filteredObjects : (() => {
         const startIndex = (currentPage - 1) * pageSize;
         const endIndex = pageSize === 'all' ? filteredObjects.length : startIndex + parseInt(pageSize);
         return filteredObjects.slice(startIndex, endIndex);
-    })();
+    })());
     
     objectsToShow.forEach(obj => {
         const item = document.createElement('div');
@@ -625,7 +737,7 @@ function generateCompactView() {
     });
 }
 
-function generateCardsView() {
+function generateCardsView(appendObjects = null) {
     const cardsContainer = document.getElementById('cardsView');
     
     if (!useApiMode) {
@@ -633,13 +745,14 @@ function generateCardsView() {
         return;
     }
     
-    cardsContainer.innerHTML = '';
+    if (!appendObjects) cardsContainer.innerHTML = '';
     
-    if (filteredObjects.length === 0) {
+    const objectsToShow = appendObjects || filteredObjects;
+    if (objectsToShow.length === 0) {
         return;
     }
     
-    filteredObjects.forEach(obj => {
+    objectsToShow.forEach(obj => {
         const card = document.createElement('div');
         card.className = 'object-card';
         card.dataset.tag = obj.tag;
@@ -950,6 +1063,21 @@ function updateCountersFromStats(stats) {
 }
 
 function updatePagination() {
+    if (useApiMode) {
+        // Infinite scroll: no page buttons, just how much has been loaded.
+        const loaded = currentObjects.length;
+        const more = nextAfter ? ' (scroll for more)' : '';
+        const infoText = `Showing ${loaded ? 1 : 0}-${loaded} of ${totalObjects} objects${more}`;
+        const topInfo = document.getElementById('topPaginationInfo');
+        const bottomInfo = document.getElementById('paginationInfo');
+        if (topInfo) topInfo.textContent = infoText;
+        if (bottomInfo) bottomInfo.textContent = infoText;
+        updatePaginationControls('topPaginationControls', 1);
+        updatePaginationControls('paginationControls', 1);
+        syncPageSizeSelectors();
+        return;
+    }
+    
     const totalObjectsCount = useApiMode ? totalObjects : filteredObjects.length;
     const totalPagesCount = pageSize === 'all' ? 1 : Math.ceil(totalObjectsCount / pageSize);
     
@@ -1171,6 +1299,17 @@ function refreshCurrentView() {
     }
 }
 
+function appendToCurrentView(objects) {
+    if (!objects.length) return;
+    if (currentView === 'cards') {
+        generateCardsView(objects);
+    } else if (currentView === 'table') {
+        generateTableView(objects);
+    } else if (currentView === 'compact') {
+        generateCompactView(objects);
+    }
+}
+
 function filterCardsView() {
     const allCards = document.querySelectorAll('#cardsView .object-card');
     const startIndex = (currentPage - 1) * pageSize;
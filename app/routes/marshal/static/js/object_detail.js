@@ -992,7 +992,7 @@ function enforceMinLcXAxisSpan(figData, minSpanDays = 1) {
     const dateXMs = [];
 
     figData.data.forEach(trace => {
-        if (!trace || !Array.isArray(trace.x)) return;
+        if (!trace || !(Array.isArray(trace.x) || ArrayBuffer.isView(trace.x))) return;
 
         trace.x.forEach(value => {
             if (typeof value === 'number' && Number.isFinite(value)) {
@@ -1082,6 +1082,150 @@ function fetchJsonWithTimeout(url, timeoutMs = PHOTOMETRY_FETCH_TIMEOUT_MS, opti
         .finally(() => clearTimeout(timerId));
 }
 
+// ── Binary plot frames (?format=f32) ────────────────────────────────────────
+// Layout: 'KPF1' | uint32 header length | header JSON | pad to 8 | column buffers.
+// Numeric trace arrays arrive as raw little-endian buffers and are wrapped in
+// typed-array views (no number parsing); {"$col": i} markers in the figure
+// JSON point at header.columns[i]. See modules/plot_transport.py.
+const PLOT_FRAME_MIMETYPE = 'application/vnd.kinder.plotframe';
+
+function decodePlotFrame(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if (magic !== 'KPF1') throw new Error('Not a plot frame');
+    const headerLen = view.getUint32(4, true);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLen)));
+    const base = Math.ceil((8 + headerLen) / 8) * 8;
+    const ctors = { f4: Float32Array, f8: Float64Array, u1: Uint8Array };
+
+    const column = (idx) => {
+        const col = header.columns[idx];
+        const arr = new ctors[col.dtype](buffer, base + col.offset, col.length);
+        if (!col.shape) return arr;
+        const [rows, width] = col.shape;
+        const out = new Array(rows);
+        for (let r = 0; r < rows; r++) out[r] = arr.subarray(r * width, (r + 1) * width);
+        return out;
+    };
+    const hydrate = (node) => {
+        if (Array.isArray(node)) return node.map(hydrate);
+        if (node && typeof node === 'object') {
+            if (typeof node.$col === 'number') return column(node.$col);
+            for (const k of Object.keys(node)) node[k] = hydrate(node[k]);
+        }
+        return node;
+    };
+    const figure = header.figure || {};
+    figure.data = hydrate(figure.data || []);
+    return Object.assign({}, header.meta || {}, { figure });
+}
+
+// Like fetchJsonWithTimeout, but decodes a binary plot frame when the server
+// answers with one (falls back to JSON, e.g. for "no data" replies).
+function fetchPlotWithTimeout(url, timeoutMs = PHOTOMETRY_FETCH_TIMEOUT_MS) {
+    const controller = new AbortController();
+    const timerId = setTimeout(() => controller.abort(), timeoutMs);
+
+    return fetch(url, { signal: controller.signal })
+        .then(async response => {
+            const type = response.headers.get('Content-Type') || '';
+            if (response.ok && type.startsWith(PLOT_FRAME_MIMETYPE)) {
+                return decodePlotFrame(await response.arrayBuffer());
+            }
+            let body = null;
+            try {
+                body = await response.json();
+            } catch (_) {
+                body = null;
+            }
+            if (!response.ok) {
+                const err = new Error((body && body.error) ? body.error : `HTTP ${response.status}`);
+                err.status = response.status;
+                throw err;
+            }
+            return body;
+        })
+        .finally(() => clearTimeout(timerId));
+}
+
+// ── Level-of-detail (LOD) refresh on zoom ──────────────────────────────────
+// Plot routes accept width=<px> and a data window (wmin/wmax Å for spectra,
+// mjd_min/mjd_max for light curves) and return an M4-downsampled selection.
+// When the user zooms, the visible window is re-requested at full resolution
+// and the matching traces are restyled in place (layout / zoom untouched).
+function _lodPlotWidth(el) {
+    const w = Math.round((el && el.clientWidth) || 800);
+    return Math.min(Math.max(w, 100), 8000);
+}
+
+function _lodAttach(plotDiv, buildUrl, dataExtent) {
+    let loaded = null;          // window currently loaded; null = full extent
+    let timer = null;
+    let seq = 0;
+
+    plotDiv.on('plotly_relayout', ev => {
+        let lo, hi;
+        if (ev['xaxis.autorange']) {
+            lo = hi = null;
+        } else if (ev['xaxis.range[0]'] !== undefined) {
+            lo = parseFloat(ev['xaxis.range[0]']);
+            hi = parseFloat(ev['xaxis.range[1]']);
+        } else if (Array.isArray(ev['xaxis.range'])) {
+            lo = parseFloat(ev['xaxis.range'][0]);
+            hi = parseFloat(ev['xaxis.range'][1]);
+        } else {
+            return;
+        }
+        let target = (lo == null || isNaN(lo) || isNaN(hi)) ? null : [Math.min(lo, hi), Math.max(lo, hi)];
+        if (target && dataExtent && target[0] <= dataExtent[0] && target[1] >= dataExtent[1]) target = null;
+        if (target === null && loaded === null) return;
+
+        clearTimeout(timer);
+        timer = setTimeout(() => {
+            const mySeq = ++seq;
+            fetchPlotWithTimeout(buildUrl(target, _lodPlotWidth(plotDiv)))
+                .then(data => {
+                    if (mySeq !== seq || !data || !data.figure) return;
+                    _lodRestyle(plotDiv, data.figure.data);
+                    loaded = target;
+                })
+                .catch(err => console.warn('LOD refresh failed:', err));
+        }, 250);
+    });
+}
+
+function _lodRestyle(plotDiv, traces) {
+    const byName = new Map();
+    traces.forEach((t, i) => byName.set(t.name || `#${i}`, t));
+    const current = plotDiv.data || [];
+    const idx = [], xs = [], ys = [], cds = [], errs = [];
+    current.forEach((t, i) => {
+        const fresh = byName.get(t.name || `#${i}`);
+        if (!fresh) return;   // client-side overlays (KN model, lines) stay as-is
+        idx.push(i);
+        xs.push(fresh.x);
+        ys.push(fresh.y);
+        cds.push(fresh.customdata !== undefined ? fresh.customdata : t.customdata);
+        errs.push(fresh.error_y && fresh.error_y.array !== undefined ? fresh.error_y.array : (t.error_y ? t.error_y.array : undefined));
+    });
+    if (!idx.length) return;
+    Plotly.restyle(plotDiv, { x: xs, y: ys, customdata: cds, 'error_y.array': errs }, idx);
+}
+
+function _figureXExtent(traces) {
+    let lo = Infinity, hi = -Infinity;
+    (traces || []).forEach(t => {
+        if (!t || !t.x || !t.x.length) return;
+        for (let i = 0; i < t.x.length; i++) {
+            const v = t.x[i];
+            if (typeof v !== 'number' || !Number.isFinite(v)) continue;
+            if (v < lo) lo = v;
+            if (v > hi) hi = v;
+        }
+    });
+    return Number.isFinite(lo) ? [lo, hi] : null;
+}
+
 // Photometry plot loading with improved loading states
 function loadPhotometryPlot() {
     if (!cleanObjectName) return Promise.resolve();
@@ -1099,10 +1243,11 @@ function loadPhotometryPlot() {
     
     const applyExtinction = document.getElementById('applyExtinction')?.checked ?? false;
     const applyKCorr = document.getElementById('applyKCorr')?.checked ?? false;
+    const photPlotUrl = `/api/object/${encodeURIComponent(cleanObjectName)}/photometry/plot?extinction=${applyExtinction}&k_corr=${applyKCorr}&format=f32`;
 
     // Load both plot and raw data
     return Promise.all([
-        fetchJsonWithTimeout(`/api/object/${encodeURIComponent(cleanObjectName)}/photometry/plot?extinction=${applyExtinction}&k_corr=${applyKCorr}`),
+        fetchPlotWithTimeout(`${photPlotUrl}&width=${_lodPlotWidth(photometryContainer)}`),
         fetchJsonWithTimeout(`/api/object/${encodeURIComponent(cleanObjectName)}/photometry`)
     ]).then(([plotData, rawData]) => {
         console.log('Plot data:', plotData);
@@ -1197,10 +1342,10 @@ function loadPhotometryPlot() {
         // Display plot
         if (plotData.success) {
             if (photometryContainer) {
-                if (plotData.plot_json) {
+                if (plotData.figure || plotData.plot_json) {
                     photometryContainer.innerHTML = '<div id="phot-plotly-div" style="width:100%; height:450px;"></div>';
                     try {
-                        const figData = JSON.parse(plotData.plot_json);
+                        const figData = plotData.figure || JSON.parse(plotData.plot_json);
                         // Override template to match page dark theme
                         if (figData.layout) {
                             figData.layout.paper_bgcolor = 'rgba(0,0,0,0)';
@@ -1211,7 +1356,13 @@ function loadPhotometryPlot() {
                             figData.layout.margin = Object.assign(figData.layout.margin || {}, { t: 45 });
                         }
                         enforceMinLcXAxisSpan(figData, 1);
+                        const photExtent = _figureXExtent(figData.data);
                         Plotly.newPlot('phot-plotly-div', figData.data, figData.layout, {responsive: true});
+                        _lodAttach(document.getElementById('phot-plotly-div'), (win, width) => {
+                            let url = `${photPlotUrl}&width=${width}`;
+                            if (win) url += `&mjd_min=${win[0]}&mjd_max=${win[1]}`;
+                            return url;
+                        }, photExtent);
                         _buildTelescopeToggles(figData.data);
                         _buildFilterLegend(figData.data);
 
@@ -2774,18 +2925,45 @@ function loadSpectrumPlot() {
     if (rest_frame) params.set('rest_frame', '1');
     if (normalise)  params.set('normalise', '1');
     if (stack)      params.set('stack', '1');
-    const apiUrl = `/api/object/${encodeURIComponent(cleanObjectName)}/spectrum/plot${params.toString() ? '?' + params.toString() : ''}`;
+    params.set('format', 'f32');
+    const specBaseUrl = `/api/object/${encodeURIComponent(cleanObjectName)}/spectrum/plot?${params.toString()}`;
+    const apiUrl = `${specBaseUrl}&width=${_lodPlotWidth(spectrumContainer)}`;
     console.log('API URL:', apiUrl);
     
-    return fetch(apiUrl)
-        .then(response => response.json())
+    return fetchPlotWithTimeout(apiUrl)
         .then(data => {
             // Hide loading
             if (loadingDiv) loadingDiv.style.display = 'none';
             
             if (data.success) {
                 if (spectrumContainer) {
-                    if (data.plot_html) {
+                    if (data.figure) {
+                        spectrumContainer.innerHTML = '<div class="plotly-graph-div" style="height:100%; width:100%;"></div>';
+                        try {
+                            const plotDiv = spectrumContainer.querySelector('.plotly-graph-div');
+                            const specExtent = _figureXExtent(data.figure.data);
+                            Plotly.newPlot(plotDiv, data.figure.data, data.figure.layout, { responsive: true })
+                                .then(() => {
+                                    _lodAttach(plotDiv, (win, width) => {
+                                        let url = `${specBaseUrl}&width=${width}`;
+                                        if (win) url += `&wmin=${Math.max(win[0], 0)}&wmax=${Math.max(win[1], 0)}`;
+                                        return url;
+                                    }, specExtent);
+                                    _initSpecRedshiftInput();
+                                    if (_specActiveKeys.size > 0 || _specTelActive) _applySpecLines();
+                                    _initSpecWaveRange();
+                                    _fetchNistSpecLines();
+                                });
+                        } catch (error) {
+                            console.error('Error rendering spectrum plot:', error);
+                            spectrumContainer.innerHTML = `
+                                <div class="no-data">
+                                    <span class="no-data-icon">${ICONS.error}</span>
+                                    <span class="no-data-text">Error rendering spectrum plot</span>
+                                </div>
+                            `;
+                        }
+                    } else if (data.plot_html) {
                         console.log('Inserting spectrum plot HTML into container...');
                         
                         spectrumContainer.innerHTML = data.plot_html;
@@ -11,11 +11,13 @@ from datetime import datetime, timezone
 from flask import request, jsonify, session
 
 from modules.database.transient import (
-    get_tns_statistics, get_objects_count, search_tns_objects,
-    get_tag_statistics, get_filtered_stats, get_distinct_classifications,
+    get_tns_statistics, search_tns_objects,
+    search_tns_objects_after, search_objects_page, SEARCH_MODES,
+    get_marshal_overview_stats, get_distinct_classifications,
     update_object_status, update_object_activity, get_auto_snooze_stats,
     get_object_flag_status, update_object_flag_by_name,
-    get_object_pin_status, toggle_object_pin
+    get_object_pin_status, toggle_object_pin, refresh_detect_daily_counts,
+    get_facet_counts, apply_bulk_object_mutations,
 )
 from modules.database import get_db_connection, get_tns_db_connection, OBJECT_COMPAT_COLS
 from modules.request_validation import get_int_arg, get_float_arg, ParamOutOfRangeError
@@ -458,7 +460,11 @@ def trigger_detect_cross_match(object_name):
         if force:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("DELETE FROM transient.cross_matches WHERE obj_id = %s", (obj_id,))
+                    cur.execute(
+                        "DELETE FROM transient.cross_matches WHERE obj_id = %s RETURNING match_date",
+                        (obj_id,)
+                    )
+                    refresh_detect_daily_counts(cur, {r[0] for r in cur.fetchall()})
                     conn.commit()
 
         # Execute cross match
@@ -563,9 +569,6 @@ def generate_detect_images(object_name):
         # Read match_ra / match_dec directly — these are explicit columns set when saving
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Ensure columns exist (in case of old schema)
-                cur.execute("ALTER TABLE transient.cross_matches ADD COLUMN IF NOT EXISTS match_ra  DOUBLE PRECISION")
-                cur.execute("ALTER TABLE transient.cross_matches ADD COLUMN IF NOT EXISTS match_dec DOUBLE PRECISION")
                 cur.execute(
                     "SELECT catalog AS catalog_name, separation, redshift, match_ra, match_dec "
                     "FROM transient.cross_matches "
@@ -600,9 +603,6 @@ def generate_detect_images(object_name):
             logger.info('generate_detect_images: match_ra/dec all NULL, trying match_data JSON: %s', canonical_name)
             with get_db_connection() as conn2:
                 with conn2.cursor(cursor_factory=RealDictCursor) as cur2:
-                    cur2.execute(
-                        "ALTER TABLE transient.cross_matches ADD COLUMN IF NOT EXISTS match_data JSONB"
-                    )
                     cur2.execute(
                         "SELECT catalog AS catalog_name, separation, redshift, match_data "
                         "FROM transient.cross_matches "
@@ -866,21 +866,17 @@ def api_get_stats():
         }})
     
     try:
-        total_count = get_objects_count()
-        at_count = get_objects_count(object_type='AT')
-        classified_count = total_count - at_count
-        
-        tag_stats = get_tag_statistics()
+        overview = get_marshal_overview_stats()
         
         stats = {
-            'inbox_count': tag_stats.get('object', 0),
-            'followup_count': tag_stats.get('followup', 0),
-            'finished_count': tag_stats.get('finished', 0),
-            'snoozed_count': tag_stats.get('snoozed', 0),
-            'flag_count': tag_stats.get('flag', 0),
-            'at_count': at_count,
-            'classified_count': classified_count,
-            'total_count': total_count
+            'inbox_count': overview['inbox_count'],
+            'followup_count': overview['followup_count'],
+            'finished_count': overview['finished_count'],
+            'snoozed_count': overview['snoozed_count'],
+            'flag_count': overview['flag_count'],
+            'at_count': overview['at_count'],
+            'classified_count': overview['classified_count'],
+            'total_count': overview['total_count']
         }
         
         return jsonify({
@@ -928,73 +924,89 @@ def fetch_photometry(object_name):
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _api_get_objects_after(after, per_page, sort_by, sort_order, **filters):
+    """Keyset page of /api/objects.  The first page (empty token) comes with
+    the total and status counts from the combined listing query; follow-up
+    pages only seek and append."""
+    try:
+        if not after:
+            listing = search_objects_page(
+                limit=per_page, offset=0,
+                sort_by=sort_by, sort_order=sort_order, **filters
+            )
+            return jsonify({
+                'objects': listing['objects'],
+                'next_after': listing['next_after'],
+                'per_page': per_page,
+                'total': listing['total'],
+                'stats': listing['stats'],
+            })
+        objects, next_after = search_tns_objects_after(
+            limit=per_page, after=after,
+            sort_by=sort_by, sort_order=sort_order, **filters
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        logger.error("API error: %s", e)
+        return jsonify({'success': False, 'error': str(e),
+                        'objects': [], 'next_after': None}), 500
+
+    return jsonify({
+        'objects': objects,
+        'next_after': next_after,
+        'per_page': per_page,
+    })
+
+
+def _object_filter_args() -> dict:
+    """Marshal filter query arguments as search_objects_page / _build_where
+    keywords."""
+    search_mode = request.args.get('search_mode', 'contains')
+    if search_mode not in SEARCH_MODES:
+        search_mode = 'contains'
+    return {
+        'search_term':  request.args.get('search', ''),
+        'object_type':  request.args.get('classification', ''),
+        'tag':          request.args.get('tag', ''),
+        # Optional parameters that might be empty strings
+        'date_from':    request.args.get('date_from', '') or None,
+        'date_to':      request.args.get('date_to', '') or None,
+        'app_mag_min':  get_float_arg('app_mag_min'),
+        'app_mag_max':  get_float_arg('app_mag_max'),
+        'redshift_min': get_float_arg('redshift_min'),
+        'redshift_max': get_float_arg('redshift_max'),
+        'discoverer':   request.args.get('discoverer', ''),
+        'search_mode':  search_mode,
+    }
+
+
 @web_api_bp.route('/api/objects')
 def api_get_objects():
     page = get_int_arg('page', 1, min_val=1)
     per_page = get_int_arg('per_page', 50, min_val=1, max_val=500)
     sort_by = request.args.get('sort_by', 'discoverydate')
     sort_order = request.args.get('sort_order', 'desc')
-    search = request.args.get('search', '')
-    classification = request.args.get('classification', '')
-    tag = request.args.get('tag', '')
-
-    # Handle optional parameters that might be empty strings
-    date_from = request.args.get('date_from', '')
-    date_from = date_from if date_from else None
-
-    date_to = request.args.get('date_to', '')
-    date_to = date_to if date_to else None
-
-    app_mag_min = get_float_arg('app_mag_min')
-    app_mag_max = get_float_arg('app_mag_max')
-    redshift_min = get_float_arg('redshift_min')
-    redshift_max = get_float_arg('redshift_max')
+    filters = _object_filter_args()
 
-    discoverer = request.args.get('discoverer', '')
+    # Keyset mode: any request carrying ``after`` (empty for the first page)
+    # is served by seeking on (sort key, obj_id) instead of OFFSET.
+    if 'after' in request.args:
+        return _api_get_objects_after(
+            request.args.get('after', ''), per_page, sort_by, sort_order, **filters
+        )
 
     try:
-        objects = search_tns_objects(
-            search_term=search, 
-            object_type=classification,
-            limit=per_page, 
+        listing = search_objects_page(
+            limit=per_page,
             offset=(page-1)*per_page,
-            sort_by=sort_by, 
+            sort_by=sort_by,
             sort_order=sort_order,
-            date_from=date_from,
-            date_to=date_to,
-            tag=tag,
-            app_mag_min=app_mag_min,
-            app_mag_max=app_mag_max,
-            redshift_min=redshift_min,
-            redshift_max=redshift_max,
-            discoverer=discoverer
-        )
-        
-        total = get_objects_count(
-            search_term=search, 
-            object_type=classification,
-            tag=tag,
-            date_from=date_from,
-            date_to=date_to,
-            app_mag_min=app_mag_min,
-            app_mag_max=app_mag_max,
-            redshift_min=redshift_min,
-            redshift_max=redshift_max,
-            discoverer=discoverer
-        )
-        
-        stats = get_filtered_stats(
-            search_term=search, 
-            object_type=classification,
-            tag=tag,
-            date_from=date_from,
-            date_to=date_to,
-            app_mag_min=app_mag_min,
-            app_mag_max=app_mag_max,
-            redshift_min=redshift_min,
-            redshift_max=redshift_max,
-            discoverer=discoverer
+            **filters
         )
+        objects = listing['objects']
+        total = listing['total']
+        stats = listing['stats']
         
         return jsonify({
             'objects': objects,
@@ -1023,6 +1035,43 @@ def api_get_objects():
             'error': str(e)
         }), 500
 
+@web_api_bp.route('/api/marshal/facets')
+def api_get_object_facets():
+    """Sidebar counts per status, tag, group, classification and discovery
+    year for the current marshal filter.  ``facets`` limits the response to
+    a comma-separated subset."""
+    if 'user' not in session:
+        return jsonify({'success': False, 'error': 'Access denied'}), 403
+
+    facets = [f.strip() for f in request.args.get('facets', '').split(',') if f.strip()]
+    try:
+        counts = get_facet_counts(facets or None, **_object_filter_args())
+    except Exception as e:
+        logger.error("Facets API error: %s", e)
+        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify({'success': True, 'total': counts.pop('total'), 'facets': counts})
+
+@web_api_bp.route('/api/marshal/bulk-update', methods=['POST'])
+def api_bulk_update_objects():
+    """Apply status / tag / group operations to many objects in one
+    transaction.  Body: {"object_names": [...], "operations": [...]}; see
+    apply_bulk_object_mutations for the operation format."""
+    if 'user' not in session or not session['user'].get('is_admin'):
+        return jsonify({'error': 'Access denied'}), 403
+
+    data = request.get_json(silent=True) or {}
+    try:
+        result = apply_bulk_object_mutations(
+            data.get('object_names'), data.get('operations'),
+            actor=session['user'].get('email', '')
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        logger.error("Bulk update API error: %s", e)
+        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify({'success': True, **result})
+
 @web_api_bp.route('/api/object-tags', methods=['POST'])
 def api_get_object_tags():
     if 'user' not in session: